@@ -17,12 +17,32 @@ from bs4 import BeautifulSoup
 import folium
 from streamlit_folium import st_folium
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import json
 from typing import Dict, List, Tuple, Optional
 import hashlib
 
+from src.career_mining import CareerPathMiner, mined_career_paths
+from src.career_model import CompiledCareerModel
+from src.cohort_benchmark import CohortBenchmark, top_percent_label
+from src.figure_cache import figure_cache
+from src.figure_transport import figure_transport
+from src.itemset_mining import ALL as ALL_CATEGORIES, SkillBundleMiner
+from src.lsh_index import LSH_MIN_POSTINGS, LSHIndex
+from src.match_results import MatchRecord, MatchResultSet
+from src.matching_engine import AdvancedMatchingEngine
+from src.metrics import MetricsEngine, metrics_engines, normalize_filters
+from src.ranking import ranked_page
+from src.ranking_cache import GROWTH_PROFILE_FIELDS, canonical_skills, ranking_cache
+from src.similar_jobs import SimilarJobsTable
+from src.skill_canon import skill_canon
+from src.skill_graph import SkillGraph, SkillGraphBuilder
+from src.skill_taxonomy import skill_taxonomy
+from src.skill_whatif import SkillWhatIf
+from src.sketches import PartitionSketches, build_partition_sketches, merge_sketches
+from src.utils import dataset_version
+from src.visualizations import visualizer
+
 # ==============================================================================
 # 1. 페이지 및 환경 설정
 # ==============================================================================
@@ -262,6 +282,22 @@ class EnhancedSmartDataLoader:
             'DESIGN': 'rallit_design_jobs.csv',
             'DEVELOPER': 'rallit_developer_jobs.csv'
         }
+        # CSV(camelCase) 컬럼명 → DB 컬럼명 매핑
+        self.column_mapping = {
+            'addressregion': 'address_region',
+            'companyid': 'company_id',
+            'companyname': 'company_name',
+            'companyrepresentativeimage': 'company_representative_image',
+            'endedat': 'ended_at',
+            'isbookmarked': 'is_bookmarked',
+            'ispartner': 'is_partner',
+            'joblevel': 'job_level',
+            'joblevels': 'job_levels',
+            'jobskillkeywords': 'job_skill_keywords',
+            'joinreward': 'join_reward',
+            'partnerlogo': 'partner_logo',
+            'startedat': 'started_at',
+        }
         
     @st.cache_data(ttl=3600)  # 1시간 캐시
     def load_from_database(_self):
@@ -276,12 +312,21 @@ class EnhancedSmartDataLoader:
             
             # 데이터 타입 최적화
             df = _self._optimize_dataframes(df)
+            dataset_version(df)
             return df
             
         except Exception as e:
             logger.error(f"Database loading error: {e}")
             return _self._load_from_csv_fallback()
     
+    @st.cache_resource(ttl=3600)
+    def load_partition_sketches(_self) -> Dict[str, PartitionSketches]:
+        """직무 카테고리 파티션별 근사 통계 스케치 (적재 시 1회 생성, 조회 시 병합)"""
+        df = _self.load_from_database()
+        sketches = build_partition_sketches(df, 'job_category')
+        logger.info(f"Built sketches for {len(sketches)} partitions")
+        return sketches
+    
     def _optimize_dataframes(self, df):
         """데이터프레임 최적화"""
         # 수치형 컬럼 최적화
@@ -300,6 +345,10 @@ class EnhancedSmartDataLoader:
             if col in df.columns:
                 df[col] = df[col].astype('category')
         
+        # 요구 스킬을 정규 스킬 ID 로 등록 (적재 시 1회, 이후 비교는 문자열별로 캐시된 ID 배열 사용)
+        if 'job_skill_keywords' in df.columns:
+            skill_canon.parse_all(df['job_skill_keywords'])
+        
         return df
     
     def _load_from_csv_fallback(self):
@@ -318,10 +367,13 @@ class EnhancedSmartDataLoader:
             
             df = pd.concat(dfs, ignore_index=True)
             df.columns = [c.lower().replace(' ', '_').replace('.', '_') for c in df.columns]
+            df = df.rename(columns=self.column_mapping)
             
             # 추가 데이터 엔리치먼트
             df = self._enrich_data(df)
-            return self._optimize_dataframes(df)
+            df = self._optimize_dataframes(df)
+            dataset_version(df)
+            return df
             
         except Exception as e:
             logger.error(f"CSV loading error: {e}")
@@ -374,14 +426,7 @@ class EnhancedSmartDataLoader:
     
     def _generate_skills_by_category(self, category):
         """카테고리별 기술 스택 생성"""
-        skill_pools = {
-            'DEVELOPER': ['Python', 'Java', 'JavaScript', 'React', 'Vue.js', 'Node.js', 'Spring', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Git', 'Jenkins', 'TypeScript', 'Go', 'Kotlin'],
-            'DESIGN': ['Figma', 'Sketch', 'Adobe XD', 'Photoshop', 'Illustrator', 'Principle', 'Zeplin', 'InVision', 'Framer', 'After Effects', 'UI/UX', 'Prototyping', 'Wireframing', 'User Research'],
-            'MARKETING': ['Google Analytics', 'Facebook Ads', 'Google Ads', 'SEO', 'SEM', 'Content Marketing', 'Email Marketing', 'Social Media', 'Adobe Creative Suite', 'Hootsuite', 'Mailchimp', 'HubSpot', 'Salesforce'],
-            'MANAGEMENT': ['Agile', 'Scrum', 'Kanban', 'Jira', 'Confluence', 'Slack', 'Notion', 'Excel', 'PowerPoint', 'Project Management', 'Leadership', 'Team Building', 'Strategic Planning']
-        }
-        
-        skills = skill_pools.get(category, ['Communication', 'Teamwork', 'Problem Solving'])
+        skills = skill_taxonomy.sample_pool(category)
         selected_skills = random.sample(skills, min(random.randint(3, 8), len(skills)))
         return ', '.join(selected_skills)
     
@@ -424,189 +469,105 @@ class EnhancedSmartDataLoader:
                 'created_at': datetime.now() - timedelta(days=random.randint(0, 365))
             })
         
-        return pd.DataFrame(data)
+        df = pd.DataFrame(data)
+        dataset_version(df)
+        return df
 
-class AdvancedMatchingEngine:
-    """고도화된 AI 매칭 엔진"""
-    
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(stop_words='english', lowercase=True)
-        self.skill_weights = {
-            'python': 1.2, 'java': 1.1, 'javascript': 1.1, 'react': 1.15,
-            'aws': 1.2, 'docker': 1.1, 'kubernetes': 1.1, 'ai': 1.3, 'ml': 1.3,
-            'figma': 1.1, 'adobe': 1.0, 'google analytics': 1.1
-        }
-    
-    def calculate_advanced_skill_match(self, user_skills: List[str], job_requirements: str, 
-                                     job_category: str = None) -> Tuple[float, List[str], List[str], Dict]:
-        """고도화된 스킬 매칭 계산"""
-        if not user_skills or not job_requirements:
-            return 0, [], [], {}
-        
-        user_skills_clean = [s.strip().lower() for s in user_skills if s.strip()]
-        job_skills_clean = [s.strip().lower() for s in job_requirements.split(',') if s.strip()]
-        
-        if not job_skills_clean:
-            return 0, [], [], {}
-        
-        # 기본 매칭 계산
-        user_set = set(user_skills_clean)
-        job_set = set(job_skills_clean)
-        intersection = user_set.intersection(job_set)
-        missing = job_set - user_set
-        
-        # 가중치 적용 매칭 점수
-        weighted_score = 0
-        total_weight = 0
-        
-        for skill in job_skills_clean:
-            weight = self.skill_weights.get(skill, 1.0)
-            total_weight += weight
-            if skill in user_skills_clean:
-                weighted_score += weight
-        
-        match_score = (weighted_score / total_weight * 100) if total_weight > 0 else 0
-        
-        # 유사 스킬 매칭 (예: React ↔ Vue.js)
-        similar_matches = self._find_similar_skills(user_skills_clean, list(missing))
-        
-        # 카테고리별 보너스
-        category_bonus = self._calculate_category_bonus(user_skills_clean, job_category)
-        
-        final_score = min(match_score + category_bonus, 100)
-        
-        analysis = {
-            'basic_score': len(intersection) / len(job_set) * 100,
-            'weighted_score': match_score,
-            'category_bonus': category_bonus,
-            'similar_matches': similar_matches,
-            'total_required': len(job_set),
-            'matched_count': len(intersection)
-        }
-        
-        return final_score, list(intersection), list(missing), analysis
-    
-    def _find_similar_skills(self, user_skills: List[str], missing_skills: List[str]) -> List[Tuple[str, str]]:
-        """유사 스킬 찾기"""
-        similar_skills = {
-            'react': ['vue.js', 'angular', 'svelte'],
-            'vue.js': ['react', 'angular'],
-            'python': ['java', 'go', 'kotlin'],
-            'aws': ['gcp', 'azure'],
-            'mysql': ['postgresql', 'mongodb'],
-            'figma': ['sketch', 'adobe xd'],
-            'photoshop': ['illustrator', 'gimp']
-        }
-        
-        matches = []
-        for user_skill in user_skills:
-            for missing_skill in missing_skills:
-                if missing_skill in similar_skills.get(user_skill, []):
-                    matches.append((user_skill, missing_skill))
-        
-        return matches
-    
-    def _calculate_category_bonus(self, user_skills: List[str], job_category: str) -> float:
-        """카테고리별 보너스 점수 계산"""
-        if not job_category:
-            return 0
-        
-        category_skills = {
-            'DEVELOPER': ['python', 'java', 'javascript', 'react', 'docker', 'aws'],
-            'DESIGN': ['figma', 'sketch', 'photoshop', 'illustrator', 'ui/ux'],
-            'MARKETING': ['google analytics', 'facebook ads', 'seo', 'content marketing'],
-            'MANAGEMENT': ['agile', 'scrum', 'jira', 'leadership']
-        }
-        
-        relevant_skills = category_skills.get(job_category, [])
-        matching_relevant = sum(1 for skill in user_skills if skill in relevant_skills)
-        
-        return min(matching_relevant * 2, 10)  # 최대 10점 보너스
-    
-    def analyze_advanced_growth_potential(self, user_profile: Dict) -> Tuple[float, List[str], Dict]:
-        """고도화된 성장 잠재력 분석"""
-        score = 0
-        factors = []
-        detailed_analysis = {}
-        
-        # 학습 활동 점수 (0-25점)
-        recent_courses = user_profile.get('recent_courses', 0)
-        if recent_courses > 0:
-            learning_score = min(recent_courses * 5, 25)
-            score += learning_score
-            factors.append(f"적극적 학습 활동 ({recent_courses}개 강의)")
-            detailed_analysis['learning_score'] = learning_score
-        
-        # 프로젝트 경험 (0-30점)
-        project_count = user_profile.get('project_count', 0)
-        if project_count > 0:
-            project_score = min(project_count * 5, 30)
-            score += project_score
-            factors.append(f"실무 프로젝트 경험 ({project_count}개)")
-            detailed_analysis['project_score'] = project_score
-        
-        # 기술 다양성 (0-20점)
-        skills_count = len(user_profile.get('skills', []))
-        if skills_count > 0:
-            diversity_score = min(skills_count * 2, 20)
-            score += diversity_score
-            factors.append(f"기술 스택 다양성 ({skills_count}개)")
-            detailed_analysis['diversity_score'] = diversity_score
-        
-        # 오픈소스 기여 (0-15점)
-        github_contributions = user_profile.get('github_contributions', 0)
-        if github_contributions > 0:
-            oss_score = min(github_contributions / 10, 15)
-            score += oss_score
-            factors.append(f"오픈소스 기여 ({github_contributions}회)")
-            detailed_analysis['oss_score'] = oss_score
-        
-        # 최신 기술 트렌드 (0-10점)
-        modern_skills = ['ai', 'ml', 'kubernetes', 'react', 'typescript', 'go', 'rust']
-        user_skills_lower = [s.lower() for s in user_profile.get('skills', [])]
-        modern_count = sum(1 for skill in modern_skills if skill in user_skills_lower)
-        if modern_count > 0:
-            trend_score = min(modern_count * 2, 10)
-            score += trend_score
-            factors.append(f"최신 기술 트렌드 관심 ({modern_count}개)")
-            detailed_analysis['trend_score'] = trend_score
-        
-        final_score = min(score, 100)
-        detailed_analysis['total_score'] = final_score
-        
-        return final_score, factors, detailed_analysis
-    
-    def predict_advanced_success_probability(self, skill_score: float, growth_score: float, 
-                                           experience_match: bool = False, 
-                                           company_size_match: bool = False) -> Dict:
-        """고도화된 성공 확률 예측"""
-        base_probability = skill_score * 0.6 + growth_score * 0.3
-        
-        # 추가 요인들
-        experience_bonus = 5 if experience_match else 0
-        company_bonus = 3 if company_size_match else 0
-        
-        final_probability = min(base_probability + experience_bonus + company_bonus, 95)
-        
-        # 신뢰구간 계산
-        confidence = max(60, min(90, (skill_score + growth_score) / 2))
-        
-        return {
-            'probability': round(final_probability, 1),
-            'confidence': round(confidence, 1),
-            'factors': {
-                'skill_contribution': skill_score * 0.6,
-                'growth_contribution': growth_score * 0.3,
-                'experience_bonus': experience_bonus,
-                'company_bonus': company_bonus
-            }
-        }
+@st.cache_resource(max_entries=4)
+def get_metrics_engine(version: str, _df: pd.DataFrame) -> MetricsEngine:
+    """데이터셋 버전별 지표 엔진 (세션 간 공유)"""
+    return MetricsEngine(_df, version=version)
+
+@st.cache_resource(max_entries=2)
+def get_lsh_index(version: str, _df: pd.DataFrame) -> LSHIndex:
+    """스킬 집합 MinHash-LSH 인덱스 (데이터셋 버전별로 저장된 인덱스를 로드하거나 생성)"""
+    return LSHIndex.load_or_build(_df)
+
+@st.cache_resource(max_entries=2)
+def get_similar_jobs(version: str, _df: pd.DataFrame) -> Optional[SimilarJobsTable]:
+    """비슷한 공고 k-NN 테이블 (오프라인 `python -m src.similar_jobs` 결과를 읽기만 함, 없거나 오래되면 None)"""
+    table = SimilarJobsTable()
+    if not table.is_current(_df):
+        logger.warning("Similar jobs table is missing or stale; run `python -m src.similar_jobs`")
+        return None
+    return table
+
+@st.cache_resource(max_entries=2)
+def get_skill_graph(version: str, _df: pd.DataFrame) -> Optional[SkillGraph]:
+    """공고 동시 출현 기반 스킬 유사도 그래프 (오프라인 `python -m src.skill_graph` 결과를 읽기만 함)
+
+    그래프가 없으면 None - 매칭 엔진은 고정 유사 스킬 목록을 사용한다.
+    """
+    builder = SkillGraphBuilder()
+    if not builder.is_current(_df):
+        logger.warning("Skill graph is missing or stale; run `python -m src.skill_graph`")
+    return builder.load()
+
+@st.cache_resource(max_entries=2)
+def get_skill_whatif(version: str, _df: pd.DataFrame) -> SkillWhatIf:
+    """스킬 what-if 계산기 (데이터셋 버전별 공고 × 스킬 행렬 1회 생성)"""
+    return SkillWhatIf(_df)
+
+def next_best_skills(df: pd.DataFrame, user_profile: Dict, k: int = 10, min_score: float = 15) -> Dict:
+    """스킬 하나를 더 배웠을 때 새로 매칭되는 공고가 많은 순 (프로필별 결과는 랭킹 캐시에 공유)"""
+    version = dataset_version(df)
+    key = ('whatif', version, canonical_skills(user_profile['skills']), k, float(min_score), skill_taxonomy.version)
+    return ranking_cache.get_or_compute(
+        key, lambda: get_skill_whatif(version, df).evaluate(user_profile['skills'], min_score, k)
+    )
+
+@st.cache_resource(max_entries=2)
+def get_cohort_benchmark(version: str, taxonomy_version: int, _df: pd.DataFrame) -> CohortBenchmark:
+    """코호트 벤치마크 (데이터셋 버전·스킬 분류 체계 버전별로 가상 프로필 모집단 점수 정렬 배열 1회 생성)"""
+    return CohortBenchmark(_df)
+
+def cohort_percentiles(df: pd.DataFrame, user_profile: Dict, category: str, growth_score: float) -> Dict:
+    """사용자의 코호트(관심 직무 × 경력 구간) 백분위 (프로필별 결과는 랭킹 캐시에 공유)"""
+    version = dataset_version(df)
+    profile = {field: user_profile.get(field, 0) for field in GROWTH_PROFILE_FIELDS}
+    profile.update(skills=list(canonical_skills(user_profile['skills'])), job_category=category,
+                   experience_years=user_profile.get('experience_years'))
+    key = ('cohort', version, tuple(profile['skills']), float(growth_score), category,
+           profile['experience_years'], skill_taxonomy.version)
+    return ranking_cache.get_or_compute(
+        key, lambda: get_cohort_benchmark(version, skill_taxonomy.version, df)
+        .profile_percentiles([profile], [growth_score]).iloc[0].to_dict()
+    )
+
+@st.cache_resource(max_entries=4)
+def get_career_model(version: str, taxonomy_version: int, _df: pd.DataFrame) -> CompiledCareerModel:
+    """시장 데이터 기반 커리어 경로 모델 (오프라인 `python -m src.career_mining` 결과를 읽기만 함)
+
+    테이블이 없거나 데이터가 없는 단계는 스킬 분류 체계(taxonomy_version)의 기본 경로로 채운다.
+    """
+    miner = CareerPathMiner()
+    if not miner.is_current(_df):
+        logger.warning("Career path table is missing or stale; run `python -m src.career_mining`")
+    paths = mined_career_paths(miner.load_table(), skill_taxonomy.career_paths)
+    return CompiledCareerModel(paths)
+
+@st.cache_resource(max_entries=2)
+def get_skill_bundles(version: str, _df: pd.DataFrame) -> pd.DataFrame:
+    """함께 요구되는 스킬 조합 테이블 (오프라인 `python -m src.itemset_mining` 결과를 읽기만 함, 화면에서는 마이닝하지 않음)"""
+    miner = SkillBundleMiner()
+    if not miner.is_current(_df):
+        logger.warning("Skill bundle table is missing or stale; run `python -m src.itemset_mining`")
+    return miner.load_table()
 
 class TrendAnalyzer:
     """채용 트렌드 분석기"""
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, sketches: Optional[Dict[str, PartitionSketches]] = None):
         self.df = df
+        self.sketches = sketches
+        self._merged: Optional[PartitionSketches] = None
+    
+    @property
+    def merged_sketches(self) -> PartitionSketches:
+        """전체 파티션 스케치 병합 결과 (분석기당 1회 병합)"""
+        if self._merged is None:
+            self._merged = merge_sketches(self.sketches or {})
+        return self._merged
     
     def analyze_skill_trends(self) -> Dict:
         """기술 스택 트렌드 분석"""
@@ -714,15 +675,29 @@ class TrendAnalyzer:
         skills_series = df['job_skill_keywords'].dropna().str.split(',').explode().str.strip().str.lower()
         return skills_series[skills_series != ''].value_counts().to_dict()
     
-    def analyze_salary_trends(self) -> Dict:
+    def analyze_salary_trends(self, approximate: bool = False) -> Dict:
         """지원금/연봉 트렌드 분석"""
         if 'join_reward' not in self.df.columns:
             return {}
         
+        # 근사 모드: 파티션 스케치를 병합해 상수 시간으로 계산 (정확 계산과 같은 형태)
+        if approximate and self.sketches:
+            by_category = {name: sketch.reward_stats() for name, sketch in self.sketches.items()}
+            return {
+                'overall_stats': self.merged_sketches.reward_stats(),
+                'by_category': {
+                    'mean': {name: float(round(stats.get('mean', 0))) for name, stats in by_category.items()},
+                    'median': {name: float(round(stats.get('median', 0))) for name, stats in by_category.items()},
+                    'count': {name: sketch.reward_quantiles.n for name, sketch in self.sketches.items()}
+                },
+                'high_reward_jobs': self.merged_sketches.high_reward_jobs()
+            }
+        
         reward_stats = {
             'mean': self.df['join_reward'].mean(),
             'median': self.df['join_reward'].median(),
             'std': self.df['join_reward'].std(),
+            'max': self.df['join_reward'].max(),
             'percentiles': {
                 '25th': self.df['join_reward'].quantile(0.25),
                 '75th': self.df['join_reward'].quantile(0.75),
@@ -739,6 +714,25 @@ class TrendAnalyzer:
             'high_reward_jobs': self.df.nlargest(10, 'join_reward')[['title', 'company_name', 'join_reward']].to_dict('records')
         }
     
+    def analyze_market_concentration(self, approximate: bool = False, top_n: int = 10) -> Dict:
+        """고유 기업 수와 공고 수 상위 기업/언급 상위 기술 (근사 모드는 HyperLogLog·Count-Min 병합 결과)"""
+        if approximate and self.sketches:
+            merged = self.merged_sketches
+            return {
+                'unique_companies': merged.companies.count(),
+                'top_companies': merged.top_companies.heavy_hitters(top_n),
+                'top_skills': merged.top_skills.heavy_hitters(top_n)
+            }
+        
+        skills = self.df['job_skill_keywords'].dropna().astype(str).str.split(',').explode().str.strip() \
+            if 'job_skill_keywords' in self.df.columns else pd.Series(dtype=str)
+        companies = self.df['company_name'] if 'company_name' in self.df.columns else pd.Series(dtype=str)
+        return {
+            'unique_companies': int(companies.nunique()),
+            'top_companies': companies.value_counts().head(top_n).to_dict(),
+            'top_skills': skills[skills != ''].value_counts().head(top_n).to_dict()
+        }
+    
     def analyze_regional_trends(self) -> Dict:
         """지역별 채용 트렌드 분석"""
         regional_stats = self.df.groupby('address_region').agg({
@@ -757,90 +751,38 @@ class TrendAnalyzer:
 class GrowthPathGenerator:
     """개인 성장 경로 생성기"""
     
-    def __init__(self, df: pd.DataFrame):
+    _compiled_model: Optional[CompiledCareerModel] = None
+    _compiled_version: Optional[int] = None
+    
+    def __init__(self, df: pd.DataFrame, model: Optional[CompiledCareerModel] = None):
         self.df = df
-        self.career_paths = {
-            'DEVELOPER': {
-                'entry_level': ['HTML/CSS', 'JavaScript', 'Git', 'Basic Programming'],
-                'junior_level': ['React/Vue', 'Node.js', 'Database', 'API Development'],
-                'senior_level': ['System Architecture', 'DevOps', 'Cloud Services', 'Team Leadership'],
-                'lead_level': ['Technical Strategy', 'Mentoring', 'Project Management', 'Business Acumen']
-            },
-            'DESIGN': {
-                'entry_level': ['Figma/Sketch', 'Design Principles', 'Typography', 'Color Theory'],
-                'junior_level': ['UI/UX Design', 'Prototyping', 'User Research', 'Design Systems'],
-                'senior_level': ['Design Strategy', 'Team Collaboration', 'Business Understanding', 'Advanced Tools'],
-                'lead_level': ['Design Leadership', 'Strategy Planning', 'Team Management', 'Innovation']
-            },
-            'MARKETING': {
-                'entry_level': ['Digital Marketing Basics', 'Google Analytics', 'Content Writing', 'Social Media'],
-                'junior_level': ['SEO/SEM', 'Campaign Management', 'Data Analysis', 'Marketing Automation'],
-                'senior_level': ['Marketing Strategy', 'ROI Analysis', 'Team Leadership', 'Cross-channel Integration'],
-                'lead_level': ['Strategic Planning', 'Budget Management', 'Team Development', 'Innovation']
-            },
-            'MANAGEMENT': {
-                'entry_level': ['Project Coordination', 'Basic Analytics', 'Communication', 'Time Management'],
-                'junior_level': ['Project Management', 'Team Coordination', 'Process Improvement', 'Stakeholder Management'],
-                'senior_level': ['Strategic Planning', 'Team Leadership', 'Budget Management', 'Performance Management'],
-                'lead_level': ['Executive Leadership', 'Organizational Strategy', 'Change Management', 'Innovation']
-            }
-        }
+        self.model = model or self.compiled_model()
+        self.career_paths = self.model.career_paths
+    
+    @classmethod
+    def compiled_model(cls) -> CompiledCareerModel:
+        """스킬 분류 체계의 커리어 경로를 버전당 1회 희소 행렬로 컴파일"""
+        if cls._compiled_model is None or cls._compiled_version != skill_taxonomy.version:
+            cls._compiled_version = skill_taxonomy.version
+            cls._compiled_model = CompiledCareerModel(skill_taxonomy.career_paths)
+        return cls._compiled_model
     
     def generate_personalized_path(self, user_profile: Dict, target_category: str) -> Dict:
-        """개인 맞춤 성장 경로 생성"""
-        user_skills = [skill.lower().strip() for skill in user_profile.get('skills', [])]
-        career_path = self.career_paths.get(target_category, {})
+        """개인 맞춤 성장 경로 생성 (레벨 평가·추천·로드맵을 한 번의 평가 결과로 계산)"""
+        model = self.model
+        evaluation = model.evaluate(user_profile.get('skills', []), target_category)
         
-        current_level = self._assess_current_level(user_skills, career_path)
-        next_skills = self._recommend_next_skills(user_skills, career_path, current_level)
+        current_level = model.current_level(evaluation)
+        next_skills = model.next_skills(evaluation, current_level)
         learning_resources = self._suggest_learning_resources(next_skills)
         
         return {
             'current_level': current_level,
             'next_skills': next_skills,
             'learning_resources': learning_resources,
-            'career_roadmap': self._create_roadmap(career_path, user_skills)
+            'career_roadmap': model.roadmap(evaluation)
         }
     
-    def _assess_current_level(self, user_skills: List[str], career_path: Dict) -> str:
-        """현재 레벨 평가"""
-        level_scores = {}
-        
-        for level, required_skills in career_path.items():
-            required_lower = [skill.lower() for skill in required_skills]
-            matches = sum(1 for user_skill in user_skills if any(req in user_skill or user_skill in req for req in required_lower))
-            level_scores[level] = matches / len(required_skills) if required_skills else 0
-        
-        # 70% 이상 만족하는 가장 높은 레벨 반환
-        for level in ['lead_level', 'senior_level', 'junior_level', 'entry_level']:
-            if level_scores.get(level, 0) >= 0.7:
-                return level
-        
-        return 'entry_level'
-    
-    def _recommend_next_skills(self, user_skills: List[str], career_path: Dict, current_level: str) -> List[str]:
-        """다음 학습 스킬 추천"""
-        level_order = ['entry_level', 'junior_level', 'senior_level', 'lead_level']
-        current_index = level_order.index(current_level)
-        
-        recommendations = []
-        
-        # 현재 레벨에서 부족한 스킬
-        current_skills = career_path.get(current_level, [])
-        current_lower = [skill.lower() for skill in current_skills]
-        missing_current = [skill for skill in current_skills 
-                          if not any(user_skill in skill.lower() or skill.lower() in user_skill 
-                                   for user_skill in user_skills)]
-        recommendations.extend(missing_current[:3])
-        
-        # 다음 레벨 스킬
-        if current_index < len(level_order) - 1:
-            next_level = level_order[current_index + 1]
-            next_skills = career_path.get(next_level, [])[:3]
-            recommendations.extend(next_skills)
-        
-        return recommendations[:5]  # 최대 5개 추천
-    
     def _suggest_learning_resources(self, skills: List[str]) -> Dict:
         """학습 리소스 제안"""
         resource_mapping = {
@@ -863,161 +805,156 @@ class GrowthPathGenerator:
                 resources[skill] = {'platform': 'Coursera/Udemy', 'type': '온라인 강의'}
         
         return resources
-    
-    def _create_roadmap(self, career_path: Dict, user_skills: List[str]) -> List[Dict]:
-        """커리어 로드맵 생성"""
-        roadmap = []
-        level_names = {
-            'entry_level': '입문자',
-            'junior_level': '주니어',
-            'senior_level': '시니어',
-            'lead_level': '리드/매니저'
-        }
-        
-        for level, skills in career_path.items():
-            user_skills_lower = [skill.lower() for skill in user_skills]
-            completed = sum(1 for skill in skills if any(us in skill.lower() or skill.lower() in us for us in user_skills_lower))
-            
-            roadmap.append({
-                'level': level_names.get(level, level),
-                'skills': skills,
-                'completion_rate': completed / len(skills) * 100 if skills else 0,
-                'completed_skills': completed,
-                'total_skills': len(skills)
-            })
-        
-        return roadmap
 
 # ==============================================================================
 # 4. 고도화된 시각화 컴포넌트
 # ==============================================================================
 
-def create_advanced_kpi_cards(df: pd.DataFrame):
-    """고도화된 KPI 카드 생성"""
+def create_advanced_kpi_cards(metrics: Dict):
+    """고도화된 KPI 카드 생성 (지표 엔진 결과 사용)"""
     cols = st.columns(4)
     
     # 총 채용공고 수
     with cols[0]:
-        total_jobs = len(df)
-        active_jobs = len(df[df['status_code'] == 'RECRUITING']) if 'status_code' in df.columns else total_jobs
         st.markdown(f"""
         <div class="kpi-card">
             <h3>📊 총 채용공고</h3>
-            <p>{total_jobs:,}</p>
-            <small>활성: {active_jobs:,}개</small>
+            <p>{metrics['total_jobs']:,}</p>
+            <small>활성: {metrics['active_jobs']:,}개</small>
         </div>
         """, unsafe_allow_html=True)
     
     # 평균 지원금
     with cols[1]:
-        avg_reward = df['join_reward'].mean() if 'join_reward' in df.columns else 0
-        max_reward = df['join_reward'].max() if 'join_reward' in df.columns else 0
         st.markdown(f"""
         <div class="kpi-card">
             <h3>💰 평균 지원금</h3>
-            <p>{avg_reward:,.0f}원</p>
-            <small>최고: {max_reward:,.0f}원</small>
+            <p>{metrics['avg_reward']:,.0f}원</p>
+            <small>최고: {metrics['max_reward']:,.0f}원</small>
         </div>
         """, unsafe_allow_html=True)
     
     # 파트너 기업 비율
     with cols[2]:
-        partner_rate = (df['is_partner'].sum() / len(df) * 100) if 'is_partner' in df.columns else 0
-        partner_count = df['is_partner'].sum() if 'is_partner' in df.columns else 0
         st.markdown(f"""
         <div class="kpi-card">
             <h3>🤝 파트너 기업</h3>
-            <p>{partner_rate:.1f}%</p>
-            <small>{partner_count}개 기업</small>
+            <p>{metrics['partner_rate']:.1f}%</p>
+            <small>{metrics['partner_count']}개 기업</small>
         </div>
         """, unsafe_allow_html=True)
     
     # 원격근무 가능 비율
     with cols[3]:
-        remote_rate = (df['remote_possible'].sum() / len(df) * 100) if 'remote_possible' in df.columns else 0
-        remote_count = df['remote_possible'].sum() if 'remote_possible' in df.columns else 0
         st.markdown(f"""
         <div class="kpi-card">
             <h3>🏠 원격근무 가능</h3>
-            <p>{remote_rate:.1f}%</p>
-            <small>{remote_count}개 공고</small>
+            <p>{metrics['remote_rate']:.1f}%</p>
+            <small>{metrics['remote_count']}개 공고</small>
         </div>
         """, unsafe_allow_html=True)
 
+def _build_skill_figures(df: pd.DataFrame):
+    """스킬 바 차트 + 기술 카테고리 파이 차트 (스킬 데이터가 없으면 None)"""
+    # 스킬 데이터 처리 (정규 스킬 ID 별 공고 수)
+    skill_id_counts = skill_canon.skill_counts(df['job_skill_keywords']).head(20)
+    
+    if skill_id_counts.empty:
+        return None
+    skill_counts = pd.Series(skill_id_counts.to_numpy(), index=[skill_canon.label(i) for i in skill_id_counts.index])
+    
+    # 두 개의 시각화: 바 차트와 워드클라우드 스타일
+    fig_bar = px.bar(
+        y=skill_counts.index, 
+        x=skill_counts.values,
+        orientation='h',
+        title="📈 TOP 20 인기 기술 스택",
+        labels={'x': '언급 횟수', 'y': '기술'},
+        color=skill_counts.values,
+        color_continuous_scale='viridis'
+    )
+    fig_bar.update_layout(
+        yaxis={'categoryorder': 'total ascending'},
+        height=600,
+        showlegend=False
+    )
+
+    # 스킬 카테고리별 분류 (스킬 분류 체계의 기술 분야 배열 조회)
+    categorized_skills = {'기타': []}
+    for area, skill in zip(skill_taxonomy.areas(skill_id_counts.index), skill_counts.index):
+        categorized_skills.setdefault(area, []).append(skill)
+    
+    # 카테고리별 스킬 수 계산
+    category_counts = {cat: len(skills) for cat, skills in categorized_skills.items() if skills}
+    
+    fig_pie = px.pie(
+        values=list(category_counts.values()),
+        names=list(category_counts.keys()),
+        title="🎯 기술 카테고리별 분포",
+        hole=0.4
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+
+    return fig_bar, fig_pie
+
 def create_advanced_skill_visualization(df: pd.DataFrame, chart_prefix: str = "skill"):
     """고도화된 스킬 시각화"""
     if 'job_skill_keywords' not in df.columns:
         st.warning("스킬 데이터가 없습니다.")
         return
     
-    # 스킬 데이터 처리
-    skills_series = df['job_skill_keywords'].dropna().str.split(',').explode().str.strip()
-    skill_counts = skills_series[skills_series != ''].value_counts().head(20)
-    
-    if skill_counts.empty:
+    figures = figure_cache.get_or_build("skill_overview", lambda: _build_skill_figures(df), df,
+                                        taxonomy=skill_taxonomy.version)
+    if figures is None:
         st.warning("스킬 데이터가 없습니다.")
         return
     
-    # 두 개의 시각화: 바 차트와 워드클라우드 스타일
+    fig_bar, fig_pie = figures
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_bar = px.bar(
-            y=skill_counts.index, 
-            x=skill_counts.values,
-            orientation='h',
-            title="📈 TOP 20 인기 기술 스택",
-            labels={'x': '언급 횟수', 'y': '기술'},
-            color=skill_counts.values,
-            color_continuous_scale='viridis'
-        )
-        fig_bar.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
-            height=600,
-            showlegend=False
-        )
-        st.plotly_chart(fig_bar, use_container_width=True, key=f"{chart_prefix}_bar_chart")
+        figure_transport.plotly_chart(fig_bar, use_container_width=True, key=f"{chart_prefix}_bar_chart")
     
     with col2:
-        # 스킬 카테고리별 분류
-        skill_categories = {
-            'Frontend': ['javascript', 'react', 'vue', 'angular', 'html', 'css', 'typescript'],
-            'Backend': ['python', 'java', 'node.js', 'spring', 'django', 'flask'],
-            'DevOps': ['docker', 'kubernetes', 'aws', 'gcp', 'azure', 'jenkins'],
-            'Database': ['mysql', 'postgresql', 'mongodb', 'redis'],
-            'Design': ['figma', 'sketch', 'photoshop', 'illustrator', 'adobe xd'],
-            'Marketing': ['google analytics', 'facebook ads', 'seo', 'content marketing']
-        }
-        
-        categorized_skills = {'기타': []}
-        for skill in skill_counts.index:
-            skill_lower = skill.lower()
-            categorized = False
-            for category, category_skills in skill_categories.items():
-                if any(cat_skill in skill_lower for cat_skill in category_skills):
-                    if category not in categorized_skills:
-                        categorized_skills[category] = []
-                    categorized_skills[category].append(skill)
-                    categorized = True
-                    break
-            if not categorized:
-                categorized_skills['기타'].append(skill)
-        
-        # 카테고리별 스킬 수 계산
-        category_counts = {cat: len(skills) for cat, skills in categorized_skills.items() if skills}
-        
-        fig_pie = px.pie(
-            values=list(category_counts.values()),
-            names=list(category_counts.keys()),
-            title="🎯 기술 카테고리별 분포",
-            hole=0.4
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_pie, use_container_width=True, key=f"{chart_prefix}_category_pie")
+        figure_transport.plotly_chart(fig_pie, use_container_width=True, key=f"{chart_prefix}_category_pie")
 
-def create_market_trend_dashboard(df: pd.DataFrame, chart_prefix: str = "market"):
-    """시장 트렌드 대시보드"""
-    trend_analyzer = TrendAnalyzer(df)
+def _build_regional_figure(trend_analyzer: TrendAnalyzer):
+    """지역별 채용 공고 수 / 평균 지원금 서브플롯 (지역 데이터가 없으면 None)"""
+    regional_trends = trend_analyzer.analyze_regional_trends()
+    if not regional_trends:
+        return None
+    
+    regional_data = regional_trends['regional_distribution']
+    
+    # 지역별 채용 공고 수와 평균 지원금
+    fig_regional = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('지역별 채용 공고 수', '지역별 평균 지원금'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
+    )
+    
+    regions = list(regional_data['job_count'].keys())
+    job_counts = list(regional_data['job_count'].values())
+    avg_rewards = list(regional_data['avg_reward'].values())
+    
+    fig_regional.add_trace(
+        go.Bar(x=regions, y=job_counts, name="채용 공고 수", marker_color='lightblue'),
+        row=1, col=1
+    )
+    
+    fig_regional.add_trace(
+        go.Bar(x=regions, y=avg_rewards, name="평균 지원금", marker_color='lightcoral'),
+        row=1, col=2
+    )
+    
+    fig_regional.update_layout(height=400, showlegend=False)
+    return fig_regional
+
+def create_market_trend_dashboard(df: pd.DataFrame, chart_prefix: str = "market",
+                                  sketches: Optional[Dict[str, PartitionSketches]] = None):
+    """시장 트렌드 대시보드 (근사 분석 모드에서는 지원금·기업·기술 통계를 파티션 스케치 병합 결과로 계산)"""
+    trend_analyzer = TrendAnalyzer(df, sketches)
+    approximate = bool(st.session_state.get('approx_analytics') and sketches)
     
     # 스킬 트렌드 분석
     skill_trends = trend_analyzer.analyze_skill_trends()
@@ -1059,43 +996,96 @@ def create_market_trend_dashboard(df: pd.DataFrame, chart_prefix: str = "market"
                 </div>
                 """, unsafe_allow_html=True)
     
+    # 지원금 분포와 수요 집중도
+    salary_trends = trend_analyzer.analyze_salary_trends(approximate)
+    concentration = trend_analyzer.analyze_market_concentration(approximate)
+    if salary_trends.get('overall_stats'):
+        st.subheader("💰 지원금 · 수요 현황")
+        if approximate:
+            st.caption("⚡ 근사 분석 모드: 파티션 스케치(KLL · HyperLogLog · Count-Min) 병합 결과로, 약간의 오차가 있을 수 있습니다")
+        
+        overall = salary_trends['overall_stats']
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("지원금 중앙값", f"{overall['median']:,.0f}원")
+        col2.metric("상위 25% 지원금", f"{overall['percentiles']['75th']:,.0f}원")
+        col3.metric("상위 10% 지원금", f"{overall['percentiles']['90th']:,.0f}원")
+        col4.metric("참여 기업 수", f"{concentration['unique_companies']:,}개")
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            st.markdown("**🏆 지원금 상위 공고**")
+            high_reward_jobs = pd.DataFrame(salary_trends['high_reward_jobs'])
+            if not high_reward_jobs.empty:
+                st.dataframe(high_reward_jobs.rename(columns={'title': '공고', 'company_name': '회사', 'join_reward': '지원금'}),
+                             hide_index=True, use_container_width=True)
+        with col2:
+            st.markdown("**🏢 공고 수 상위 기업**")
+            for company, count in list(concentration['top_companies'].items())[:5]:
+                st.markdown(f"• {company} ({count:,}건)")
+        with col3:
+            st.markdown("**🛠 언급 상위 기술**")
+            for skill, count in list(concentration['top_skills'].items())[:5]:
+                st.markdown(f"• {skill} ({count:,}건)")
+    
     # 지역별 분석
     st.subheader("🌍 지역별 채용 현황")
-    regional_trends = trend_analyzer.analyze_regional_trends()
+    fig_regional = figure_cache.get_or_build("regional_trends", lambda: _build_regional_figure(trend_analyzer), df)
     
-    if regional_trends:
-        regional_data = regional_trends['regional_distribution']
-        
-        # 지역별 채용 공고 수와 평균 지원금
-        fig_regional = make_subplots(
-            rows=1, cols=2,
-            subplot_titles=('지역별 채용 공고 수', '지역별 평균 지원금'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-        )
-        
-        regions = list(regional_data['job_count'].keys())
-        job_counts = list(regional_data['job_count'].values())
-        avg_rewards = list(regional_data['avg_reward'].values())
-        
-        fig_regional.add_trace(
-            go.Bar(x=regions, y=job_counts, name="채용 공고 수", marker_color='lightblue'),
-            row=1, col=1
-        )
-        
-        fig_regional.add_trace(
-            go.Bar(x=regions, y=avg_rewards, name="평균 지원금", marker_color='lightcoral'),
-            row=1, col=2
-        )
-        
-        fig_regional.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig_regional, use_container_width=True, key=f"{chart_prefix}_regional_trends")
+    if fig_regional is not None:
+        figure_transport.plotly_chart(fig_regional, use_container_width=True, key=f"{chart_prefix}_regional_trends")
+
+def _build_success_gauges(labels: List[str], probabilities: List[float]) -> go.Figure:
+    """여러 공고의 합격 확률 게이지를 한 Figure 에 나란히 배치"""
+    fig = go.Figure()
+    n = max(len(probabilities), 1)
+    for i, (label, probability) in enumerate(zip(labels, probabilities)):
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=probability,
+            number={'suffix': "%", 'font': {'size': 20}},
+            domain={'x': [i / n + 0.01, (i + 1) / n - 0.01], 'y': [0, 1]},
+            title={'text': label[:14], 'font': {'size': 12}},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "#667eea"},
+                'steps': [
+                    {'range': [0, 25], 'color': "#ffcdd2"},
+                    {'range': [25, 50], 'color': "#fff9c4"},
+                    {'range': [50, 75], 'color': "#c8e6c9"},
+                    {'range': [75, 100], 'color': "#a5d6a7"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 90
+                }
+            }
+        ))
+    
+    fig.update_layout(
+        height=220,
+        margin=dict(l=20, r=20, t=50, b=20),
+        font={'size': 12}
+    )
+    return fig
 
 # ==============================================================================
 # 5. 고도화된 페이지 렌더링 함수들
 # ==============================================================================
 
-def render_enhanced_main_summary(df: pd.DataFrame):
-    """고도화된 메인 요약 페이지"""
+def approximate_metrics(metrics: Dict, sketches: Optional[Dict[str, PartitionSketches]]) -> Dict:
+    """근사 분석 모드면 고유 기업 수·지원금 평균/최고를 파티션 스케치 병합 결과로 대체한 전체 데이터 지표"""
+    if not (st.session_state.get('approx_analytics') and sketches):
+        return metrics
+    merged = merge_sketches(sketches)
+    reward_stats = merged.reward_stats()
+    return dict(metrics, unique_companies=merged.companies.count(),
+                avg_reward=reward_stats.get('mean', 0), max_reward=reward_stats.get('max', 0))
+
+def render_enhanced_main_summary(df: pd.DataFrame, metrics: Dict,
+                                 sketches: Optional[Dict[str, PartitionSketches]] = None):
+    """고도화된 메인 요약 페이지 (KPI·빠른 통계는 근사 분석 모드에서 스케치 병합 결과 사용)"""
+    metrics = approximate_metrics(metrics, sketches)
     # 헤더
     st.markdown("""
     <div class="main-header fade-in">
@@ -1105,7 +1095,7 @@ def render_enhanced_main_summary(df: pd.DataFrame):
     """, unsafe_allow_html=True)
     
     # KPI 카드
-    create_advanced_kpi_cards(df)
+    create_advanced_kpi_cards(metrics)
     
     st.markdown("---")
     
@@ -1116,29 +1106,29 @@ def render_enhanced_main_summary(df: pd.DataFrame):
         st.subheader("🎯 주요 채용 인사이트")
         
         # 카테고리별 분포
-        category_counts = df['job_category'].value_counts()
-        fig_category = px.pie(
-            values=category_counts.values,
-            names=category_counts.index,
-            title="직무 카테고리별 채용 분포",
-            hole=0.5,
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig_category.update_traces(textposition='inside', textinfo='percent+label')
-        fig_category.update_layout(height=400)
-        st.plotly_chart(fig_category, use_container_width=True, key="main_category_pie")
+        def build_category_pie():
+            category_counts = metrics['category_counts']
+            fig = px.pie(
+                values=list(category_counts.values()),
+                names=list(category_counts.keys()),
+                title="직무 카테고리별 채용 분포",
+                hole=0.5,
+                color_discrete_sequence=px.colors.qualitative.Set3
+            )
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            fig.update_layout(height=400)
+            return fig
+        
+        fig_category = figure_cache.get_or_build("main_category_pie", build_category_pie, df)
+        figure_transport.plotly_chart(fig_category, use_container_width=True, key="main_category_pie")
     
     with col2:
         st.subheader("📊 Quick Stats")
         
         # 빠른 통계
-        total_companies = df['company_name'].nunique()
-        avg_reward = df['join_reward'].mean() if 'join_reward' in df.columns else 0
-        top_region = df['address_region'].mode().iloc[0] if not df['address_region'].empty else "N/A"
-        
-        st.metric("참여 기업 수", f"{total_companies:,}개")
-        st.metric("평균 지원금", f"{avg_reward:,.0f}원")
-        st.metric("핫플레이스", top_region)
+        st.metric("참여 기업 수", f"{metrics['unique_companies']:,}개")
+        st.metric("평균 지원금", f"{metrics['avg_reward']:,.0f}원")
+        st.metric("핫플레이스", metrics['top_region'])
         
         # 최신 트렌드 알림
         st.markdown("""
@@ -1153,10 +1143,140 @@ def render_enhanced_main_summary(df: pd.DataFrame):
     st.markdown("---")
     
     # 시장 동향
-    create_market_trend_dashboard(df, "main_dashboard")
+    create_market_trend_dashboard(df, "main_dashboard", sketches)
+
+@st.fragment
+def render_apply_button(posting_id):
+    """공고별 지원 버튼 (클릭 시 이 영역만 재실행, 지원 이력은 공고 id 로 세션에 보관 - 필터가 바뀌어도 유지)"""
+    applied_jobs = st.session_state.setdefault('applied_jobs', set())
+    if posting_id in applied_jobs:
+        st.success("✅ 지원이 완료되었습니다! (시뮬레이션)")
+        return
+    if st.button(f"지원하기 📤", key=f"apply_{posting_id}"):
+        applied_jobs.add(posting_id)
+        st.success("✅ 지원이 완료되었습니다! (시뮬레이션)")
+
+def render_similar_jobs(similar_jobs: Optional[SimilarJobsTable], df: pd.DataFrame, posting_id, key: str):
+    """비슷한 공고 목록 (사전 계산된 이웃 k 개만 조회)"""
+    if similar_jobs is None or not similar_jobs.is_current(df):
+        st.caption("비슷한 공고 테이블이 아직 생성되지 않았습니다. (`python -m src.similar_jobs` 실행 후 표시됩니다)")
+        return
+    similar_df = similar_jobs.similar_postings(df, posting_id)
+    if similar_df.empty:
+        st.caption("비슷한 공고가 없습니다.")
+        return
+    columns = [col for col in ['title', 'company_name', 'job_category', 'address_region', 'similarity']
+               if col in similar_df.columns]
+    st.dataframe(
+        similar_df[columns],
+        hide_index=True,
+        use_container_width=True,
+        key=key,
+        column_config={
+            'title': st.column_config.TextColumn("공고명", width="large"),
+            'company_name': "회사",
+            'job_category': "직무",
+            'address_region': "지역",
+            'similarity': st.column_config.ProgressColumn("유사도", min_value=0, max_value=1, format="%.2f"),
+        }
+    )
+
+@st.fragment
+def render_match_list(match_results: MatchResultSet, page_size: int = 100,
+                      similar_jobs: Optional[SimilarJobsTable] = None, all_df: Optional[pd.DataFrame] = None):
+    """매칭 공고 목록 (표는 보이는 행만 그려지고, 행 선택/페이지 이동 시 이 영역만 재실행)"""
+    total_pages = max((len(match_results) + page_size - 1) // page_size, 1)
+    page_number = 1
+    if total_pages > 1:
+        page_number = st.selectbox("페이지", range(1, total_pages + 1), key="match_page")
+    ranked = match_results.page(page_number, page_size)['positions']
+    
+    event = st.dataframe(
+        match_results.to_frame(ranked).drop(columns='idx'),
+        hide_index=True,
+        use_container_width=True,
+        height=360,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="match_list",
+        column_config={
+            'title': st.column_config.TextColumn("공고명", width="large"),
+            'company': "회사",
+            'category': "직무",
+            'region': "지역",
+            'reward': st.column_config.NumberColumn("지원금", format="%d원"),
+            'skill_score': st.column_config.NumberColumn("스킬 매칭", format="%.0f점"),
+            'success_prob': st.column_config.ProgressColumn("합격 확률", min_value=0, max_value=100, format="%.0f%%"),
+            'confidence': st.column_config.NumberColumn("신뢰도", format="%.0f%%"),
+        }
+    )
+    
+    # 선택이 없거나 이전 페이지/결과의 선택이 현재 페이지 범위를 벗어나면 1순위 공고 상세
+    selected_rows = event.selection.rows
+    position = selected_rows[0] if selected_rows and selected_rows[0] < len(ranked) else 0
+    st.caption("표에서 공고를 선택하면 상세 분석을 볼 수 있습니다.")
+    # 유사 스킬 크레딧은 현재 페이지 공고 전체를 한 번에 계산
+    credits = match_results.similar_credits(ranked)
+    render_match_detail(match_results.record(int(ranked[position])), (page_number - 1) * page_size + position,
+                        similar_jobs, all_df, None if credits is None else float(credits[position]))
+
+def render_match_detail(result: MatchRecord, rank: int, similar_jobs: Optional[SimilarJobsTable] = None,
+                        all_df: Optional[pd.DataFrame] = None, similar_credit: Optional[float] = None):
+    """선택된 매칭 공고 상세 (similar_credit: 스킬 그래프 기반 유사 스킬 크레딧, 점수에는 반영하지 않음)"""
+    st.markdown(f"#### 🏆 #{rank+1} {result['title']} @ {result['company']} - 합격 확률 {result['success_prob']}%")
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # 기본 정보
+        st.markdown(f"""
+        **회사:** {result['company']}  
+        **직무:** {result['category']}  
+        **지역:** {result['region']}  
+        **지원금:** {result['reward']:,.0f}원
+        """)
+        
+        # 스킬 매칭 상세
+        st.markdown("**🎯 스킬 매칭 분석**")
+        
+        if result['matched']:
+            st.markdown("**보유 스킬 매치:** " + 
+                      "".join([f'<span class="skill-match">✅ {s.title()}</span>' 
+                             for s in result['matched']]), unsafe_allow_html=True)
+        
+        if result['missing']:
+            st.markdown("**추가 학습 필요:** " + 
+                      "".join([f'<span class="skill-gap">📚 {s.title()}</span>' 
+                             for s in result['missing'][:4]]), unsafe_allow_html=True)
+        
+        # 상세 분석
+        analysis = result['analysis']
+        st.markdown(f"""
+        **📊 상세 분석:**
+        - 기본 매칭도: {analysis['basic_score']:.1f}%
+        - 가중 매칭도: {analysis['weighted_score']:.1f}%
+        - 카테고리 보너스: +{analysis['category_bonus']:.1f}점
+        """)
+        if analysis.get('similar_matches'):
+            st.markdown("**유사 스킬:** " + ", ".join(f"{have} ↔ {need}" for have, need in analysis['similar_matches'][:4]))
+        if similar_credit:
+            st.caption(f"유사 스킬 보정: 부족 스킬 {similar_credit:.1f}개 분량을 보유 스킬과 비슷한 경험으로 보완 가능")
+    
+    with col2:
+        st.metric("합격 확률", f"{result['success_prob']}%")
+        
+        # 신뢰도 표시
+        st.metric("신뢰도", f"{result['confidence']:.0f}%")
+        
+        # 지원 버튼 (시뮬레이션)
+        render_apply_button(result['id'])
+    
+    if all_df is not None:
+        with st.expander("🔗 비슷한 공고"):
+            render_similar_jobs(similar_jobs, all_df, result['id'], key="match_similar_jobs")
 
 def render_enhanced_smart_matching(filtered_df: pd.DataFrame, user_profile: Dict, 
-                                 matching_engine: AdvancedMatchingEngine, all_df: pd.DataFrame):
+                                 matching_engine: AdvancedMatchingEngine, all_df: pd.DataFrame,
+                                 target_category: str = '전체'):
     """고도화된 스마트 매칭 페이지"""
     st.header("🎯 AI 기반 스마트 매칭")
     
@@ -1176,7 +1296,8 @@ def render_enhanced_smart_matching(filtered_df: pd.DataFrame, user_profile: Dict
         return
     
     # 사용자 프로필 분석
-    growth_score, growth_factors, growth_analysis = matching_engine.analyze_advanced_growth_potential(user_profile)
+    growth_score, growth_factors, growth_analysis = ranking_cache.growth_analysis(user_profile, matching_engine)
+    cohort = cohort_percentiles(all_df, user_profile, target_category, growth_score)
     
     # 프로필 요약 카드
     col1, col2, col3 = st.columns(3)
@@ -1186,7 +1307,7 @@ def render_enhanced_smart_matching(filtered_df: pd.DataFrame, user_profile: Dict
         <div class="kpi-card">
             <h3>🧠 성장 잠재력</h3>
             <p>{growth_score:.0f}점</p>
-            <small>AI 분석 결과</small>
+            <small>{cohort['cohort']} 중 {top_percent_label(cohort['growth_percentile'])}</small>
         </div>
         """, unsafe_allow_html=True)
     
@@ -1210,36 +1331,16 @@ def render_enhanced_smart_matching(filtered_df: pd.DataFrame, user_profile: Dict
         </div>
         """, unsafe_allow_html=True)
     
-    # 매칭 결과 계산
-    match_results = []
-    for idx, row in filtered_df.iterrows():
-        skill_score, matched, missing, analysis = matching_engine.calculate_advanced_skill_match(
-            user_profile['skills'], 
-            row.get('job_skill_keywords', ''),
-            row.get('job_category')
-        )
-        
-        if skill_score > 15:  # 최소 매칭 기준
-            success_prediction = matching_engine.predict_advanced_success_probability(
-                skill_score, growth_score
-            )
-            
-            match_results.append({
-                'idx': idx,
-                'title': row['title'],
-                'company': row['company_name'],
-                'category': row['job_category'],
-                'region': row.get('address_region', 'N/A'),
-                'reward': row.get('join_reward', 0),
-                'skill_score': skill_score,
-                'success_prob': success_prediction['probability'],
-                'confidence': success_prediction['confidence'],
-                'matched': matched,
-                'missing': missing,
-                'analysis': analysis
-            })
+    st.caption(f"📊 코호트({cohort['cohort']}) 기준 매칭 점수 {cohort['match_score']:.0f}점 - "
+               f"{top_percent_label(cohort['match_percentile'])} (관심 직무 상위 공고 평균 스킬 매칭 점수)")
     
-    if not match_results:
+    # 매칭 결과 계산 (점수/확률 배열은 같은 프로필·데이터 버전이면 세션 간 캐시 공유)
+    # 공고가 매우 많으면 LSH 후보만 정확히 채점
+    lsh_index = get_lsh_index(dataset_version(all_df), all_df) if len(all_df) >= LSH_MIN_POSTINGS else None
+    match_results = ranking_cache.match_results(filtered_df, user_profile, growth_score, matching_engine,
+                                                index=lsh_index)
+    
+    if not len(match_results):
         st.markdown("""
         <div class="alert-warning">
             <h4>😔 현재 조건에 맞는 추천 공고가 없습니다</h4>
@@ -1252,102 +1353,34 @@ def render_enhanced_smart_matching(filtered_df: pd.DataFrame, user_profile: Dict
         </div>
         """, unsafe_allow_html=True)
         
-        # 대안 제안
+        # 대안 제안 (스킬을 하나 더했을 때 새로 매칭되는 공고 수 기준)
         with st.expander("💡 성장 제안 - 이런 스킬을 추가해보세요"):
-            all_skills = all_df['job_skill_keywords'].dropna().str.split(',').explode().str.strip().str.lower()
-            popular_skills = all_skills.value_counts().head(10)
-            user_skills_lower = [s.lower() for s in user_profile['skills']]
-            
-            suggested_skills = [skill for skill in popular_skills.index 
-                              if skill not in user_skills_lower][:5]
+            suggestions = next_best_skills(all_df, user_profile, k=5)['ranking']
             
-            for skill in suggested_skills:
-                st.markdown(f"• **{skill.title()}** - {popular_skills[skill]}개 공고에서 요구")
+            for row in suggestions.itertuples():
+                st.markdown(f"• **{row.skill}** - 추가 시 +{row.unlocked}개 공고 매칭 ({row.required_by}개 공고에서 요구)")
         
         return
     
-    # 매칭 결과 표시
+    # 매칭 결과 표시 (합격 확률 내림차순)
     st.subheader(f"🌟 맞춤 추천 공고 ({len(match_results)}개)")
     
-    # 상위 5개 결과 상세 표시
-    top_matches = sorted(match_results, key=lambda x: x['success_prob'], reverse=True)[:5]
+    # 상위 5개 합격 확률 게이지 (하나의 Figure)
+    top_matches = [match_results.record(position) for position in match_results.top(5)]
+    labels = [f"#{i+1} {record.company}" for i, record in enumerate(top_matches)]
+    probabilities = [record.success_prob for record in top_matches]
+    fig_gauges = figure_cache.get_or_build(
+        "success_gauges", lambda: _build_success_gauges(labels, probabilities),
+        labels=labels, probabilities=probabilities
+    )
+    figure_transport.plotly_chart(fig_gauges, use_container_width=True, key="success_gauges")
     
-    for i, result in enumerate(top_matches):
-        with st.expander(f"🏆 #{i+1} {result['title']} @ {result['company']} - 합격 확률 {result['success_prob']}%", expanded=(i == 0)):
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                # 기본 정보
-                st.markdown(f"""
-                **회사:** {result['company']}  
-                **직무:** {result['category']}  
-                **지역:** {result['region']}  
-                **지원금:** {result['reward']:,}원
-                """)
-                
-                # 스킬 매칭 상세
-                st.markdown("**🎯 스킬 매칭 분석**")
-                
-                if result['matched']:
-                    st.markdown("**보유 스킬 매치:** " + 
-                              "".join([f'<span class="skill-match">✅ {s.title()}</span>' 
-                                     for s in result['matched']]), unsafe_allow_html=True)
-                
-                if result['missing']:
-                    st.markdown("**추가 학습 필요:** " + 
-                              "".join([f'<span class="skill-gap">📚 {s.title()}</span>' 
-                                     for s in result['missing'][:4]]), unsafe_allow_html=True)
-                
-                # 상세 분석
-                analysis = result['analysis']
-                st.markdown(f"""
-                **📊 상세 분석:**
-                - 기본 매칭도: {analysis['basic_score']:.1f}%
-                - 가중 매칭도: {analysis['weighted_score']:.1f}%
-                - 카테고리 보너스: +{analysis['category_bonus']:.1f}점
-                """)
-            
-            with col2:
-                # 성공 확률 게이지
-                fig_gauge = go.Figure(go.Indicator(
-                    mode="gauge+number+delta",
-                    value=result['success_prob'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "합격 확률"},
-                    delta={'reference': 50},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "#667eea"},
-                        'steps': [
-                            {'range': [0, 25], 'color': "#ffcdd2"},
-                            {'range': [25, 50], 'color': "#fff9c4"},
-                            {'range': [50, 75], 'color': "#c8e6c9"},
-                            {'range': [75, 100], 'color': "#a5d6a7"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ))
-                
-                fig_gauge.update_layout(
-                    height=200,
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    font={'size': 12}
-                )
-                st.plotly_chart(fig_gauge, use_container_width=True, key=f"success_gauge_{result['idx']}")
-                
-                # 신뢰도 표시
-                st.metric("신뢰도", f"{result['confidence']:.0f}%")
-                
-                # 지원 버튼 (시뮬레이션)
-                if st.button(f"지원하기 📤", key=f"apply_{result['idx']}"):
-                    st.success("✅ 지원이 완료되었습니다! (시뮬레이션)")
+    # 전체 목록 (가상 스크롤) + 선택 공고 상세
+    render_match_list(match_results, similar_jobs=get_similar_jobs(dataset_version(all_df), all_df), all_df=all_df)
 
 def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_category: str, 
-                              matching_engine: AdvancedMatchingEngine):
+                              matching_engine: AdvancedMatchingEngine,
+                              career_model: Optional[CompiledCareerModel] = None):
     """고도화된 성장 경로 페이지"""
     st.header("📈 AI 기반 개인 성장 경로")
     
@@ -1356,10 +1389,11 @@ def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_cat
         return
     
     # 성장 경로 생성기 초기화
-    growth_generator = GrowthPathGenerator(df)
+    growth_generator = GrowthPathGenerator(df, career_model)
     
     # 성장 잠재력 분석
-    growth_score, factors, detailed_analysis = matching_engine.analyze_advanced_growth_potential(user_profile)
+    growth_score, factors, detailed_analysis = ranking_cache.growth_analysis(user_profile, matching_engine)
+    cohort = cohort_percentiles(df, user_profile, target_category, growth_score)
     
     # 개인 성장 경로 생성
     if target_category != '전체':
@@ -1375,7 +1409,7 @@ def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_cat
         <div class="kpi-card">
             <h3>🚀 성장 잠재력</h3>
             <p>{growth_score:.0f}/100</p>
-            <small>AI 종합 평가</small>
+            <small>{cohort['cohort']} 중 {top_percent_label(cohort['growth_percentile'])}</small>
         </div>
         """, unsafe_allow_html=True)
     
@@ -1446,35 +1480,39 @@ def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_cat
     with col2:
         st.subheader("🎯 성장 잠재력 시각화")
         
-        # 성장 잠재력 레이더 차트
-        categories = ['학습 활동', '프로젝트 경험', '기술 다양성', '오픈소스 기여', '트렌드 관심']
-        values = [
-            detailed_analysis.get('learning_score', 0),
-            detailed_analysis.get('project_score', 0),
-            detailed_analysis.get('diversity_score', 0),
-            detailed_analysis.get('oss_score', 0),
-            detailed_analysis.get('trend_score', 0)
-        ]
+        def build_radar():
+            # 성장 잠재력 레이더 차트
+            categories = ['학습 활동', '프로젝트 경험', '기술 다양성', '오픈소스 기여', '트렌드 관심']
+            values = [
+                detailed_analysis.get('learning_score', 0),
+                detailed_analysis.get('project_score', 0),
+                detailed_analysis.get('diversity_score', 0),
+                detailed_analysis.get('oss_score', 0),
+                detailed_analysis.get('trend_score', 0)
+            ]
         
-        fig_radar = go.Figure()
-        fig_radar.add_trace(go.Scatterpolar(
-            r=values,
-            theta=categories,
-            fill='toself',
-            name='현재 수준',
-            line_color='rgb(102, 126, 234)'
-        ))
+            fig_radar = go.Figure()
+            fig_radar.add_trace(go.Scatterpolar(
+                r=values,
+                theta=categories,
+                fill='toself',
+                name='현재 수준',
+                line_color='rgb(102, 126, 234)'
+            ))
         
-        fig_radar.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 30]
-                )),
-            showlegend=False,
-            height=400
-        )
-        st.plotly_chart(fig_radar, use_container_width=True, key="growth_radar_chart")
+            fig_radar.update_layout(
+                polar=dict(
+                    radialaxis=dict(
+                        visible=True,
+                        range=[0, 30]
+                    )),
+                showlegend=False,
+                height=400
+            )
+            return fig_radar
+        
+        fig_radar = figure_cache.get_or_build("growth_radar", build_radar, analysis=detailed_analysis)
+        figure_transport.plotly_chart(fig_radar, use_container_width=True, key="growth_radar_chart")
     
     st.markdown("---")
     
@@ -1483,27 +1521,31 @@ def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_cat
     
     roadmap = personalized_path.get('career_roadmap', [])
     
-    # 로드맵 진행도 시각화
-    levels = [item['level'] for item in roadmap]
-    completion_rates = [item['completion_rate'] for item in roadmap]
-    
-    fig_roadmap = go.Figure()
-    fig_roadmap.add_trace(go.Bar(
-        x=levels,
-        y=completion_rates,
-        text=[f"{rate:.0f}%" for rate in completion_rates],
-        textposition='auto',
-        marker_color=['#4CAF50' if rate >= 70 else '#FF9800' if rate >= 30 else '#f44336' 
-                     for rate in completion_rates]
-    ))
-    
-    fig_roadmap.update_layout(
-        title="레벨별 스킬 완성도",
-        xaxis_title="커리어 레벨",
-        yaxis_title="완성도 (%)",
-        height=400
-    )
-    st.plotly_chart(fig_roadmap, use_container_width=True, key="career_roadmap_bar")
+    def build_roadmap():
+        # 로드맵 진행도 시각화
+        levels = [item['level'] for item in roadmap]
+        completion_rates = [item['completion_rate'] for item in roadmap]
+    
+        fig_roadmap = go.Figure()
+        fig_roadmap.add_trace(go.Bar(
+            x=levels,
+            y=completion_rates,
+            text=[f"{rate:.0f}%" for rate in completion_rates],
+            textposition='auto',
+            marker_color=['#4CAF50' if rate >= 70 else '#FF9800' if rate >= 30 else '#f44336' 
+                         for rate in completion_rates]
+        ))
+    
+        fig_roadmap.update_layout(
+            title="레벨별 스킬 완성도",
+            xaxis_title="커리어 레벨",
+            yaxis_title="완성도 (%)",
+            height=400
+        )
+        return fig_roadmap
+    
+    fig_roadmap = figure_cache.get_or_build("career_roadmap", build_roadmap, roadmap=roadmap)
+    figure_transport.plotly_chart(fig_roadmap, use_container_width=True, key="career_roadmap_bar")
     
     # 다음 학습 추천
     st.subheader("📚 추천 학습 스킬")
@@ -1533,6 +1575,31 @@ def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_cat
                 </div>
                 """, unsafe_allow_html=True)
     
+    # 스킬별 한계 효과 (what-if)
+    st.subheader("🚀 다음에 배울 스킬 - 추가 시 늘어나는 매칭 공고")
+    
+    next_best = next_best_skills(df, user_profile, k=10)
+    if next_best['ranking'].empty:
+        st.info("추가로 매칭 공고를 늘릴 수 있는 스킬이 없습니다.")
+    else:
+        st.caption(f"현재 매칭 공고 {next_best['matched']:,}개 기준, 스킬 하나를 더 보유했을 때의 변화")
+        ranking = next_best['ranking']
+        st.dataframe(
+            pd.DataFrame({
+                '스킬': ranking['skill'],
+                '새로 매칭되는 공고': ranking['unlocked'],
+                '매칭 점수 상승 합': ranking['score_gain'].round(1),
+                '요구 공고 수': ranking['required_by'],
+            }),
+            hide_index=True, use_container_width=True,
+            column_config={
+                '새로 매칭되는 공고': st.column_config.ProgressColumn(
+                    '새로 매칭되는 공고', format="+%d", min_value=0,
+                    max_value=int(max(ranking['unlocked'].max(), 1))
+                ),
+            },
+        )
+    
     # 스킬 갭 분석
     st.subheader("🔍 시장 수요 vs 보유 스킬 분석")
     
@@ -1542,39 +1609,43 @@ def render_advanced_growth_path(df: pd.DataFrame, user_profile: Dict, target_cat
         target_df = df
     
     if 'job_skill_keywords' in target_df.columns:
-        market_skills = target_df['job_skill_keywords'].dropna().str.split(',').explode().str.strip().str.lower()
-        market_demand = market_skills.value_counts().head(15)
-        
-        user_skills_lower = [s.lower().strip() for s in user_profile['skills']]
-        
-        gap_data = []
-        for skill, demand in market_demand.items():
-            status = '보유 ✅' if skill in user_skills_lower else '학습 필요 📚'
-            gap_data.append({
-                'skill': skill.title(),
-                'demand': demand,
-                'status': status
-            })
+        def build_skill_gap():
+            market_demand = skill_canon.skill_counts(target_df['job_skill_keywords']).head(15)
+        
+            user_ids = set(skill_canon.ids(user_profile['skills']).tolist())
+        
+            gap_data = []
+            for skill_id, demand in market_demand.items():
+                status = '보유 ✅' if skill_id in user_ids else '학습 필요 📚'
+                gap_data.append({
+                    'skill': skill_canon.label(skill_id),
+                    'demand': demand,
+                    'status': status
+                })
         
-        gap_df = pd.DataFrame(gap_data)
+            gap_df = pd.DataFrame(gap_data)
         
-        fig_gap = px.bar(
-            gap_df,
-            x='demand',
-            y='skill',
-            color='status',
-            orientation='h',
-            title=f"'{target_category}' 직무 핵심 스킬 수요 vs 보유 현황",
-            color_discrete_map={'보유 ✅': '#4CAF50', '학습 필요 📚': '#FF9800'}
-        )
+            fig_gap = px.bar(
+                gap_df,
+                x='demand',
+                y='skill',
+                color='status',
+                orientation='h',
+                title=f"'{target_category}' 직무 핵심 스킬 수요 vs 보유 현황",
+                color_discrete_map={'보유 ✅': '#4CAF50', '학습 필요 📚': '#FF9800'}
+            )
         
-        fig_gap.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
-            height=500
-        )
-        st.plotly_chart(fig_gap, use_container_width=True, key="skill_gap_analysis_bar")
+            fig_gap.update_layout(
+                yaxis={'categoryorder': 'total ascending'},
+                height=500
+            )
+            return fig_gap
+        
+        fig_gap = figure_cache.get_or_build("skill_gap", build_skill_gap, target_df,
+                                          category=target_category, skills=user_profile['skills'])
+        figure_transport.plotly_chart(fig_gap, use_container_width=True, key="skill_gap_analysis_bar")
 
-def render_enhanced_company_insights(filtered_df: pd.DataFrame):
+def render_enhanced_company_insights(filtered_df: pd.DataFrame, metrics: Dict, all_df: Optional[pd.DataFrame] = None):
     """고도화된 기업 인사이트 페이지"""
     st.header("🏢 기업별 채용 인사이트")
     
@@ -1586,7 +1657,7 @@ def render_enhanced_company_insights(filtered_df: pd.DataFrame):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_companies = filtered_df['company_name'].nunique()
+        total_companies = metrics['unique_companies']
         st.markdown(f"""
         <div class="kpi-card">
             <h3>🏢 참여 기업</h3>
@@ -1632,38 +1703,46 @@ def render_enhanced_company_insights(filtered_df: pd.DataFrame):
     
     with col1:
         st.subheader("🏆 TOP 채용 기업")
-        top_companies = filtered_df['company_name'].value_counts().head(15)
-        
-        fig_companies = px.bar(
-            y=top_companies.index,
-            x=top_companies.values,
-            orientation='h',
-            title="채용 공고 수 기준",
-            labels={'x': '공고 수', 'y': '기업명'},
-            color=top_companies.values,
-            color_continuous_scale='Blues'
-        )
-        fig_companies.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
-            height=500,
-            showlegend=False
-        )
-        st.plotly_chart(fig_companies, use_container_width=True, key="top_companies_bar")
+        def build_top_companies():
+            top_companies = filtered_df['company_name'].value_counts().head(15)
+        
+            fig_companies = px.bar(
+                y=top_companies.index,
+                x=top_companies.values,
+                orientation='h',
+                title="채용 공고 수 기준",
+                labels={'x': '공고 수', 'y': '기업명'},
+                color=top_companies.values,
+                color_continuous_scale='Blues'
+            )
+            fig_companies.update_layout(
+                yaxis={'categoryorder': 'total ascending'},
+                height=500,
+                showlegend=False
+            )
+            return fig_companies
+        
+        fig_companies = figure_cache.get_or_build("top_companies", build_top_companies, filtered_df)
+        figure_transport.plotly_chart(fig_companies, use_container_width=True, key="top_companies_bar")
     
     with col2:
         st.subheader("💎 기업 규모별 분포")
         
         if 'company_size' in filtered_df.columns:
-            size_counts = filtered_df['company_size'].value_counts()
+            def build_size_pie():
+                size_counts = filtered_df['company_size'].value_counts()
             
-            fig_size = px.pie(
-                values=size_counts.values,
-                names=size_counts.index,
-                title="기업 규모별 채용 공고",
-                hole=0.4
-            )
-            fig_size.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig_size, use_container_width=True, key="company_size_pie")
+                fig_size = px.pie(
+                    values=size_counts.values,
+                    names=size_counts.index,
+                    title="기업 규모별 채용 공고",
+                    hole=0.4
+                )
+                fig_size.update_traces(textposition='inside', textinfo='percent+label')
+                return fig_size
+            
+            fig_size = figure_cache.get_or_build("company_size_pie", build_size_pie, filtered_df)
+            figure_transport.plotly_chart(fig_size, use_container_width=True, key="company_size_pie")
         
         # 지원금 상위 기업
         st.subheader("💰 지원금 TOP 기업")
@@ -1683,10 +1762,21 @@ def render_enhanced_company_insights(filtered_df: pd.DataFrame):
     # 기업별 상세 분석
     st.subheader("🔍 기업별 상세 분석")
     
+    # 기업 선택 영역은 분석에 필요한 컬럼만 넘겨 부분 재실행
+    detail_columns = [col for col in ['id', 'title', 'company_name', 'job_category', 'join_reward', 'job_skill_keywords']
+                      if col in filtered_df.columns]
+    similar_jobs = get_similar_jobs(dataset_version(all_df), all_df) if all_df is not None else None
+    render_company_detail(filtered_df[detail_columns], similar_jobs, all_df)
+
+@st.fragment
+def render_company_detail(filtered_df: pd.DataFrame, similar_jobs: Optional[SimilarJobsTable] = None,
+                          all_df: Optional[pd.DataFrame] = None):
+    """기업별 상세 분석 (기업 선택 시 이 영역만 재실행)"""
     # 기업 선택
     selected_company = st.selectbox(
         "기업을 선택하세요:",
-        ['전체 분석'] + sorted(filtered_df['company_name'].unique())
+        ['전체 분석'] + sorted(filtered_df['company_name'].unique()),
+        key="selected_company"
     )
     
     if selected_company != '전체 분석':
@@ -1707,23 +1797,27 @@ def render_enhanced_company_insights(filtered_df: pd.DataFrame):
         
         # 해당 기업의 직무별 분포
         if len(company_df) > 1:
-            category_dist = company_df['job_category'].value_counts()
+            def build_company_categories():
+                category_dist = company_df['job_category'].value_counts()
             
-            fig_company_cat = px.bar(
-                x=category_dist.index,
-                y=category_dist.values,
-                title=f"{selected_company} 직무별 채용 현황",
-                labels={'x': '직무', 'y': '공고 수'}
-            )
-            st.plotly_chart(fig_company_cat, use_container_width=True, key=f"company_category_{selected_company.replace(' ', '_')}")
+                fig_company_cat = px.bar(
+                    x=category_dist.index,
+                    y=category_dist.values,
+                    title=f"{selected_company} 직무별 채용 현황",
+                    labels={'x': '직무', 'y': '공고 수'}
+                )
+                return fig_company_cat
+            
+            fig_company_cat = figure_cache.get_or_build("company_categories", build_company_categories, company_df)
+            figure_transport.plotly_chart(fig_company_cat, use_container_width=True, key=f"company_category_{selected_company.replace(' ', '_')}")
         
         # 요구 스킬 분석
         if 'job_skill_keywords' in company_df.columns:
-            company_skills = company_df['job_skill_keywords'].dropna().str.split(',').explode().str.strip()
-            skill_counts = company_skills[company_skills != ''].value_counts().head(10)
-            
-            if not skill_counts.empty:
-                st.subheader(f"{selected_company} 주요 요구 스킬")
+            def build_company_skills():
+                company_skills = company_df['job_skill_keywords'].dropna().str.split(',').explode().str.strip()
+                skill_counts = company_skills[company_skills != ''].value_counts().head(10)
+                if skill_counts.empty:
+                    return None
                 
                 fig_skills = px.bar(
                     x=skill_counts.values,
@@ -1732,7 +1826,20 @@ def render_enhanced_company_insights(filtered_df: pd.DataFrame):
                     title="기술별 요구 빈도"
                 )
                 fig_skills.update_layout(yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig_skills, use_container_width=True, key=f"company_skills_{selected_company.replace(' ', '_')}")
+                return fig_skills
+            
+            fig_skills = figure_cache.get_or_build("company_skills", build_company_skills, company_df)
+            if fig_skills is not None:
+                st.subheader(f"{selected_company} 주요 요구 스킬")
+                figure_transport.plotly_chart(fig_skills, use_container_width=True, key=f"company_skills_{selected_company.replace(' ', '_')}")
+        
+        # 이 기업 공고와 비슷한 다른 공고
+        if all_df is not None and {'id', 'title'} <= set(company_df.columns):
+            st.subheader("🔗 비슷한 공고")
+            posting_titles = dict(zip(company_df['id'], company_df['title']))
+            posting_id = st.selectbox("기준 공고", list(posting_titles), format_func=posting_titles.get,
+                                      key="similar_source")
+            render_similar_jobs(similar_jobs, all_df, posting_id, key="company_similar_jobs")
 
 def render_enhanced_prediction_analysis(df: pd.DataFrame):
     """고도화된 예측 분석 페이지"""
@@ -1754,86 +1861,94 @@ def render_enhanced_prediction_analysis(df: pd.DataFrame):
         
         # 간단한 트렌드 분석 (시뮬레이션)
         if 'job_skill_keywords' in df.columns:
-            # 최근 데이터 기반 트렌드 예측
-            skills_series = df['job_skill_keywords'].dropna().str.split(',').explode().str.strip().str.lower()
-            skill_counts = skills_series[skills_series != ''].value_counts().head(10)
+            def build_skill_prediction():
+                # 최근 데이터 기반 트렌드 예측
+                skills_series = df['job_skill_keywords'].dropna().str.split(',').explode().str.strip().str.lower()
+                skill_counts = skills_series[skills_series != ''].value_counts().head(10)
             
-            # 성장률 시뮬레이션 (실제로는 시계열 분석 필요)
-            predicted_growth = {}
-            for skill in skill_counts.index:
-                # AI/ML 관련 기술은 높은 성장률 예측
-                if any(keyword in skill for keyword in ['ai', 'ml', 'python', 'react', 'kubernetes']):
-                    growth = random.uniform(15, 30)
-                else:
-                    growth = random.uniform(-5, 15)
-                predicted_growth[skill] = growth
+                # 성장률 시뮬레이션 (실제로는 시계열 분석 필요)
+                predicted_growth = {}
+                for skill in skill_counts.index:
+                    # AI/ML 관련 기술은 높은 성장률 예측
+                    if any(keyword in skill for keyword in ['ai', 'ml', 'python', 'react', 'kubernetes']):
+                        growth = random.uniform(15, 30)
+                    else:
+                        growth = random.uniform(-5, 15)
+                    predicted_growth[skill] = growth
             
-            # 예측 결과 시각화
-            growth_df = pd.DataFrame([
-                {'skill': k.title(), 'current_demand': skill_counts[k], 'predicted_growth': v}
-                for k, v in predicted_growth.items()
-            ])
+                # 예측 결과 시각화
+                growth_df = pd.DataFrame([
+                    {'skill': k.title(), 'current_demand': skill_counts[k], 'predicted_growth': v}
+                    for k, v in predicted_growth.items()
+                ])
             
-            fig_prediction = px.scatter(
-                growth_df,
-                x='current_demand',
-                y='predicted_growth',
-                text='skill',
-                title="스킬별 현재 수요 vs 예측 성장률",
-                labels={'current_demand': '현재 수요', 'predicted_growth': '예측 성장률 (%)'}
-            )
-            fig_prediction.update_traces(textposition="top center")
-            st.plotly_chart(fig_prediction, use_container_width=True, key="skill_prediction_scatter")
+                fig_prediction = px.scatter(
+                    growth_df,
+                    x='current_demand',
+                    y='predicted_growth',
+                    text='skill',
+                    title="스킬별 현재 수요 vs 예측 성장률",
+                    labels={'current_demand': '현재 수요', 'predicted_growth': '예측 성장률 (%)'}
+                )
+                fig_prediction.update_traces(textposition="top center")
+                return fig_prediction
+            
+            fig_prediction = figure_cache.get_or_build("skill_prediction", build_skill_prediction, df)
+            figure_transport.plotly_chart(fig_prediction, use_container_width=True, key="skill_prediction_scatter")
     
     with col2:
         st.subheader("💰 지원금 트렌드 예측")
         
         if 'join_reward' in df.columns and 'job_category' in df.columns:
-            category_rewards = df.groupby('job_category')['join_reward'].mean()
+            def build_reward_prediction():
+                category_rewards = df.groupby('job_category')['join_reward'].mean()
             
-            # 카테고리별 예측 성장률 (시뮬레이션)
-            predicted_reward_growth = {
-                'DEVELOPER': 12.5,
-                'DESIGN': 8.3,
-                'MARKETING': 6.7,
-                'MANAGEMENT': 5.2
-            }
+                # 카테고리별 예측 성장률 (시뮬레이션)
+                predicted_reward_growth = {
+                    'DEVELOPER': 12.5,
+                    'DESIGN': 8.3,
+                    'MARKETING': 6.7,
+                    'MANAGEMENT': 5.2
+                }
             
-            prediction_data = []
-            for category in category_rewards.index:
-                current_reward = category_rewards[category]
-                growth_rate = predicted_reward_growth.get(category, 5.0)
-                predicted_reward = current_reward * (1 + growth_rate/100)
+                prediction_data = []
+                for category in category_rewards.index:
+                    current_reward = category_rewards[category]
+                    growth_rate = predicted_reward_growth.get(category, 5.0)
+                    predicted_reward = current_reward * (1 + growth_rate/100)
                 
-                prediction_data.append({
-                    'category': category,
-                    'current': current_reward,
-                    'predicted': predicted_reward,
-                    'growth_rate': growth_rate
-                })
+                    prediction_data.append({
+                        'category': category,
+                        'current': current_reward,
+                        'predicted': predicted_reward,
+                        'growth_rate': growth_rate
+                    })
             
-            pred_df = pd.DataFrame(prediction_data)
+                pred_df = pd.DataFrame(prediction_data)
             
-            fig_reward = go.Figure()
-            fig_reward.add_trace(go.Bar(
-                name='현재 평균',
-                x=pred_df['category'],
-                y=pred_df['current'],
-                marker_color='lightblue'
-            ))
-            fig_reward.add_trace(go.Bar(
-                name='2025년 예측',
-                x=pred_df['category'],
-                y=pred_df['predicted'],
-                marker_color='orange'
-            ))
+                fig_reward = go.Figure()
+                fig_reward.add_trace(go.Bar(
+                    name='현재 평균',
+                    x=pred_df['category'],
+                    y=pred_df['current'],
+                    marker_color='lightblue'
+                ))
+                fig_reward.add_trace(go.Bar(
+                    name='2025년 예측',
+                    x=pred_df['category'],
+                    y=pred_df['predicted'],
+                    marker_color='orange'
+                ))
             
-            fig_reward.update_layout(
-                title="직무별 지원금 트렌드 예측",
-                barmode='group',
-                yaxis_title="지원금 (원)"
-            )
-            st.plotly_chart(fig_reward, use_container_width=True, key="reward_prediction_bar")
+                fig_reward.update_layout(
+                    title="직무별 지원금 트렌드 예측",
+                    barmode='group',
+                    yaxis_title="지원금 (원)"
+                )
+                return fig_reward
+            
+            fig_reward = figure_cache.get_or_build("reward_prediction", build_reward_prediction, df)
+            figure_transport.plotly_chart(fig_reward, use_container_width=True, key="reward_prediction_bar")
     
     st.markdown("---")
     
@@ -1895,11 +2010,144 @@ def render_enhanced_prediction_analysis(df: pd.DataFrame):
         else:
             st.warning("피드백 내용을 입력해주세요.")
 
+def render_market_trends(df: pd.DataFrame, filtered_df: pd.DataFrame,
+                         sketches: Optional[Dict[str, PartitionSketches]] = None):
+    """시장 트렌드 분석 페이지"""
+    create_market_trend_dashboard(df, "market_trends", sketches)
+    create_advanced_skill_visualization(filtered_df, "market_skills")
+    render_skill_bundles(df)
+
+@st.fragment
+def render_skill_bundles(df: pd.DataFrame):
+    """함께 요구되는 스킬 조합 (카테고리 선택 시 이 영역만 재실행, 화면에서는 마이닝하지 않음)"""
+    bundles = get_skill_bundles(dataset_version(df), df)
+    st.subheader("🧩 함께 요구되는 스킬 조합")
+    if bundles.empty:
+        st.info("스킬 조합 테이블이 아직 생성되지 않았습니다. (`python -m src.itemset_mining` 실행 후 표시됩니다)")
+        return
+
+    categories = [ALL_CATEGORIES] + sorted(set(bundles['job_category'].astype(str)) - {ALL_CATEGORIES})
+    category = st.selectbox(
+        "직무 카테고리",
+        categories,
+        format_func=lambda c: "전체" if c == ALL_CATEGORIES else c,
+        key="skill_bundle_category"
+    )
+    fig = visualizer.create_skill_bundle_chart(bundles, category)
+    if fig is None:
+        st.info("선택한 카테고리에서 자주 함께 요구되는 스킬 조합이 없습니다.")
+        return
+    figure_transport.plotly_chart(fig, use_container_width=True, key="skill_bundle_chart")
+    st.caption("지지도: 조합을 모두 요구하는 공고 비율 · Lift: 각 스킬이 독립일 때보다 함께 요구되는 배수")
+
+@st.fragment
+def render_detail_table(filtered_df: pd.DataFrame):
+    """상세 테이블 (컬럼 선택/페이지 이동 시 이 영역만 재실행)"""
+    # 컬럼 선택
+    available_columns = filtered_df.columns.tolist()
+    default_columns = [col for col in ['title', 'company_name', 'job_category', 'address_region', 'join_reward'] 
+                     if col in available_columns]
+    
+    selected_columns = st.multiselect(
+        "표시할 컬럼을 선택하세요:",
+        available_columns,
+        default=default_columns
+    )
+    
+    if not selected_columns:
+        st.warning("표시할 컬럼을 선택해주세요.")
+        return
+    
+    # 정렬 기준 (지원금 순은 동점을 공고 id 순으로 고정하여 페이지 간 순서가 흔들리지 않음)
+    sort_options = ["기본 순서"]
+    if 'join_reward' in available_columns:
+        sort_options += ["지원금 높은 순"]
+    sort_order = st.selectbox("정렬", sort_options)
+    
+    # 페이지네이션
+    page_size = st.selectbox("페이지당 행 수", [10, 25, 50, 100], index=1)
+    total_pages = len(filtered_df) // page_size + (1 if len(filtered_df) % page_size > 0 else 0)
+    
+    page_number = 1
+    if total_pages > 1:
+        page_number = st.selectbox("페이지", range(1, total_pages + 1))
+    
+    # 현재 페이지 행만 먼저 잘라낸 뒤 컬럼 선택 (전체 컬럼 부분집합을 만들지 않음)
+    if sort_order == "지원금 높은 순":
+        rewards = pd.to_numeric(filtered_df['join_reward'], errors='coerce').fillna(-np.inf).to_numpy()
+        ids = filtered_df['id'].to_numpy() if 'id' in available_columns else np.arange(len(filtered_df))
+        positions = ranked_page(rewards, ids, page_number, page_size)['positions']
+        display_df = filtered_df.iloc[positions][selected_columns]
+    else:
+        start_idx = (page_number - 1) * page_size
+        display_df = filtered_df.iloc[start_idx:start_idx + page_size][selected_columns]
+    
+    st.dataframe(display_df, use_container_width=True, height=400)
+
+def render_detail_data(filtered_df: pd.DataFrame, filter_summary: str, filtered_metrics: Dict):
+    """상세 데이터 테이블 페이지 (내보내기 데이터는 이 페이지에서만 생성)"""
+    st.header("📋 상세 데이터 테이블")
+    
+    if not filtered_df.empty:
+        render_detail_table(filtered_df)
+        
+        # 다운로드 버튼 (클릭 시 재실행 없음)
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            csv = filtered_df.to_csv(index=False).encode('utf-8-sig')
+            st.download_button(
+                "📄 CSV 다운로드",
+                csv,
+                "rallit_jobs_filtered.csv",
+                "text/csv",
+                on_click="ignore"
+            )
+        
+        with col2:
+            json_data = filtered_df.to_json(orient='records', force_ascii=False, indent=2)
+            st.download_button(
+                "📄 JSON 다운로드",
+                json_data,
+                "rallit_jobs_filtered.json",
+                "application/json",
+                on_click="ignore"
+            )
+        
+        with col3:
+            # 요약 리포트 생성
+            summary_report = f"""
+# 갓생라이프/커리어하이어 분석 리포트
+
+## 검색 조건
+- 필터 조건: {filter_summary}
+- 검색 결과: {len(filtered_df)}개 공고
+
+## 주요 통계
+- 참여 기업 수: {filtered_metrics['unique_companies']}개
+- 평균 지원금: {filtered_metrics['avg_positive_reward']:,.0f}원 (지원금 제공 공고 기준)
+- 주요 직무: {', '.join(list(filtered_metrics['category_counts'])[:3])}
+
+## 지역별 분포
+{chr(10).join(f"{region}    {count}" for region, count in list(filtered_metrics['region_counts'].items())[:5])}
+
+생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+"""
+            st.download_button(
+                "📊 요약 리포트",
+                summary_report,
+                "rallit_analysis_report.md",
+                "text/markdown",
+                on_click="ignore"
+            )
+    else:
+        st.warning("표시할 데이터가 없습니다. 필터 조건을 조정해주세요.")
+
 # ==============================================================================
 # 6. 고도화된 사이드바 컴포넌트
 # ==============================================================================
 
-def render_enhanced_sidebar(df: pd.DataFrame):
+def render_enhanced_sidebar(df: pd.DataFrame, metrics: Dict):
     """고도화된 사이드바"""
     with st.sidebar:
         # 로고 및 브랜딩
@@ -2013,21 +2261,24 @@ def render_enhanced_sidebar(df: pd.DataFrame):
         # 데이터 새로고침
         if st.button("🔄 데이터 새로고침"):
             st.cache_data.clear()
+            st.cache_resource.clear()
+            figure_cache.clear()
+            ranking_cache.clear()
+            metrics_engines.clear()
             st.rerun()
         
+        st.checkbox("⚡ 근사 분석 모드", key="approx_analytics",
+                    help="대용량 아카이브에서는 스케치 기반 근사 통계로 지표를 빠르게 계산합니다")
+        
         st.markdown("---")
         
         # 퀵 통계
         st.subheader("📊 퀵 통계")
-        total_jobs = len(df)
-        active_jobs = len(df[df['status_code'] == 'RECRUITING']) if 'status_code' in df.columns else total_jobs
-        
-        st.metric("총 공고", f"{total_jobs:,}개")
-        st.metric("활성 공고", f"{active_jobs:,}개")
+        st.metric("총 공고", f"{metrics['total_jobs']:,}개")
+        st.metric("활성 공고", f"{metrics['active_jobs']:,}개")
         
         if 'join_reward' in df.columns:
-            avg_reward = df['join_reward'].mean()
-            st.metric("평균 지원금", f"{avg_reward:,.0f}원")
+            st.metric("평균 지원금", f"{metrics['avg_reward']:,.0f}원")
         
         # 사용자 프로필 반환
         user_profile = {
@@ -2061,54 +2312,12 @@ def render_enhanced_sidebar(df: pd.DataFrame):
         
         return user_profile, filter_conditions
 
-def apply_filters(df: pd.DataFrame, filter_conditions: Dict, user_profile: Dict = None) -> pd.DataFrame:
-    """필터 조건 적용"""
-    filtered_df = df.copy()
-    
-    # 기본 필터 적용
-    if filter_conditions['user_category'] != '전체':
-        filtered_df = filtered_df[filtered_df['job_category'] == filter_conditions['user_category']]
-    
-    if filter_conditions['selected_region'] != '전체':
-        filtered_df = filtered_df[filtered_df['address_region'] == filter_conditions['selected_region']]
-    
-    # 고급 필터 적용
-    if filter_conditions['reward_filter'] and 'join_reward' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['join_reward'] > 0]
-    
-    if filter_conditions['partner_filter'] and 'is_partner' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['is_partner'] == 1]
-    
-    if filter_conditions['remote_filter'] and 'remote_possible' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['remote_possible'] == 1]
-    
-    # 지원금 범위
-    if 'join_reward' in filtered_df.columns:
-        filtered_df = filtered_df[
-            filtered_df['join_reward'].between(
-                filter_conditions['join_reward_range'][0],
-                filter_conditions['join_reward_range'][1]
-            )
-        ]
-    
-    # 직무 레벨
-    if filter_conditions['selected_levels'] and 'job_level' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['job_level'].isin(filter_conditions['selected_levels'])]
-    
-    # 기업 규모
-    if filter_conditions['selected_sizes'] and 'company_size' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['company_size'].isin(filter_conditions['selected_sizes'])]
-    
-    # 키워드 검색
-    if filter_conditions['keyword_input']:
-        keyword = filter_conditions['keyword_input'].lower()
-        mask = (
-            filtered_df['title'].str.lower().str.contains(keyword, na=False) |
-            filtered_df['company_name'].str.lower().str.contains(keyword, na=False)
-        )
-        if 'job_skill_keywords' in filtered_df.columns:
-            mask |= filtered_df['job_skill_keywords'].str.lower().str.contains(keyword, na=False)
-        filtered_df = filtered_df[mask]
+def apply_filters(df: pd.DataFrame, filter_conditions: Dict, user_profile: Dict = None,
+                  engine: Optional[MetricsEngine] = None) -> pd.DataFrame:
+    """필터 조건 적용 (지표 엔진의 메모이즈된 행 선택 사용)"""
+    engine = engine or metrics_engines.get(df)
+    positions = engine.select(normalize_filters(filter_conditions, df.columns))
+    filtered_df = df.iloc[positions]
     
     # 스킬 기반 필터링 (사용자가 스킬을 입력한 경우)
     if user_profile and user_profile['skills'] and 'job_skill_keywords' in filtered_df.columns:
@@ -2131,9 +2340,8 @@ def main():
     """메인 애플리케이션 실행"""
     # 데이터 로딩
     data_loader = EnhancedSmartDataLoader()
-    matching_engine = AdvancedMatchingEngine()
     
-    # 데이터 로드
+    # 데이터 로드 (파티션 스케치 등 페이지 전용 자원은 해당 페이지에서 로드)
     with st.spinner("🔄 데이터를 로딩 중입니다..."):
         df = data_loader.load_from_database()
     
@@ -2141,11 +2349,15 @@ def main():
         st.error("😕 데이터를 로드할 수 없습니다. 관리자에게 문의해주세요.")
         return
     
+    metrics_engine = get_metrics_engine(dataset_version(df), df)
+    
     # 사이드바 렌더링
-    user_profile, filter_conditions = render_enhanced_sidebar(df)
+    overall_metrics = metrics_engine.metrics()
+    user_profile, filter_conditions = render_enhanced_sidebar(df, overall_metrics)
     
     # 필터 적용
-    filtered_df = apply_filters(df, filter_conditions, user_profile)
+    filtered_df = apply_filters(df, filter_conditions, user_profile, metrics_engine)
+    filtered_metrics = metrics_engine.metrics(normalize_filters(filter_conditions, df.columns))
     
     # 필터 요약 표시
     active_filters = []
@@ -2167,117 +2379,36 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # 탭 구성
-    tabs = st.tabs([
-        "⭐ 메인 대시보드",
-        "🎯 AI 스마트 매칭", 
-        "📈 개인 성장 경로",
-        "📊 시장 트렌드 분석",
-        "🏢 기업 인사이트",
-        "🔮 예측 분석",
-        "📋 상세 데이터"
-    ])
-    
-    # 각 탭 렌더링
-    with tabs[0]:
-        render_enhanced_main_summary(df)
-    
-    with tabs[1]:
-        render_enhanced_smart_matching(filtered_df, user_profile, matching_engine, df)
-    
-    with tabs[2]:
-        render_advanced_growth_path(df, user_profile, filter_conditions['user_category'], matching_engine)
-    
-    with tabs[3]:
-        create_market_trend_dashboard(df, "market_trends")
-        create_advanced_skill_visualization(filtered_df, "market_skills")
-    
-    with tabs[4]:
-        render_enhanced_company_insights(filtered_df)
-    
-    with tabs[5]:
-        render_enhanced_prediction_analysis(df)
-    
-    with tabs[6]:
-        st.header("📋 상세 데이터 테이블")
-        
-        if not filtered_df.empty:
-            # 컬럼 선택
-            available_columns = filtered_df.columns.tolist()
-            default_columns = [col for col in ['title', 'company_name', 'job_category', 'address_region', 'join_reward'] 
-                             if col in available_columns]
-            
-            selected_columns = st.multiselect(
-                "표시할 컬럼을 선택하세요:",
-                available_columns,
-                default=default_columns
-            )
-            
-            if selected_columns:
-                display_df = filtered_df[selected_columns]
-                
-                # 페이지네이션
-                page_size = st.selectbox("페이지당 행 수", [10, 25, 50, 100], index=1)
-                total_pages = len(display_df) // page_size + (1 if len(display_df) % page_size > 0 else 0)
-                
-                if total_pages > 1:
-                    page_number = st.selectbox("페이지", range(1, total_pages + 1))
-                    start_idx = (page_number - 1) * page_size
-                    end_idx = start_idx + page_size
-                    display_df = display_df.iloc[start_idx:end_idx]
-                
-                st.dataframe(display_df, use_container_width=True, height=400)
-                
-                # 다운로드 버튼
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    csv = filtered_df.to_csv(index=False).encode('utf-8-sig')
-                    st.download_button(
-                        "📄 CSV 다운로드",
-                        csv,
-                        "rallit_jobs_filtered.csv",
-                        "text/csv"
-                    )
-                
-                with col2:
-                    json_data = filtered_df.to_json(orient='records', force_ascii=False, indent=2)
-                    st.download_button(
-                        "📄 JSON 다운로드",
-                        json_data,
-                        "rallit_jobs_filtered.json",
-                        "application/json"
-                    )
-                
-                with col3:
-                    # 요약 리포트 생성
-                    summary_report = f"""
-# 갓생라이프/커리어하이어 분석 리포트
-
-## 검색 조건
-- 필터 조건: {filter_summary}
-- 검색 결과: {len(filtered_df)}개 공고
-
-## 주요 통계
-- 참여 기업 수: {filtered_df['company_name'].nunique()}개
-- 평균 지원금: {filtered_df['join_reward'].mean():,.0f}원 (지원금 제공 공고 기준)
-- 주요 직무: {', '.join(filtered_df['job_category'].value_counts().head(3).index)}
-
-## 지역별 분포
-{filtered_df['address_region'].value_counts().head(5).to_string()}
-
-생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-                    st.download_button(
-                        "📊 요약 리포트",
-                        summary_report,
-                        "rallit_analysis_report.md",
-                        "text/markdown"
-                    )
-            else:
-                st.warning("표시할 컬럼을 선택해주세요.")
-        else:
-            st.warning("표시할 데이터가 없습니다. 필터 조건을 조정해주세요.")
+    # 페이지 구성: 선택된 페이지의 렌더링 함수만 실행
+    pages = [
+        st.Page(lambda: render_enhanced_main_summary(df, overall_metrics, data_loader.load_partition_sketches()),
+                title="메인 대시보드", icon="⭐", url_path="summary", default=True),
+        st.Page(lambda: render_enhanced_smart_matching(filtered_df, user_profile,
+                                                       AdvancedMatchingEngine(get_skill_graph(dataset_version(df), df)), df,
+                                                       filter_conditions['user_category']),
+                title="AI 스마트 매칭", icon="🎯", url_path="matching"),
+        st.Page(lambda: render_advanced_growth_path(df, user_profile, filter_conditions['user_category'],
+                                                    AdvancedMatchingEngine(get_skill_graph(dataset_version(df), df)),
+                                                    get_career_model(dataset_version(df), skill_taxonomy.version, df)),
+                title="개인 성장 경로", icon="📈", url_path="growth"),
+        st.Page(lambda: render_market_trends(df, filtered_df, data_loader.load_partition_sketches()),
+                title="시장 트렌드 분석", icon="📊", url_path="trends"),
+        st.Page(lambda: render_enhanced_company_insights(filtered_df, filtered_metrics, df),
+                title="기업 인사이트", icon="🏢", url_path="companies"),
+        st.Page(lambda: render_enhanced_prediction_analysis(df),
+                title="예측 분석", icon="🔮", url_path="prediction"),
+        st.Page(lambda: render_detail_data(filtered_df, filter_summary, filtered_metrics),
+                title="상세 데이터", icon="📋", url_path="data"),
+    ]
+    st.navigation(pages, position="top").run()
+    
+    # 압축 전송 모드: 차트별 전송 바이트 보고
+    if figure_transport.compact:
+        with st.sidebar.expander("📦 차트 전송량"):
+            report = pd.DataFrame.from_dict(figure_transport.report(), orient='index')
+            if not report.empty:
+                report['saved_rate'] = (1 - report['compact_bytes'] / report['json_bytes']) * 100
+                st.dataframe(report.sort_values('json_bytes', ascending=False), use_container_width=True)
 
 if __name__ == "__main__":
     try:
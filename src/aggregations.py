@@ -0,0 +1,119 @@
+"""
+차트 사전 집계 모듈
+히스토그램 구간/박스플롯 요약 통계를 서버에서 NumPy 로 계산하여
+원본 행 대신 고정 크기의 가벼운 트레이스만 전송
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+def _clean(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    return values[np.isfinite(values)]
+
+
+def freedman_diaconis_edges(values, max_bins: int = 60) -> np.ndarray:
+    """Freedman–Diaconis 규칙의 구간 경계 (IQR 이 0 이면 Sturges 규칙, 최대 max_bins 개)"""
+    values = _clean(values)
+    if values.size == 0:
+        return np.zeros(0)
+    low, high = float(values.min()), float(values.max())
+    if low == high:
+        return np.array([low - 0.5, high + 0.5])
+
+    q1, q3 = np.percentile(values, [25, 75])
+    width = 2 * (q3 - q1) / np.cbrt(values.size)
+    if width > 0:
+        n_bins = int(np.ceil((high - low) / width))
+    else:
+        n_bins = int(np.ceil(np.log2(values.size))) + 1
+    n_bins = min(max(n_bins, 1), max_bins)
+    return np.linspace(low, high, n_bins + 1)
+
+
+def histogram_bins(values, max_bins: int = 60) -> Dict[str, np.ndarray]:
+    """구간별 개수 (중심/폭/경계는 float32)"""
+    values = _clean(values)
+    edges = freedman_diaconis_edges(values, max_bins)
+    if edges.size == 0:
+        empty = np.zeros(0, dtype=np.float32)
+        return {'counts': np.zeros(0, dtype=np.int32), 'edges': empty, 'centers': empty, 'widths': empty}
+    counts, edges = np.histogram(values, bins=edges)
+    return {
+        'counts': counts.astype(np.int32),
+        'edges': edges.astype(np.float32),
+        'centers': ((edges[:-1] + edges[1:]) / 2).astype(np.float32),
+        'widths': np.diff(edges).astype(np.float32),
+    }
+
+
+def box_summary(values, whisker: float = 1.5, max_outliers: int = 50) -> Optional[Dict]:
+    """다섯 수치 요약 + 평균 + 이상치 (이상치는 양 끝에서 최대 max_outliers 개)"""
+    values = _clean(values)
+    if values.size == 0:
+        return None
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - whisker * iqr) & (values <= q3 + whisker * iqr)]
+    outliers = np.sort(values[(values < q1 - whisker * iqr) | (values > q3 + whisker * iqr)])
+    if outliers.size > max_outliers:
+        half = max_outliers // 2
+        outliers = np.concatenate([outliers[:half], outliers[-(max_outliers - half):]])
+    return {
+        'q1': float(q1),
+        'median': float(median),
+        'q3': float(q3),
+        'lowerfence': float(inside.min()) if inside.size else float(q1),
+        'upperfence': float(inside.max()) if inside.size else float(q3),
+        'mean': float(values.mean()),
+        'count': int(values.size),
+        'outliers': outliers.astype(np.float32),
+    }
+
+
+def histogram_trace(values, max_bins: int = 60, **trace_kwargs) -> go.Bar:
+    """사전 집계된 히스토그램 막대 트레이스"""
+    bins = histogram_bins(values, max_bins)
+    return go.Bar(
+        x=bins['centers'],
+        y=bins['counts'],
+        width=bins['widths'],
+        customdata=np.column_stack([bins['edges'][:-1], bins['edges'][1:]]) if bins['counts'].size else None,
+        **trace_kwargs
+    )
+
+
+def box_traces(groups: Dict[str, np.ndarray], colors: Optional[List[str]] = None,
+               max_outliers: int = 50) -> List:
+    """그룹별 사전 계산 박스 트레이스 + 이상치 산점 트레이스"""
+    traces = []
+    for i, (name, values) in enumerate(groups.items()):
+        summary = box_summary(values, max_outliers=max_outliers)
+        if summary is None:
+            continue
+        color = colors[i % len(colors)] if colors else None
+        traces.append(go.Box(
+            x=[name],
+            q1=[summary['q1']],
+            median=[summary['median']],
+            q3=[summary['q3']],
+            lowerfence=[summary['lowerfence']],
+            upperfence=[summary['upperfence']],
+            mean=[summary['mean']],
+            name=name,
+            marker_color=color,
+            boxpoints=False,
+        ))
+        if summary['outliers'].size:
+            traces.append(go.Scatter(
+                x=[name] * summary['outliers'].size,
+                y=summary['outliers'],
+                mode='markers',
+                name=name,
+                marker=dict(color=color, size=5),
+                showlegend=False,
+            ))
+    return traces
@@ -0,0 +1,254 @@
+"""
+배치 매칭 모듈
+N 명의 프로필을 M 개 공고 전체와 한 번에 매칭 (프로필 × 스킬 희소 행렬과 공고 × 스킬 가중치 행렬의 곱)
+프로필을 청크 단위로 처리하여 메모리를 제한하고, 프로필별 상위 k 개 추천을 Parquet/JSONL 로 저장
+
+실행: python -m src.batch_matching profiles.jsonl -o recommendations.parquet --top-k 20
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.matching_engine import AdvancedMatchingEngine
+from src.ranking import top_k
+from src.ranking_cache import GROWTH_PROFILE_FIELDS, canonical_skills
+from src.skill_canon import skill_canon
+
+logger = logging.getLogger(__name__)
+
+# 추천 결과에 함께 내보내는 공고 컬럼
+OUTPUT_POSTING_COLUMNS = ('title', 'company_name', 'job_category', 'address_region', 'join_reward')
+
+# 코호트 백분위 조회에 쓰는 프로필 필드 (없으면 전체 코호트)
+COHORT_PROFILE_FIELDS = ('job_category', 'experience_years')
+
+
+def load_profiles(path) -> List[Dict]:
+    """프로필 파일 로드 (CSV 또는 JSONL, skills 는 쉼표 구분 문자열 또는 리스트)
+
+    user_id 가 없으면 행 번호를 사용하고, 성장 프로필 필드가 없으면 0, 코호트 필드가 없으면 None 으로 본다.
+    """
+    path = Path(path)
+    if path.suffix.lower() in ('.jsonl', '.json'):
+        with open(path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    else:
+        records = pd.read_csv(path).to_dict(orient='records')
+
+    profiles = []
+    for i, record in enumerate(records):
+        skills = record.get('skills')
+        if isinstance(skills, str):
+            skills = skills.split(',')
+        elif not isinstance(skills, list):
+            skills = []  # 빈 CSV 셀(NaN) 등
+        profile = {'user_id': record.get('user_id', i), 'skills': list(canonical_skills(skills))}
+        for field in GROWTH_PROFILE_FIELDS:
+            value = record.get(field, 0)
+            profile[field] = 0 if value is None or pd.isna(value) else value
+        for field in COHORT_PROFILE_FIELDS:
+            value = record.get(field)
+            profile[field] = None if value is None or pd.isna(value) else value
+        profiles.append(profile)
+    return profiles
+
+
+def posting_skill_matrix(requirements, skill_weights: Dict[str, float]) -> Tuple[Dict[int, int], sparse.csr_matrix, np.ndarray]:
+    """공고 요구 스킬 → (정규 스킬 ID → 열 사전, 공고 × 스킬 가중치 CSR, 공고별 총 가중치)
+
+    같은 스킬이 한 공고에 여러 번 나오면 가중치가 누적된다 (skill_match_scores 와 같은 규칙).
+    """
+    weight_of = {skill_canon.intern(skill): weight for skill, weight in skill_weights.items()}
+    vocabulary: Dict[int, int] = {}
+    rows, cols, weights = [], [], []
+    for i, text in enumerate(requirements):
+        for skill_id in skill_canon.parse(text).tolist():
+            rows.append(i)
+            cols.append(vocabulary.setdefault(skill_id, len(vocabulary)))
+            weights.append(weight_of.get(skill_id, 1.0))
+
+    matrix = sparse.csr_matrix((weights, (rows, cols)), shape=(len(requirements), max(len(vocabulary), 1)))
+    total_weights = np.asarray(matrix.sum(axis=1)).ravel()
+    return vocabulary, matrix, total_weights
+
+
+def profile_skill_matrix(profiles: List[Dict], vocabulary: Dict[int, int]) -> sparse.csr_matrix:
+    """프로필 × 스킬 0/1 CSR (공고에 없는 스킬은 점수에 기여하지 않으므로 제외)"""
+    rows, cols = [], []
+    for i, profile in enumerate(profiles):
+        for skill_id in skill_canon.ids(profile['skills']).tolist():
+            col = vocabulary.get(skill_id)
+            if col is not None:
+                rows.append(i)
+                cols.append(col)
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(profiles), max(len(vocabulary), 1)))
+
+
+def score_postings(profile_matrix: sparse.csr_matrix, posting_matrix_t: sparse.csr_matrix,
+                   total_weights: np.ndarray, bonus: np.ndarray, category_codes: np.ndarray) -> np.ndarray:
+    """프로필 × 공고 스킬 매칭 점수 (가중 일치 / 총 가중치 × 100 + 카테고리 보너스, 최대 100)"""
+    weighted = (profile_matrix @ posting_matrix_t).toarray()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = weighted / total_weights * 100 + bonus[:, category_codes]
+    return np.where(total_weights > 0, np.minimum(scores, 100), 0.0)
+
+
+def select_top_k(scores: np.ndarray, growth: np.ndarray, ids: np.ndarray, matching_engine,
+                 k: int, min_score: float) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """프로필별 min_score 초과 공고 중 합격 확률 상위 k 개 (위치, 스킬 점수, 확률, 신뢰도)"""
+    probabilities, confidences = matching_engine.predict_success_arrays(scores, growth[:, None])
+    selections = []
+    for i in range(scores.shape[0]):
+        positions = top_k(probabilities[i], ids, k, within=np.flatnonzero(scores[i] > min_score))
+        selections.append((positions, scores[i, positions], probabilities[i, positions], confidences[i, positions]))
+    return selections
+
+
+class BatchMatcher:
+    """공고 행렬을 한 번 만들고 프로필 청크마다 희소 행렬 곱으로 매칭 점수 계산"""
+
+    def __init__(self, postings: pd.DataFrame, matching_engine: Optional[AdvancedMatchingEngine] = None,
+                 benchmark=None):
+        self.postings = postings.reset_index(drop=True)
+        self.engine = matching_engine or AdvancedMatchingEngine()
+        # CohortBenchmark 가 주어지면 추천 행에 프로필의 코호트 백분위를 함께 기록
+        self.benchmark = benchmark
+
+        requirements = self.postings['job_skill_keywords'].to_numpy() if 'job_skill_keywords' in self.postings.columns \
+            else np.full(len(self.postings), None)
+        self.vocabulary, self.matrix, self.total_weights = posting_skill_matrix(requirements, self.engine.skill_weights)
+        self.matrix_t = self.matrix.T.tocsr()
+
+        categories = self.postings['job_category'] if 'job_category' in self.postings.columns \
+            else pd.Series(None, index=self.postings.index)
+        self.category_codes, self.categories = pd.factorize(categories)
+        self.ids = self.postings['id'].to_numpy() if 'id' in self.postings.columns else np.arange(len(self.postings))
+
+    def category_bonus(self, profiles: List[Dict]) -> np.ndarray:
+        """프로필 × 카테고리 보너스 (마지막 열은 카테고리 없음(-1) 공고용 0)"""
+        bonus = np.zeros((len(profiles), len(self.categories) + 1))
+        for i, profile in enumerate(profiles):
+            for j, category in enumerate(self.categories):
+                bonus[i, j] = self.engine._calculate_category_bonus(profile['skills'], category)
+        return bonus
+
+    def growth_scores(self, profiles: List[Dict]) -> np.ndarray:
+        return self.engine.growth_scores(profiles)
+
+    def skill_scores(self, profiles: List[Dict]) -> np.ndarray:
+        """프로필 × 공고 스킬 매칭 점수 (skill_match_scores 의 다중 프로필 버전)"""
+        return score_postings(profile_skill_matrix(profiles, self.vocabulary), self.matrix_t,
+                              self.total_weights, self.category_bonus(profiles), self.category_codes)
+
+    def recommend(self, profiles: List[Dict], k: int = 20, min_score: float = 15) -> pd.DataFrame:
+        """프로필별 합격 확률 상위 k 개 추천 (min_score 초과 공고만, 동점은 공고 id 순)"""
+        scores = self.skill_scores(profiles)
+        growth = self.growth_scores(profiles)
+        selections = select_top_k(scores, growth, self.ids, self.engine, k, min_score)
+        return self.recommendation_frame(profiles, growth, selections)
+
+    def recommendation_frame(self, profiles: List[Dict], growth: np.ndarray, selections: List[Tuple]) -> pd.DataFrame:
+        """프로필별 (공고 위치, 스킬 점수, 합격 확률, 신뢰도) 선택 → 추천 행"""
+        columns = [col for col in OUTPUT_POSTING_COLUMNS if col in self.postings.columns]
+        cohort = self.benchmark.profile_percentiles(profiles, growth) if self.benchmark is not None else None
+        parts = []
+        for i, (profile, growth_score, (positions, scores, probabilities, confidences)) in enumerate(
+                zip(profiles, growth, selections)):
+            if not positions.size:
+                continue
+            part = self.postings.iloc[positions][columns].reset_index(drop=True)
+            part.insert(0, 'posting_id', self.ids[positions])
+            part.insert(0, 'rank', np.arange(1, positions.size + 1))
+            part.insert(0, 'user_id', profile['user_id'])
+            part['skill_score'] = scores
+            part['success_prob'] = probabilities
+            part['confidence'] = confidences
+            part['growth_score'] = growth_score
+            if cohort is not None:
+                for column in ('cohort', 'growth_percentile', 'match_score', 'match_percentile'):
+                    part[column] = cohort[column].iat[i]
+            parts.append(part)
+        return pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+    def iter_recommendations(self, profiles: List[Dict], k: int = 20, min_score: float = 15,
+                             chunk_size: int = 1000) -> Iterator[pd.DataFrame]:
+        """chunk_size 명씩 추천 (청크당 점수 행렬 chunk_size × M 만 메모리에 유지)"""
+        for start in range(0, len(profiles), chunk_size):
+            chunk = self.recommend(profiles[start:start + chunk_size], k, min_score)
+            logger.info(f"Scored profiles {start + 1}-{min(start + chunk_size, len(profiles))} of {len(profiles)}")
+            if not chunk.empty:
+                yield chunk
+
+
+def write_recommendations(chunks: Iterator[pd.DataFrame], path) -> int:
+    """추천 청크를 확장자에 맞춰 순차 저장 (.parquet 또는 .jsonl), 저장한 행 수 반환"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    total = 0
+
+    if path.suffix.lower() == '.parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+                total += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        return total
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            text = chunk.to_json(orient='records', lines=True, force_ascii=False)
+            f.write(text if text.endswith('\n') else text + '\n')
+            total += len(chunk)
+    return total
+
+
+def main(argv: Optional[List[str]] = None):
+    """오프라인 실행 진입점: 프로필 파일 → 프로필별 상위 k 개 추천 파일"""
+    from src.data_loader import DataLoader
+
+    parser = argparse.ArgumentParser(description="프로필 일괄 매칭 (야간 추천 메일용)")
+    parser.add_argument('profiles', help="프로필 CSV 또는 JSONL (skills, recent_courses, project_count, github_contributions)")
+    parser.add_argument('-o', '--output', default='recommendations.parquet', help="출력 경로 (.parquet 또는 .jsonl)")
+    parser.add_argument('-k', '--top-k', type=int, default=20)
+    parser.add_argument('--min-score', type=float, default=15)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--cohorts', action='store_true',
+                        help="프로필의 코호트(직무 카테고리 × 경력 구간) 백분위를 함께 기록")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    postings = DataLoader().load_postings()
+    if postings.empty:
+        logger.error("No postings to match")
+        return
+
+    benchmark = None
+    if args.cohorts:
+        from src.cohort_benchmark import CohortBenchmark
+        benchmark = CohortBenchmark(postings)
+    matcher = BatchMatcher(postings, benchmark=benchmark)
+    profiles = load_profiles(args.profiles)
+    written = write_recommendations(
+        matcher.iter_recommendations(profiles, args.top_k, args.min_score, args.chunk_size), args.output
+    )
+    print(f"{written} recommendations for {len(profiles)} profiles → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+커리어 경로 마이닝 모듈
+공고 코퍼스에서 (직무 카테고리, 직급)별 lift 상위 스킬을 오프라인으로 추출하고
+스냅샷마다 변경된 공고만 반영하여 사전 계산 테이블을 갱신
+
+실행: python -m src.career_mining
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.precomputed import PrecomputedStore, precomputed_store
+from src.utils import posting_hashes, source_version
+
+logger = logging.getLogger(__name__)
+
+ALL = '*'
+
+# rallit 직급 → 성장 경로 단계
+LEVEL_STAGES = {
+    'INTERN': 'entry_level',
+    'BEGINNER': 'entry_level',
+    'JUNIOR': 'junior_level',
+    'MIDDLE': 'senior_level',
+    'SENIOR': 'senior_level',
+    'TOP': 'lead_level',
+}
+
+HASH_COLUMNS = ['job_category', 'job_level', 'job_levels', 'job_skill_keywords']
+
+
+def _split(values: pd.Series) -> pd.Series:
+    return values.fillna('').astype(str).str.split(',')
+
+
+def posting_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """공고를 (id, 카테고리, 직급, 스킬) 행으로 전개 (직급은 job_levels 우선)"""
+    if df.empty:
+        return pd.DataFrame(columns=['id', 'job_category', 'job_level', 'skill'])
+    levels = df['job_levels'] if 'job_levels' in df.columns else df.get('job_level', pd.Series('', index=df.index))
+    if 'job_level' in df.columns:
+        levels = levels.where(levels.notna() & (levels.astype(str).str.strip() != ''), df['job_level'])
+    rows = pd.DataFrame({
+        'id': df['id'].to_numpy(),
+        'job_category': df['job_category'].astype(str).to_numpy(),
+        'job_level': _split(levels).to_numpy(),
+        'skill': _split(df.get('job_skill_keywords', pd.Series('', index=df.index))).to_numpy(),
+    })
+    rows = rows.explode('job_level').explode('skill')
+    rows['job_level'] = rows['job_level'].str.strip().str.upper()
+    rows['skill'] = rows['skill'].str.strip()
+    return rows.reset_index(drop=True)
+
+
+def count_rows(rows: pd.DataFrame) -> pd.DataFrame:
+    """전개된 행에서 공고 수 집계 (직급/스킬 '*' 는 전체 합계)"""
+    if rows.empty:
+        return pd.DataFrame(columns=['job_category', 'job_level', 'skill', 'count'])
+    with_skill = rows[rows['skill'] != '']
+    parts = [
+        with_skill.drop_duplicates(['id', 'job_category', 'job_level', 'skill'])
+                  .groupby(['job_category', 'job_level', 'skill']).size().rename('count').reset_index(),
+        rows.drop_duplicates(['id', 'job_category', 'job_level'])
+            .groupby(['job_category', 'job_level']).size().rename('count').reset_index().assign(skill=ALL),
+        with_skill.drop_duplicates(['id', 'job_category', 'skill'])
+                  .groupby(['job_category', 'skill']).size().rename('count').reset_index().assign(job_level=ALL),
+        rows.drop_duplicates(['id', 'job_category'])
+            .groupby('job_category').size().rename('count').reset_index().assign(job_level=ALL, skill=ALL),
+    ]
+    return pd.concat(parts, ignore_index=True)[['job_category', 'job_level', 'skill', 'count']]
+
+
+def compute_lift_table(counts: pd.DataFrame, min_support: int = 2, top_n: int = 8) -> pd.DataFrame:
+    """(카테고리, 직급)별 lift 순위 스킬 테이블
+
+    lift = P(스킬 | 카테고리, 직급) / P(스킬 | 카테고리)
+    """
+    columns = ['job_category', 'job_level', 'skill', 'support', 'confidence', 'lift', 'rank']
+    if counts.empty:
+        return pd.DataFrame(columns=columns)
+    keyed = counts.set_index(['job_category', 'job_level', 'skill'])['count']
+
+    level_skill = counts[(counts['job_level'] != ALL) & (counts['skill'] != ALL)]
+    level_skill = level_skill[level_skill['count'] >= min_support]
+    if level_skill.empty:
+        return pd.DataFrame(columns=columns)
+
+    level_totals = keyed.xs(ALL, level='skill').drop(ALL, level='job_level', errors='ignore')
+    category_skill = keyed.xs(ALL, level='job_level').drop(ALL, level='skill', errors='ignore')
+    category_totals = keyed.xs((ALL, ALL), level=('job_level', 'skill'))
+
+    table = level_skill.rename(columns={'count': 'support'}).copy()
+    level_index = pd.MultiIndex.from_frame(table[['job_category', 'job_level']])
+    skill_index = pd.MultiIndex.from_frame(table[['job_category', 'skill']])
+    table['confidence'] = table['support'].to_numpy() / level_totals.reindex(level_index).to_numpy()
+    baseline = category_skill.reindex(skill_index).to_numpy() / category_totals.reindex(table['job_category']).to_numpy()
+    table['lift'] = table['confidence'] / baseline
+
+    table = table.sort_values(['job_category', 'job_level', 'lift', 'support', 'skill'],
+                              ascending=[True, True, False, False, True])
+    table['rank'] = table.groupby(['job_category', 'job_level']).cumcount() + 1
+    table = table[table['rank'] <= top_n]
+    table[['confidence', 'lift']] = table[['confidence', 'lift']].round(4)
+    return table[columns].reset_index(drop=True)
+
+
+class CareerPathMiner:
+    """스냅샷 단위 증분 커리어 경로 마이닝"""
+
+    TABLE = 'career_skill_lift'
+
+    def __init__(self, store: Optional[PrecomputedStore] = None, min_support: int = 2, top_n: int = 8):
+        self.store = store or precomputed_store
+        self.min_support = min_support
+        self.top_n = top_n
+
+    def is_current(self, df: pd.DataFrame) -> bool:
+        """저장된 테이블이 현재 원천 공고 버전 기준인지 확인"""
+        return self.store.load_meta(self.TABLE).get('source_version') == source_version(df, HASH_COLUMNS)
+
+    def update(self, df: pd.DataFrame) -> Dict:
+        """새 스냅샷 반영: 추가/변경/삭제된 공고의 집계 변화량만 적용"""
+        hashes = posting_hashes(df, HASH_COLUMNS).astype(str)
+        previous = self.store.load_table('career_postings')
+        previous_rows = self.store.load_table('career_posting_rows')
+        counts = self.store.load_table('career_counts')
+
+        if previous is None or previous_rows is None or counts is None:
+            previous = pd.DataFrame(columns=['id', 'content_hash'])
+            previous_rows = pd.DataFrame(columns=['id', 'job_category', 'job_level', 'skill'])
+            counts = pd.DataFrame(columns=['job_category', 'job_level', 'skill', 'count'])
+
+        previous_hashes = pd.Series(previous['content_hash'].astype(str).to_numpy(),
+                                    index=previous['id'].astype(str).to_numpy())
+        current_ids = hashes.index.astype(str)
+        unchanged = previous_hashes.reindex(current_ids).to_numpy() == hashes.to_numpy()
+        added_ids = set(current_ids[~unchanged])
+        removed_ids = (set(previous_hashes.index) - set(current_ids)) | (added_ids & set(previous_hashes.index))
+
+        previous_rows = previous_rows.assign(id=previous_rows['id'].astype(str))
+        removed_rows = previous_rows[previous_rows['id'].isin(removed_ids)]
+        added_rows = posting_rows(df[df['id'].astype(str).isin(added_ids)])
+        added_rows['id'] = added_rows['id'].astype(str)
+
+        key = ['job_category', 'job_level', 'skill']
+        delta = pd.concat([
+            count_rows(added_rows).set_index(key)['count'],
+            -count_rows(removed_rows).set_index(key)['count'],
+        ])
+        merged = pd.concat([counts.set_index(key)['count'].astype('int64'), delta]).groupby(level=key).sum()
+        counts = merged[merged > 0].rename('count').reset_index()
+
+        rows = pd.concat([previous_rows[~previous_rows['id'].isin(removed_ids)], added_rows], ignore_index=True)
+        table = compute_lift_table(counts, self.min_support, self.top_n)
+
+        self.store.save_table('career_postings', pd.DataFrame({'id': current_ids, 'content_hash': hashes.to_numpy()}))
+        self.store.save_table('career_posting_rows', rows)
+        self.store.save_table('career_counts', counts)
+        self.store.save_table(self.TABLE, table)
+        summary = {
+            'source_version': source_version(df, HASH_COLUMNS),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'added_or_changed': len(added_ids),
+            'removed': len(removed_ids - added_ids),
+            'rows': len(table),
+        }
+        self.store.save_meta(self.TABLE, summary)
+        logger.info(f"Career path mining updated: {summary}")
+        return summary
+
+    def load_table(self) -> pd.DataFrame:
+        table = self.store.load_table(self.TABLE)
+        return table if table is not None else compute_lift_table(pd.DataFrame())
+
+
+def mined_career_paths(table: pd.DataFrame, fallback: Dict[str, Dict[str, List[str]]],
+                       per_stage: int = 4) -> Dict[str, Dict[str, List[str]]]:
+    """lift 테이블을 성장 경로 형태({카테고리: {단계: [스킬]}})로 색인
+
+    데이터가 없는 단계는 fallback(정적 경로)으로 채운다.
+    """
+    paths = {category: {stage: list(skills) for stage, skills in stages.items()}
+             for category, stages in fallback.items()}
+    if table is None or table.empty:
+        return paths
+
+    table = table.assign(stage=table['job_level'].map(LEVEL_STAGES)).dropna(subset=['stage'])
+    table = table.sort_values(['job_category', 'stage', 'lift', 'support'], ascending=[True, True, False, False])
+    for (category, stage), group in table.groupby(['job_category', 'stage'], sort=False):
+        skills = list(dict.fromkeys(group['skill']))[:per_stage]
+        if skills:
+            paths.setdefault(category, {})[stage] = skills
+    return paths
+
+
+def main():
+    """오프라인 실행 진입점: 현재 데이터로 테이블 갱신"""
+    from src.data_loader import DataLoader
+
+    logging.basicConfig(level=logging.INFO)
+    df = DataLoader().load_postings()
+    if df.empty:
+        logger.error("No data to mine")
+        return
+    print(CareerPathMiner().update(df))
+
+
+if __name__ == '__main__':
+    main()
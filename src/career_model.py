@@ -0,0 +1,138 @@
+"""
+커리어 경로 모델 모듈
+레벨별 요구 스킬을 스킬 ID 로 한 번만 해석하고 희소 행렬로 컴파일하여
+레벨 평가/완성도/다음 스킬 추천을 벡터 연산으로 계산
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from src.skill_canon import SkillCanon, skill_canon
+
+LEVEL_ORDER = ['entry_level', 'junior_level', 'senior_level', 'lead_level']
+
+LEVEL_NAMES = {
+    'entry_level': '입문자',
+    'junior_level': '주니어',
+    'senior_level': '시니어',
+    'lead_level': '리드/매니저'
+}
+
+
+def _requirement_ids(requirement: str, canon: SkillCanon) -> List[int]:
+    """요구 스킬 표기 → 정규 스킬 ID 목록
+
+    정규 스킬로 등록된 표기('HTML/CSS')는 그대로, 아니면 '/' 로 나눈 각 스킬('React/Vue' → React, Vue) 중 하나면 충족.
+    """
+    if '/' not in requirement or canon.lookup(requirement) >= 0:
+        parts = [requirement]
+    else:
+        parts = [part for part in requirement.split('/') if part.strip()]
+    found = {canon.intern(part) for part in parts}
+    found.discard(-1)
+    return sorted(found)
+
+
+class CompiledCareerModel:
+    """카테고리별 (요구 스킬 × 정규 스킬 ID) 희소 행렬로 컴파일된 커리어 경로"""
+
+    def __init__(self, career_paths: Dict[str, Dict[str, List[str]]], canon: Optional[SkillCanon] = None):
+        self.career_paths = career_paths
+        self.canon = canon or skill_canon
+        self._categories: Dict[str, Dict] = {}
+
+        for category, levels in career_paths.items():
+            requirements, req_levels, rows, cols = [], [], [], []
+            for level_index, level in enumerate(LEVEL_ORDER):
+                for requirement in levels.get(level, []):
+                    row = len(requirements)
+                    requirements.append(requirement)
+                    req_levels.append(level_index)
+                    for skill_id in _requirement_ids(requirement, self.canon):
+                        rows.append(row)
+                        cols.append(skill_id)
+            self._categories[category] = {
+                'requirements': requirements,
+                'req_levels': np.asarray(req_levels, dtype=np.int64),
+                'rows': rows,
+                'cols': cols,
+            }
+
+        # 요구 스킬 등록이 끝난 뒤 행렬 생성 (열 = 정규 스킬 ID)
+        self.n_skills = len(self.canon)
+        for compiled in self._categories.values():
+            n_reqs = len(compiled['requirements'])
+            data = np.ones(len(compiled['rows']), dtype=np.float32)
+            compiled['matrix'] = sparse.csr_matrix(
+                (data, (compiled.pop('rows'), compiled.pop('cols'))), shape=(n_reqs, self.n_skills)
+            )
+            compiled['level_totals'] = np.bincount(compiled['req_levels'], minlength=len(LEVEL_ORDER))
+
+    def skill_vector(self, user_skills: List[str]) -> np.ndarray:
+        """사용자 스킬 벡터 (정규 스킬 ID 정확 일치, 0/1 배열)"""
+        vector = np.zeros(self.n_skills, dtype=np.float32)
+        ids = self.canon.ids(user_skills)
+        vector[ids[ids < self.n_skills]] = 1.0
+        return vector
+
+    def evaluate(self, user_skills: List[str], category: str) -> Dict:
+        """요구 스킬 충족 여부와 레벨별 완성도를 한 번의 행렬-벡터 곱으로 계산"""
+        compiled = self._categories.get(category)
+        if compiled is None:
+            return {'requirements': [], 'satisfied': np.zeros(0, dtype=bool),
+                    'req_levels': np.zeros(0, dtype=np.int64),
+                    'completed': np.zeros(len(LEVEL_ORDER), dtype=np.int64),
+                    'totals': np.zeros(len(LEVEL_ORDER), dtype=np.int64),
+                    'completion': np.zeros(len(LEVEL_ORDER))}
+
+        satisfied = (compiled['matrix'] @ self.skill_vector(user_skills)) > 0
+        completed = np.bincount(compiled['req_levels'], weights=satisfied, minlength=len(LEVEL_ORDER)).astype(np.int64)
+        totals = compiled['level_totals']
+        completion = np.divide(completed, totals, out=np.zeros(len(LEVEL_ORDER)), where=totals > 0)
+        return {
+            'requirements': compiled['requirements'],
+            'satisfied': satisfied,
+            'req_levels': compiled['req_levels'],
+            'completed': completed,
+            'totals': totals,
+            'completion': completion,
+        }
+
+    def current_level(self, evaluation: Dict, threshold: float = 0.7) -> str:
+        """완성도가 threshold 이상인 가장 높은 레벨"""
+        for level_index in range(len(LEVEL_ORDER) - 1, -1, -1):
+            if evaluation['completion'][level_index] >= threshold:
+                return LEVEL_ORDER[level_index]
+        return 'entry_level'
+
+    def next_skills(self, evaluation: Dict, current_level: str, limit: int = 5) -> List[str]:
+        """현재 레벨의 미충족 스킬(최대 3) + 다음 레벨 스킬(최대 3)"""
+        requirements = evaluation['requirements']
+        level_index = LEVEL_ORDER.index(current_level)
+        req_levels = evaluation['req_levels']
+
+        missing = np.flatnonzero((req_levels == level_index) & ~evaluation['satisfied'])
+        recommendations = [requirements[i] for i in missing[:3]]
+        if level_index < len(LEVEL_ORDER) - 1:
+            upcoming = np.flatnonzero(req_levels == level_index + 1)
+            recommendations.extend(requirements[i] for i in upcoming[:3])
+        return recommendations[:limit]
+
+    def roadmap(self, evaluation: Dict) -> List[Dict]:
+        """레벨별 로드맵 (완성도 포함)"""
+        requirements = evaluation['requirements']
+        roadmap = []
+        for level_index, level in enumerate(LEVEL_ORDER):
+            total = int(evaluation['totals'][level_index])
+            if not total:
+                continue
+            roadmap.append({
+                'level': LEVEL_NAMES.get(level, level),
+                'skills': [requirements[i] for i in np.flatnonzero(evaluation['req_levels'] == level_index)],
+                'completion_rate': float(evaluation['completion'][level_index] * 100),
+                'completed_skills': int(evaluation['completed'][level_index]),
+                'total_skills': total
+            })
+        return roadmap
@@ -0,0 +1,232 @@
+"""
+코호트 벤치마크 모듈
+(직무 카테고리, 경력 구간) 코호트별 성장 잠재력·매칭 점수 분포를 정렬 배열로 보관하고
+"상위 15%" 같은 백분위를 이분 탐색(searchsorted)으로 O(log n) 조회
+
+모든 코호트를 (코호트 번호 × SPAN + 점수) 하나의 정렬 배열에 이어 붙여 두므로
+서로 다른 코호트에 속한 여러 프로필도 searchsorted 한 번으로 한꺼번에 조회 (배치 API)
+
+모집단은 저장된 프로필 또는 공고 스킬 분포에서 뽑은 가상 프로필 (시드 고정, 같은 데이터면 같은 분포)
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.batch_matching import BatchMatcher
+from src.matching_engine import AdvancedMatchingEngine
+from src.skill_canon import skill_canon
+
+logger = logging.getLogger(__name__)
+
+ALL = '*'
+METRICS = ('growth', 'match')
+
+# 경력 구간 (하한 연차, 표시 이름)
+EXPERIENCE_BANDS: List[Tuple[int, str]] = [(0, '0-2년'), (3, '3-5년'), (6, '6-9년'), (10, '10년+')]
+
+# 가상 프로필 분포 (경력 구간별 평균 스킬 수 / 연간 강의 수 / 프로젝트 수 / GitHub 기여)
+SYNTHETIC_PROFILE_MEANS = {
+    'skills': [3.0, 4.5, 6.0, 7.0],
+    'recent_courses': [3.0, 2.0, 1.5, 1.0],
+    'project_count': [1.5, 3.0, 4.0, 5.0],
+    'github_contributions': [30.0, 60.0, 80.0, 80.0],
+}
+GITHUB_ACTIVE_RATE = 0.6
+
+# 매칭 점수 = 자기 카테고리 공고 중 상위 TOP_MATCHES 개 평균 (최고 1개는 요구 스킬이 적은 공고에서 쉽게 100점이 됨)
+TOP_MATCHES = 10
+
+# 점수는 0~100 이므로 코호트 번호 × SPAN 을 더하면 코호트끼리 겹치지 않음
+SPAN = 1000.0
+
+
+def experience_bands(experience_years) -> np.ndarray:
+    """경력 연차 배열 → 경력 구간 번호 (값이 없으면 전체 구간 = len(EXPERIENCE_BANDS))"""
+    years = pd.to_numeric(pd.Series(np.asarray(experience_years, dtype=object)), errors='coerce').to_numpy()
+    lowers = np.array([lower for lower, _ in EXPERIENCE_BANDS], dtype=np.float64)
+    bands = np.clip(np.searchsorted(lowers, np.nan_to_num(years), side='right') - 1, 0, len(lowers) - 1)
+    return np.where(np.isnan(years), len(lowers), bands)
+
+
+def top_match_scores(scores: np.ndarray, posting_categories: np.ndarray, profile_categories,
+                     k: int = TOP_MATCHES) -> np.ndarray:
+    """프로필 × 공고 점수 행렬 → 프로필별 자기 직무 카테고리 공고 중 상위 k 개 평균 점수 (카테고리가 없으면 전체 공고)"""
+    posting_categories = np.asarray(posting_categories, dtype=object)
+    profile_categories = np.asarray(profile_categories, dtype=object)
+    top = np.zeros(scores.shape[0])
+    for category in pd.unique(profile_categories):
+        rows = np.flatnonzero(profile_categories == category)
+        columns = np.flatnonzero(posting_categories == category) if category != ALL else np.arange(scores.shape[1])
+        if not columns.size:
+            continue
+        block = scores[np.ix_(rows, columns)]
+        n = min(k, columns.size)
+        top[rows] = np.partition(block, columns.size - n, axis=1)[:, columns.size - n:].mean(axis=1)
+    return top
+
+
+def synthetic_profiles(postings: pd.DataFrame, profiles_per_cohort: int = 300, seed: int = 42) -> List[Dict]:
+    """직무 카테고리 × 경력 구간별 가상 프로필 (스킬은 해당 카테고리 공고의 스킬 언급 빈도에 비례하여 추출)"""
+    rng = np.random.default_rng(seed)
+    categories = postings['job_category'].astype(str) if 'job_category' in postings.columns \
+        else pd.Series(ALL, index=postings.index)
+    requirements = postings['job_skill_keywords'] if 'job_skill_keywords' in postings.columns \
+        else pd.Series(None, index=postings.index)
+
+    profiles = []
+    for category in sorted(categories.unique()):
+        counts = skill_canon.skill_counts(requirements[categories == category])
+        if counts.empty:
+            continue
+        skill_ids = counts.index.to_numpy()
+        weights = counts.to_numpy() / counts.sum()
+        for band, (lower, _) in enumerate(EXPERIENCE_BANDS):
+            upper = EXPERIENCE_BANDS[band + 1][0] if band + 1 < len(EXPERIENCE_BANDS) else lower + 6
+            n_skills = np.clip(rng.poisson(SYNTHETIC_PROFILE_MEANS['skills'][band], profiles_per_cohort),
+                               1, skill_ids.size)
+            courses = rng.poisson(SYNTHETIC_PROFILE_MEANS['recent_courses'][band], profiles_per_cohort)
+            projects = rng.poisson(SYNTHETIC_PROFILE_MEANS['project_count'][band], profiles_per_cohort)
+            github = np.where(rng.random(profiles_per_cohort) < GITHUB_ACTIVE_RATE,
+                              np.rint(rng.exponential(SYNTHETIC_PROFILE_MEANS['github_contributions'][band],
+                                                      profiles_per_cohort)), 0)
+            years = rng.integers(lower, upper, profiles_per_cohort)
+            for i in range(profiles_per_cohort):
+                chosen = rng.choice(skill_ids, size=n_skills[i], replace=False, p=weights)
+                profiles.append({
+                    'user_id': f"synthetic-{category}-{band}-{i}",
+                    'skills': [skill_canon.label(skill_id) for skill_id in chosen],
+                    'recent_courses': int(courses[i]),
+                    'project_count': int(projects[i]),
+                    'github_contributions': int(github[i]),
+                    'job_category': category,
+                    'experience_years': int(years[i]),
+                })
+    return profiles
+
+
+class CohortBenchmark:
+    """코호트별 점수 정렬 배열 (성장 잠재력 / 자기 카테고리 상위 공고 평균 매칭 점수)
+
+    코호트는 (카테고리, 경력 구간) 과 그 합계 (카테고리, 전체), (전체, 경력 구간), (전체, 전체).
+    표본이 min_cohort_size 보다 작은 코호트는 조회 시 같은 카테고리 전체 → 같은 경력 전체 → 전체 순으로 대체한다.
+    """
+
+    def __init__(self, postings: pd.DataFrame, matching_engine: Optional[AdvancedMatchingEngine] = None,
+                 profiles: Optional[List[Dict]] = None, profiles_per_cohort: int = 300, seed: int = 42,
+                 min_cohort_size: int = 30, chunk_size: int = 1000):
+        self.matcher = BatchMatcher(postings, matching_engine)
+        self.engine = self.matcher.engine
+        self.min_cohort_size = min_cohort_size
+        self.posting_categories = self.matcher.postings['job_category'].astype(str).to_numpy() \
+            if 'job_category' in self.matcher.postings.columns else np.full(len(self.matcher.postings), ALL)
+
+        if profiles is None:
+            profiles = synthetic_profiles(self.matcher.postings, profiles_per_cohort, seed)
+        categories = np.array([self._category(profile.get('job_category')) for profile in profiles], dtype=object)
+        bands = experience_bands([profile.get('experience_years') for profile in profiles])
+
+        growth = self.matcher.growth_scores(profiles)
+        match = np.concatenate([
+            self.match_scores(profiles[start:start + chunk_size], categories[start:start + chunk_size])
+            for start in range(0, len(profiles), chunk_size)
+        ]) if profiles else np.zeros(0)
+
+        self.categories = sorted(set(categories.tolist()) - {ALL}) + [ALL]
+        self._build({'growth': growth, 'match': match}, categories, bands)
+        logger.info(f"Cohort benchmark: {len(profiles)} profiles, {len(self.cohorts)} cohorts")
+
+    @staticmethod
+    def _category(category) -> str:
+        return ALL if category is None or category == '전체' or pd.isna(category) else str(category)
+
+    def _build(self, scores: Dict[str, np.ndarray], categories: np.ndarray, bands: np.ndarray):
+        """코호트별 정렬 배열을 하나로 이어 붙이고, 코호트 대체 규칙을 (카테고리, 경력 구간) 표로 미리 계산"""
+        n_bands = len(EXPERIENCE_BANDS)
+        self.cohorts: List[Tuple[str, int]] = [(category, band) for category in self.categories
+                                               for band in range(n_bands + 1)]
+        members = [((categories == category) | (category == ALL)) & ((bands == band) | (band == n_bands))
+                   for category, band in self.cohorts]
+        self.sizes = np.array([mask.sum() for mask in members], dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(self.sizes)])
+        self.values: Dict[str, np.ndarray] = {}
+        for metric in METRICS:
+            values = np.clip(scores[metric], 0, 100)
+            self.values[metric] = np.concatenate([np.sort(values[mask]) + i * SPAN for i, mask in enumerate(members)])
+
+        # (카테고리, 경력 구간) → 실제 조회할 코호트 번호
+        index = {cohort: i for i, cohort in enumerate(self.cohorts)}
+        self._resolve = np.zeros((len(self.categories), n_bands + 1), dtype=np.int64)
+        for c, category in enumerate(self.categories):
+            for band in range(n_bands + 1):
+                for candidate in ((category, band), (category, n_bands), (ALL, band), (ALL, n_bands)):
+                    if self.sizes[index[candidate]] >= self.min_cohort_size or candidate == (ALL, n_bands):
+                        self._resolve[c, band] = index[candidate]
+                        break
+        self._category_codes = pd.Index(self.categories)
+
+    def cohort_indices(self, categories, experience_years) -> np.ndarray:
+        """프로필별 조회 코호트 번호 (모르는 카테고리는 전체 카테고리)"""
+        categories = [self._category(category) for category in np.atleast_1d(np.asarray(categories, dtype=object))]
+        codes = self._category_codes.get_indexer(categories)
+        codes = np.where(codes < 0, len(self.categories) - 1, codes)
+        return self._resolve[codes, experience_bands(np.atleast_1d(np.asarray(experience_years, dtype=object)))]
+
+    def percentiles(self, metric: str, scores, categories=None, experience_years=None) -> np.ndarray:
+        """점수별 코호트 백분위 (코호트에서 점수가 더 낮은 비율, 동점은 절반으로 셈, 0~100)
+
+        상위 비율은 100 - 백분위. categories / experience_years 가 없으면 전체 코호트.
+        """
+        scores = np.clip(np.atleast_1d(np.asarray(scores, dtype=np.float64)), 0, 100)
+        if categories is None:
+            categories = np.full(scores.size, ALL, dtype=object)
+        if experience_years is None:
+            experience_years = np.full(scores.size, np.nan)
+        cohorts = np.broadcast_to(self.cohort_indices(categories, experience_years), scores.shape)
+
+        values = self.values[metric]
+        keys = cohorts * SPAN + scores
+        below = np.searchsorted(values, keys, side='left')
+        ties = np.searchsorted(values, keys, side='right') - below
+        sizes = self.sizes[cohorts]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(sizes > 0, (below - self.offsets[cohorts] + 0.5 * ties) / sizes * 100, np.nan)
+
+    def match_scores(self, profiles: List[Dict], categories=None) -> np.ndarray:
+        """프로필별 매칭 점수 (자기 직무 카테고리 공고 중 상위 TOP_MATCHES 개 스킬 매칭 점수 평균)"""
+        if categories is None:
+            categories = [self._category(profile.get('job_category')) for profile in profiles]
+        return top_match_scores(self.matcher.skill_scores(profiles), self.posting_categories, categories)
+
+    def profile_percentiles(self, profiles: List[Dict], growth: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """프로필별 성장 잠재력·매칭 점수와 코호트 백분위 (job_category, experience_years 가 없으면 전체 코호트)"""
+        categories = [self._category(profile.get('job_category')) for profile in profiles]
+        years = [profile.get('experience_years') for profile in profiles]
+        growth = self.matcher.growth_scores(profiles) if growth is None else np.asarray(growth, dtype=np.float64)
+        match = self.match_scores(profiles, categories)
+        cohorts = self.cohort_indices(categories, years)
+        return pd.DataFrame({
+            'user_id': [profile.get('user_id') for profile in profiles],
+            'cohort': [self.cohort_label(i) for i in cohorts],
+            'growth_score': growth,
+            'growth_percentile': self.percentiles('growth', growth, categories, years),
+            'match_score': match,
+            'match_percentile': self.percentiles('match', match, categories, years),
+        })
+
+    def cohort_label(self, cohort: int) -> str:
+        """코호트 표시 이름 ("DEVELOPER · 3-5년", "전체")"""
+        category, band = self.cohorts[cohort]
+        parts = [category] if category != ALL else []
+        if band < len(EXPERIENCE_BANDS):
+            parts.append(EXPERIENCE_BANDS[band][1])
+        return ' · '.join(parts) or '전체'
+
+
+def top_percent_label(percentile: float) -> str:
+    """백분위 → "상위 15%" (1% 미만은 상위 1%)"""
+    if percentile is None or np.isnan(percentile):
+        return '-'
+    return f"상위 {max(1, int(np.ceil(100 - percentile)))}%"
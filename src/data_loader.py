@@ -113,6 +113,10 @@ class DataLoader:
             logger.error(f"CSV loading error: {str(e)}")
             return pd.DataFrame()
     
+    def load_postings(self):
+        """원천 공고 로드 (CSV 원본 그대로, 엔리치먼트 없음) - 오프라인 사전 계산/배치 CLI 용"""
+        return self._load_from_csv_fallback()
+    
     def _create_database_from_csv(self):
         """CSV 파일로부터 SQLite 데이터베이스 생성"""
         try:
@@ -177,20 +181,21 @@ class DataLoader:
         if df.empty:
             return {}
         
+        from src.metrics import metrics_engines
+        metrics = metrics_engines.get(df).metrics()
+        
         stats = {
-            'total_jobs': len(df),
-            'unique_companies': df['company_name'].nunique(),
-            'categories': df['job_category'].value_counts().to_dict(),
-            'regions': df['address_region'].value_counts().head(10).to_dict(),
-            'hiring_count': len(df[df['status_code'] == 'HIRING']),
-            'partner_count': len(df[df['is_partner'] == 1])
+            'total_jobs': metrics['total_jobs'],
+            'unique_companies': metrics['unique_companies'],
+            'categories': metrics['category_counts'],
+            'regions': dict(list(metrics['region_counts'].items())[:10]),
+            'hiring_count': metrics['active_jobs'],
+            'partner_count': metrics['partner_count']
         }
         
-        if 'join_reward' in df.columns:
-            reward_df = df[df['join_reward'] > 0]
-            if not reward_df.empty:
-                stats['avg_reward'] = reward_df['join_reward'].mean()
-                stats['max_reward'] = reward_df['join_reward'].max()
+        if metrics['reward_job_count']:
+            stats['avg_reward'] = metrics['avg_positive_reward']
+            stats['max_reward'] = metrics['max_positive_reward']
         
         return stats
     
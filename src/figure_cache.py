@@ -0,0 +1,83 @@
+"""
+차트 캐시 모듈
+(차트 ID, 데이터셋 버전·선택 행, 필터/프로필 지문) 단위로 생성된 Plotly Figure 를 LRU 로 보관하여
+바뀌지 않은 차트는 집계와 Figure 생성을 건너뛰고 그대로 다시 전송
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from src.utils import dataset_version, filter_fingerprint, frame_fingerprint
+
+_MISSING = object()
+
+
+class FigureCache:
+    """Figure LRU 캐시 (캐시된 Figure 는 공유되므로 반환 후 수정하지 않는다)"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(chart_id: str, df: Optional[pd.DataFrame] = None, **params) -> str:
+        """차트 키: 차트 ID + 프레임 지문(버전·행 구성) + 정규화된 파라미터 지문"""
+        frame_part = '-'
+        if df is not None:
+            dataset_version(df)  # 버전이 없는 임의 프레임은 내용 해시로 버전 부여
+            frame_part = frame_fingerprint(df)
+        return f"{chart_id}|{frame_part}|{filter_fingerprint(params)}"
+
+    def get_or_build(self, chart_id: str, build: Callable[[], Any],
+                     df: Optional[pd.DataFrame] = None, **params) -> Any:
+        """캐시된 Figure 반환, 없으면 build() 결과(None 포함)를 저장 후 반환"""
+        key = self.make_key(chart_id, df, **params)
+        with self._lock:
+            cached = self._entries.get(key, _MISSING)
+            if cached is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        figure = build()
+
+        with self._lock:
+            self._entries[key] = figure
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+def cached_figure(chart_id: str):
+    """df 를 첫 인자로 받는 차트 생성 메서드용 데코레이터 (인스턴스의 figure_cache 사용)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, df, *args, **kwargs):
+            cache = getattr(self, 'figure_cache', None)
+            if cache is None:
+                return method(self, df, *args, **kwargs)
+            return cache.get_or_build(chart_id, lambda: method(self, df, *args, **kwargs),
+                                      df, args=args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# 전역 차트 캐시 인스턴스
+figure_cache = FigureCache()
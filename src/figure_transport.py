@@ -0,0 +1,117 @@
+"""
+차트 전송 모듈
+선택적으로 Figure 를 압축 형태(typed array 인코딩, 템플릿 제거, orjson 인코더)로 바꿔 전송하고
+차트별 전송 바이트를 기록
+
+활성화: 환경 변수 RALLIT_COMPACT_CHARTS=1
+"""
+
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# typed array 로 바꿀 트레이스 속성 (숫자 배열만 변환)
+ARRAY_ATTRIBUTES = ('x', 'y', 'z', 'r', 'values', 'width', 'customdata')
+MIN_ARRAY_LENGTH = 8
+
+
+def _typed_array(values) -> Optional[np.ndarray]:
+    """숫자 리스트/배열을 int32 또는 float32 배열로 (변환 불가 시 None)"""
+    if values is None or isinstance(values, str):
+        return None
+    try:
+        array = np.asarray(values)
+    except (TypeError, ValueError):
+        return None
+    if array.size < MIN_ARRAY_LENGTH or array.dtype.kind not in 'iuf':
+        return None
+    if array.dtype.kind in 'iu':
+        if array.min() >= np.iinfo(np.int32).min and array.max() <= np.iinfo(np.int32).max:
+            return array.astype(np.int32)
+        return array
+    return array.astype(np.float32)
+
+
+def compact_figure(fig: go.Figure) -> go.Figure:
+    """전송용 압축 Figure 사본
+
+    - 숫자 배열 → plotly typed array(bdata) 인코딩 대상 numpy 배열(int32/float32)
+    - layout.template 제거: 모든 차트에 반복되는 기본 템플릿(차트당 약 7KB) 대신
+      Streamlit 테마가 클라이언트에서 한 번만 적용됨
+    """
+    compact = go.Figure(fig)
+    for trace in compact.data:
+        for attribute in ARRAY_ATTRIBUTES:
+            if attribute in trace and trace[attribute] is not None:
+                typed = _typed_array(trace[attribute])
+                if typed is not None:
+                    trace[attribute] = typed
+        marker = getattr(trace, 'marker', None)
+        if marker is not None and 'color' in marker:
+            typed = _typed_array(marker.color)
+            if typed is not None:
+                marker.color = typed
+    compact.layout.template = None
+    return compact
+
+
+class FigureTransport:
+    """st.plotly_chart 래퍼 (압축 모드 + 차트별 전송량 보고)"""
+
+    def __init__(self, compact: Optional[bool] = None, max_entries: int = 256):
+        if compact is None:
+            compact = os.environ.get('RALLIT_COMPACT_CHARTS', '').lower() in ('1', 'true', 'yes')
+        self.compact = compact
+        self.max_entries = max_entries
+        # Figure 는 해시 불가이므로 id 로 보관하고 약한 참조로 동일 객체인지 확인
+        self._compacted: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        if compact:
+            try:
+                pio.json.config.default_engine = 'orjson'
+            except ValueError as e:
+                logger.warning(f"orjson engine unavailable, using default JSON encoder: {e}")
+
+    def _prepare(self, fig: go.Figure):
+        """(압축 Figure, 원본 바이트, 압축 바이트) - 같은 Figure 객체는 1회만 변환 (캐시된 차트 재사용)"""
+        with self._lock:
+            entry = self._compacted.get(id(fig))
+            if entry is not None and entry[0]() is fig:
+                self._compacted.move_to_end(id(fig))
+                return entry[1]
+
+        compact = compact_figure(fig)
+        prepared = (compact, len(pio.to_json(fig, validate=False)), len(pio.to_json(compact, validate=False)))
+        with self._lock:
+            self._compacted[id(fig)] = (weakref.ref(fig), prepared)
+            while len(self._compacted) > self.max_entries:
+                self._compacted.popitem(last=False)
+        return prepared
+
+    def plotly_chart(self, fig, key: Optional[str] = None, **kwargs):
+        """st.plotly_chart 와 같은 인자, 압축 모드에서는 변환된 Figure 를 전송하고 크기를 기록"""
+        if not self.compact or not isinstance(fig, go.Figure) or kwargs.get('theme', 'streamlit') is None:
+            return st.plotly_chart(fig, key=key, **kwargs)
+
+        compact, original_bytes, compact_bytes = self._prepare(fig)
+        report = st.session_state.setdefault('chart_payload_report', {})
+        report[key or f"chart_{len(report)}"] = {'json_bytes': original_bytes, 'compact_bytes': compact_bytes}
+        return st.plotly_chart(compact, key=key, **kwargs)
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        """이번 세션에서 전송된 차트별 바이트 (압축 모드에서만 기록)"""
+        return dict(st.session_state.get('chart_payload_report', {}))
+
+
+# 전역 차트 전송 인스턴스
+figure_transport = FigureTransport()
@@ -0,0 +1,219 @@
+"""
+스킬 조합 마이닝 모듈
+공고별 요구 스킬 집합에서 함께 자주 요구되는 스킬 조합(빈발 항목집합)을 FP-growth 로 오프라인 추출하고
+직무 카테고리별/전체의 지지도·lift 를 작은 사전 계산 테이블로 보관 (화면에서는 테이블만 읽음)
+
+스냅샷마다 공고 내용이 바뀐 카테고리만 다시 마이닝하고 나머지 카테고리 행은 재사용
+
+실행: python -m src.itemset_mining
+"""
+
+import hashlib
+import logging
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.precomputed import PrecomputedStore, precomputed_store
+from src.skill_canon import skill_canon
+from src.utils import posting_hashes, source_version
+
+logger = logging.getLogger(__name__)
+
+ALL = '*'
+HASH_COLUMNS = ['job_category', 'job_skill_keywords']
+BUNDLE_COLUMNS = ['job_category', 'skills', 'size', 'support', 'support_ratio', 'lift', 'rank']
+
+
+class _FPNode:
+    __slots__ = ('item', 'count', 'parent', 'children')
+
+    def __init__(self, item: int, parent: Optional['_FPNode']):
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children: Dict[int, '_FPNode'] = {}
+
+
+def _build_tree(paths: List[Tuple[List[int], int]], min_count: int) -> Tuple[Dict[int, List[_FPNode]], Dict[int, int]]:
+    """가중 경로들로 FP-tree 생성 → (항목별 노드 목록, 항목별 지지도), 빈발하지 않은 항목은 제외"""
+    counts: Dict[int, int] = defaultdict(int)
+    for items, weight in paths:
+        for item in items:
+            counts[item] += weight
+    frequent = {item: count for item, count in counts.items() if count >= min_count}
+
+    root = _FPNode(-1, None)
+    header: Dict[int, List[_FPNode]] = defaultdict(list)
+    for items, weight in paths:
+        # 지지도 내림차순(동점은 항목 번호 순)으로 정렬해야 접두사가 공유됨
+        ordered = sorted((item for item in items if item in frequent), key=lambda item: (-frequent[item], item))
+        node = root
+        for item in ordered:
+            child = node.children.get(item)
+            if child is None:
+                child = _FPNode(item, node)
+                node.children[item] = child
+                header[item].append(child)
+            child.count += weight
+            node = child
+    return header, frequent
+
+
+def _mine(header: Dict[int, List[_FPNode]], counts: Dict[int, int], suffix: Tuple[int, ...],
+          min_count: int, max_len: int, found: Dict[Tuple[int, ...], int]):
+    for item in sorted(counts, key=lambda item: (counts[item], -item)):
+        itemset = tuple(sorted(suffix + (item,)))
+        found[itemset] = counts[item]
+        if len(itemset) >= max_len:
+            continue
+        # 조건부 패턴 기반: item 노드에서 루트까지의 경로 (노드 지지도로 가중)
+        paths = []
+        for node in header[item]:
+            path = []
+            parent = node.parent
+            while parent is not None and parent.item >= 0:
+                path.append(parent.item)
+                parent = parent.parent
+            if path:
+                paths.append((path, node.count))
+        if paths:
+            conditional_header, conditional_counts = _build_tree(paths, min_count)
+            if conditional_counts:
+                _mine(conditional_header, conditional_counts, itemset, min_count, max_len, found)
+
+
+def fp_growth(transactions: List[np.ndarray], min_count: int, max_len: int = 4) -> Dict[Tuple[int, ...], int]:
+    """빈발 항목집합과 지지도 (트랜잭션 = 중복 없는 항목 배열, 항목집합은 정렬된 튜플, 단일 항목 포함)"""
+    header, counts = _build_tree([(items.tolist(), 1) for items in transactions if items.size], min_count)
+    found: Dict[Tuple[int, ...], int] = {}
+    _mine(header, counts, (), min_count, max_len, found)
+    return found
+
+
+def mine_bundles(transactions: List[np.ndarray], category: str, min_support: float = 0.03, min_count: int = 2,
+                 max_len: int = 4, top_n: int = 20) -> pd.DataFrame:
+    """한 트랜잭션 묶음의 2개 이상 스킬 조합 테이블 (지지도 내림차순, lift 내림차순, 상위 top_n, lift > 1 만)
+
+    lift = P(조합) / Π P(스킬) - 각 스킬이 서로 독립일 때보다 몇 배 자주 함께 요구되는지
+    """
+    n = len(transactions)
+    if n == 0:
+        return pd.DataFrame(columns=BUNDLE_COLUMNS)
+    threshold = max(min_count, int(math.ceil(min_support * n)))
+    itemsets = fp_growth(transactions, threshold, max_len)
+
+    rows = []
+    for itemset, support in itemsets.items():
+        if len(itemset) < 2:
+            continue
+        expected = np.prod([itemsets[(item,)] / n for item in itemset])
+        lift = support / n / expected
+        if lift <= 1:
+            continue
+        # 표시 순서: 개별 지지도 내림차순
+        ordered = sorted(itemset, key=lambda item: (-itemsets[(item,)], skill_canon.names[item]))
+        rows.append((category, ', '.join(skill_canon.label(item) for item in ordered), len(itemset),
+                     support, round(support / n, 4), round(lift, 4)))
+    if not rows:
+        return pd.DataFrame(columns=BUNDLE_COLUMNS)
+
+    table = pd.DataFrame(rows, columns=BUNDLE_COLUMNS[:-1])
+    table = table.sort_values(['support', 'lift', 'size', 'skills'], ascending=[False, False, False, True]).head(top_n)
+    table['rank'] = np.arange(1, len(table) + 1)
+    return table.reset_index(drop=True)
+
+
+class SkillBundleMiner:
+    """스냅샷 단위 스킬 조합 마이닝 (내용이 바뀐 카테고리만 다시 마이닝)"""
+
+    TABLE = 'skill_bundles'
+
+    def __init__(self, store: Optional[PrecomputedStore] = None, min_support: float = 0.03, min_count: int = 2,
+                 max_len: int = 4, top_n: int = 20):
+        self.store = store or precomputed_store
+        self.min_support = min_support
+        self.min_count = min_count
+        self.max_len = max_len
+        self.top_n = top_n
+
+    def _params(self) -> Dict:
+        return {'min_support': self.min_support, 'min_count': self.min_count,
+                'max_len': self.max_len, 'top_n': self.top_n}
+
+    def is_current(self, df: pd.DataFrame) -> bool:
+        """저장된 테이블이 현재 원천 공고 버전·파라미터 기준인지 확인"""
+        meta = self.store.load_meta(self.TABLE)
+        return meta.get('source_version') == source_version(df, HASH_COLUMNS) and meta.get('params') == self._params()
+
+    def update(self, df: pd.DataFrame) -> Dict:
+        """새 스냅샷 반영: 카테고리별 공고 내용 요약 해시가 바뀐 카테고리와 전체만 다시 마이닝"""
+        hashes = posting_hashes(df, HASH_COLUMNS).astype(str).to_numpy()
+        categories = df['job_category'].astype(str).to_numpy() if 'job_category' in df.columns \
+            else np.full(len(df), ALL)
+        requirements = df['job_skill_keywords'] if 'job_skill_keywords' in df.columns else pd.Series(None, index=df.index)
+        transactions = [np.unique(ids) for ids in skill_canon.parse_all(requirements)]
+
+        digests = {}
+        for category in sorted(set(categories)):
+            members = np.sort(hashes[categories == category])
+            digests[category] = hashlib.sha1('\n'.join(members).encode('utf-8')).hexdigest()
+
+        meta = self.store.load_meta(self.TABLE)
+        previous = self.store.load_table(self.TABLE) if meta.get('params') == self._params() else None
+        previous_digests = meta.get('category_digests', {}) if previous is not None else {}
+
+        parts, mined = [], []
+        for category, digest in digests.items():
+            if previous_digests.get(category) == digest:
+                parts.append(previous[previous['job_category'].astype(str) == category])
+                continue
+            members = np.flatnonzero(categories == category)
+            parts.append(mine_bundles([transactions[i] for i in members], category, self.min_support,
+                                      self.min_count, self.max_len, self.top_n))
+            mined.append(category)
+        if mined or previous is None or set(previous_digests) != set(digests):
+            parts.append(mine_bundles(transactions, ALL, self.min_support, self.min_count, self.max_len, self.top_n))
+            mined.append(ALL)
+        else:
+            parts.append(previous[previous['job_category'].astype(str) == ALL])
+
+        parts = [part for part in parts if not part.empty]
+        table = pd.concat(parts, ignore_index=True)[BUNDLE_COLUMNS] if parts else pd.DataFrame(columns=BUNDLE_COLUMNS)
+        self.store.save_table(self.TABLE, table)
+        summary = {
+            'source_version': source_version(df, HASH_COLUMNS),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'params': self._params(),
+            'category_digests': digests,
+            'mined_categories': mined,
+            'rows': len(table),
+        }
+        self.store.save_meta(self.TABLE, summary)
+        logger.info(f"Skill bundle mining updated: {len(table)} rows, mined {mined}")
+        return summary
+
+    def load_table(self) -> pd.DataFrame:
+        table = self.store.load_table(self.TABLE)
+        return table if table is not None else pd.DataFrame(columns=BUNDLE_COLUMNS)
+
+
+def main():
+    """오프라인 실행 진입점: 현재 데이터로 테이블 갱신"""
+    from src.data_loader import DataLoader
+
+    logging.basicConfig(level=logging.INFO)
+    df = DataLoader().load_postings()
+    if df.empty:
+        logger.error("No data to mine")
+        return
+    summary = SkillBundleMiner().update(df)
+    print({key: value for key, value in summary.items() if key != 'category_digests'})
+
+
+if __name__ == '__main__':
+    main()
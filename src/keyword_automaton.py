@@ -0,0 +1,174 @@
+"""
+키워드 분석 모듈
+Aho-Corasick 다중 패턴 오토마톤으로 공고 제목의 키워드를 한 번의 스캔으로 집계
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils import dataset_version, frame_fingerprint
+
+# 기본 키워드 (기존 analyze_keyword_trends 의 common_keywords)
+DEFAULT_KEYWORDS = [
+    '시니어', '주니어', '신입', '경력', '개발자', '디자이너',
+    '마케팅', '매니저', '팀장', '리드', 'Frontend', 'Backend',
+    'Full-Stack', 'UI/UX', '데이터', '분석', 'AI', '머신러닝'
+]
+
+# 확장 한/영 어휘 (직무·고용형태·도메인)
+EXTENDED_LEXICON = [
+    '프론트엔드', '백엔드', '풀스택', '인턴', '정규직', '계약직', '전환형',
+    '엔지니어', '기획자', '운영', '그로스', '퍼포먼스', '브랜드', '콘텐츠', '채용',
+    'Engineer', 'Developer', 'Designer', 'Product', 'Manager', 'Lead', 'Senior', 'Junior',
+    'Android', 'iOS', 'DevOps', 'Data', 'ML', 'LLM', 'PM', 'PO', 'QA', 'CRM', 'HR'
+]
+
+
+def _is_word_char(char: str) -> bool:
+    """영문/숫자 (한글은 단어 경계로 보지 않음 - "AI개발자" 의 AI 는 매칭)"""
+    return char.isascii() and char.isalnum()
+
+
+class AhoCorasick:
+    """대소문자 무시 다중 패턴 매칭 오토마톤
+
+    영문/숫자로 시작하거나 끝나는 패턴은 그쪽 경계의 앞뒤 글자가 영문/숫자가 아닐 때만 매칭
+    ("ML" 은 "HTML" 에서, "PO" 는 "Position" 에서 세지 않음)
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = [p for p in dict.fromkeys(patterns) if p]
+        self._lengths = [len(p) for p in self.patterns]
+        self._bounded_start = [_is_word_char(p[0]) for p in self.patterns]
+        self._bounded_end = [_is_word_char(p[-1]) for p in self.patterns]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._build()
+
+    def _build(self):
+        # 트라이 구성
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        # BFS 로 실패 링크 및 출력 집합 전파
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def count(self, text: str) -> np.ndarray:
+        """텍스트 한 건에서 패턴별 등장 횟수"""
+        counts = np.zeros(len(self.patterns), dtype=np.int32)
+        goto, fail, output = self._goto, self._fail, self._output
+        lengths, bounded_start, bounded_end = self._lengths, self._bounded_start, self._bounded_end
+        text = text.lower()
+        last = len(text) - 1
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                start = end - lengths[pattern_id] + 1
+                if bounded_start[pattern_id] and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if bounded_end[pattern_id] and end < last and _is_word_char(text[end + 1]):
+                    continue
+                counts[pattern_id] += 1
+        return counts
+
+
+class KeywordAnalyzer:
+    """제목 키워드 분석기 (행 단위 히트 배열 → groupby 집계)"""
+
+    def __init__(self, keywords: Optional[List[str]] = None, cache_size: int = 8):
+        self._keywords = list(dict.fromkeys(keywords if keywords is not None else DEFAULT_KEYWORDS + EXTENDED_LEXICON))
+        self._automaton: Optional[AhoCorasick] = None
+        self._cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._keywords)
+
+    def add_keywords(self, keywords: Iterable[str]):
+        """어휘 확장 (다음 조회 시 오토마톤 재컴파일)"""
+        with self._lock:
+            added = [k for k in keywords if k and k not in self._keywords]
+            if added:
+                self._keywords.extend(added)
+                self._automaton = None
+                self._cache.clear()
+
+    def _compiled(self) -> AhoCorasick:
+        if self._automaton is None:
+            self._automaton = AhoCorasick(self._keywords)
+        return self._automaton
+
+    def hit_matrix(self, texts: Iterable) -> np.ndarray:
+        """텍스트별 키워드 등장 횟수 행렬 (n_rows × n_keywords)"""
+        automaton = self._compiled()
+        texts = list(texts)
+        hits = np.zeros((len(texts), len(automaton.patterns)), dtype=np.int32)
+        for row, text in enumerate(texts):
+            if isinstance(text, str) and text:
+                hits[row] = automaton.count(text)
+        return hits
+
+    def hits_frame(self, df: pd.DataFrame, text_col: str = 'title') -> pd.DataFrame:
+        """행 단위 히트 데이터프레임 (df 와 같은 인덱스, 프레임 지문 + 어휘 기준 캐시)"""
+        dataset_version(df)  # 버전이 없는 임의 프레임은 내용 해시로 버전 부여 (같은 길이의 다른 프레임 구분)
+        key = (frame_fingerprint(df), text_col, tuple(self._keywords))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        texts = df[text_col] if text_col in df.columns else pd.Series([None] * len(df), index=df.index)
+        hits = pd.DataFrame(self.hit_matrix(texts.values), index=df.index, columns=self._compiled().patterns)
+
+        with self._lock:
+            self._cache[key] = hits
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return hits
+
+    def counts_by(self, df: pd.DataFrame, by=None, text_col: str = 'title') -> pd.DataFrame:
+        """그룹(카테고리/지역/기간 등)별 키워드 집계"""
+        hits = self.hits_frame(df, text_col)
+        if by is None:
+            return hits.sum().to_frame('count').T
+        if isinstance(by, str):
+            keys = df[by]
+        elif isinstance(by, list):
+            keys = [df[col] if isinstance(col, str) else col for col in by]
+        else:
+            keys = by
+        return hits.groupby(keys, observed=True).sum()
+
+
+# 전역 키워드 분석기 인스턴스
+keyword_analyzer = KeywordAnalyzer()
@@ -0,0 +1,203 @@
+"""
+MinHash-LSH 인덱스 모듈
+공고별 요구 스킬 집합의 MinHash 서명을 밴드 단위 해시 테이블(밴드 해시 정렬 배열)에 넣어
+전수 채점 없이 스킬 집합이 비슷한 후보 공고와 추정 Jaccard 를 찾고, 정확한 점수는 후보에만 계산
+
+데이터셋 버전마다 한 번 만들어 사전 계산 저장소에 보관
+재현율/지연 조절: probe_bands(조회할 밴드 수, 적을수록 빠르고 재현율 낮음), max_candidates
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.precomputed import PrecomputedStore, precomputed_store
+from src.skill_canon import skill_canon
+from src.utils import source_version
+
+logger = logging.getLogger(__name__)
+
+# 이 공고 수 이상이면 전수 채점 대신 LSH 후보만 채점 / 조회 밴드 수 (비우면 전체 밴드)
+LSH_MIN_POSTINGS = int(os.environ.get('RALLIT_LSH_MIN_POSTINGS', 50000))
+LSH_PROBE_BANDS = int(os.environ['RALLIT_LSH_PROBE_BANDS']) if os.environ.get('RALLIT_LSH_PROBE_BANDS') else None
+
+# 2^31 - 1 (메르센 소수) - 32비트 토큰 해시와의 곱이 uint64 를 넘지 않음
+_PRIME = np.uint64((1 << 31) - 1)
+_EMPTY = np.uint32((1 << 31) - 1)
+# 밴드 해시 결합용 홀수 승수 (uint64 순환 연산)
+_BAND_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+HASH_COLUMNS = ['job_skill_keywords']
+
+
+def skill_tokens(requirements: Optional[str]) -> List[str]:
+    """요구 스킬 문자열 → 정규화된 스킬 집합 (calculate_advanced_skill_match 와 같은 정규화)"""
+    return skill_canon.names_of(np.unique(skill_canon.parse(requirements)))
+
+
+def _token_hashes(tokens: List[str]) -> np.ndarray:
+    """스킬 → 32비트 해시 (프로세스/실행 간 동일한 결정적 해시)"""
+    if not tokens:
+        return np.zeros(0, dtype=np.uint64)
+    return pd.util.hash_array(np.asarray(tokens, dtype=object)) & np.uint64(0xFFFFFFFF)
+
+
+def minhash_signatures(token_lists: List[List[str]], a: np.ndarray, b: np.ndarray,
+                       chunk_pairs: int = 200_000) -> np.ndarray:
+    """집합별 MinHash 서명 (n × num_perm, 빈 집합은 전부 _EMPTY)
+
+    h_i(x) = (a_i · x + b_i) mod p 의 집합 내 최솟값을 (공고, 스킬) 쌍을 청크로 나누어 계산한다.
+    """
+    num_perm = a.size
+    signatures = np.full((len(token_lists), num_perm), _EMPTY, dtype=np.uint32)
+    lengths = np.array([len(tokens) for tokens in token_lists], dtype=np.int64)
+    hashes = _token_hashes([token for tokens in token_lists for token in tokens])
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    nonempty = np.flatnonzero(lengths)
+    per_chunk = max(chunk_pairs // max(num_perm, 1), 1)
+    start = 0
+    while start < nonempty.size:
+        # 쌍 개수가 per_chunk 를 넘지 않도록 공고 묶음 결정 (최소 1개)
+        end = int(np.searchsorted(offsets[nonempty + 1], offsets[nonempty[start]] + per_chunk, side='right'))
+        end = max(end, start + 1)
+        rows = nonempty[start:end]
+        pair_start, pair_end = offsets[rows[0]], offsets[rows[-1] + 1]
+        permuted = (hashes[pair_start:pair_end, None] * a + b) % _PRIME
+        signatures[rows] = np.minimum.reduceat(permuted, offsets[rows] - pair_start, axis=0).astype(np.uint32)
+        start = end
+    return signatures
+
+
+def band_hashes(signatures: np.ndarray, bands: int) -> np.ndarray:
+    """서명 → 밴드별 64비트 해시 (n × bands)"""
+    rows = signatures.shape[1] // bands
+    banded = signatures[:, :bands * rows].reshape(len(signatures), bands, rows).astype(np.uint64)
+    combined = np.zeros(banded.shape[:2], dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for r in range(rows):
+            combined = combined * _BAND_MULTIPLIER + banded[:, :, r]
+    return combined
+
+
+def candidate_probability(jaccard: float, bands: int, rows: int) -> float:
+    """Jaccard 유사도 jaccard 인 공고가 후보로 나올 확률 1 - (1 - s^r)^b"""
+    return 1 - (1 - jaccard ** rows) ** bands
+
+
+class LSHIndex:
+    """공고 스킬 집합 MinHash-LSH 인덱스 (밴드마다 정렬된 해시 배열 + searchsorted 조회)"""
+
+    NAME = 'skill_lsh'
+
+    def __init__(self, ids: np.ndarray, signatures: np.ndarray, band_keys: np.ndarray,
+                 band_postings: np.ndarray, a: np.ndarray, b: np.ndarray, version: Optional[str] = None):
+        self.ids = ids
+        self.signatures = signatures
+        self.band_keys = band_keys
+        self.band_postings = band_postings
+        self.a = a
+        self.b = b
+        self.version = version
+        self.bands = band_keys.shape[0]
+        self.rows = signatures.shape[1] // self.bands
+        self.empty = signatures[:, 0] == _EMPTY
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, num_perm: int = 64, bands: int = 64, seed: int = 42) -> 'LSHIndex':
+        """공고 프레임으로 인덱스 생성 (num_perm = bands × rows, 밴드당 행이 적을수록 낮은 유사도도 후보)"""
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+        requirements = df['job_skill_keywords'] if 'job_skill_keywords' in df.columns else pd.Series(None, index=df.index)
+        signatures = minhash_signatures([skill_tokens(text) for text in requirements], a, b)
+        keys = band_hashes(signatures, bands).T  # bands × n
+        order = np.argsort(keys, axis=1, kind='stable')
+        ids = df['id'].to_numpy() if 'id' in df.columns else np.arange(len(df))
+        return cls(ids, signatures, np.take_along_axis(keys, order, axis=1), order.astype(np.int64), a, b,
+                   source_version(df, HASH_COLUMNS))
+
+    def signature(self, skills: List[str]) -> np.ndarray:
+        return minhash_signatures([skill_canon.names_of(skill_canon.ids(skills))], self.a, self.b)[0]
+
+    def estimate_jaccard(self, signature: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """서명 일치 비율 = Jaccard 추정치"""
+        return (self.signatures[positions] == signature).mean(axis=1)
+
+    def query(self, skills: List[str], probe_bands: Optional[int] = None, min_jaccard: float = 0.0,
+              max_candidates: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """후보 공고 위치(인덱스 생성 순서)와 추정 Jaccard (추정치 내림차순)
+
+        probe_bands: 조회할 밴드 수 (기본 LSH_PROBE_BANDS, 없으면 전체) - 줄이면 후보가 줄어 빨라지고 재현율이 낮아짐
+        max_candidates: 추정 Jaccard 상위 몇 개까지만 반환할지
+        """
+        signature = self.signature(skills)
+        if signature[0] == _EMPTY:
+            return {'positions': np.zeros(0, dtype=np.int64), 'jaccard': np.zeros(0)}
+
+        probe_bands = probe_bands or LSH_PROBE_BANDS or self.bands
+        probe_bands = min(max(int(probe_bands), 1), self.bands)
+        query_keys = band_hashes(signature[None, :], self.bands)[0]
+        found = []
+        for band in range(probe_bands):
+            keys = self.band_keys[band]
+            low = np.searchsorted(keys, query_keys[band], side='left')
+            high = np.searchsorted(keys, query_keys[band], side='right')
+            if high > low:
+                found.append(self.band_postings[band, low:high])
+        if not found:
+            return {'positions': np.zeros(0, dtype=np.int64), 'jaccard': np.zeros(0)}
+
+        positions = np.unique(np.concatenate(found))
+        positions = positions[~self.empty[positions]]
+        jaccard = self.estimate_jaccard(signature, positions)
+        keep = jaccard >= min_jaccard
+        positions, jaccard = positions[keep], jaccard[keep]
+        order = np.argsort(-jaccard, kind='stable')
+        if max_candidates is not None:
+            order = order[:max_candidates]
+        return {'positions': positions[order], 'jaccard': jaccard[order]}
+
+    def candidate_positions(self, frame: pd.DataFrame, skills: List[str], **query_kwargs) -> np.ndarray:
+        """frame 안에서 후보 공고의 위치 (필터/재정렬된 프레임도 id 로 대응, 오름차순)"""
+        candidates = self.ids[self.query(skills, **query_kwargs)['positions']]
+        frame_ids = frame['id'].to_numpy() if 'id' in frame.columns else np.arange(len(frame))
+        return np.flatnonzero(np.isin(frame_ids, candidates))
+
+    # 저장/로드
+    def save(self, store: Optional[PrecomputedStore] = None):
+        store = store or precomputed_store
+        store.save_arrays(self.NAME, ids=self.ids, signatures=self.signatures, band_keys=self.band_keys,
+                          band_postings=self.band_postings, a=self.a, b=self.b)
+        store.save_meta(self.NAME, {'source_version': self.version, 'postings': int(len(self.ids)),
+                                    'num_perm': int(self.a.size), 'bands': int(self.bands)})
+
+    @classmethod
+    def load(cls, store: Optional[PrecomputedStore] = None, version: Optional[str] = None) -> Optional['LSHIndex']:
+        """저장된 인덱스 (version 이 주어지면 같은 원천 공고 버전일 때만)"""
+        store = store or precomputed_store
+        meta = store.load_meta(cls.NAME)
+        if not meta or (version is not None and meta.get('source_version') != version):
+            return None
+        arrays = store.load_arrays(cls.NAME)
+        if arrays is None:
+            return None
+        return cls(arrays['ids'], arrays['signatures'], arrays['band_keys'], arrays['band_postings'],
+                   arrays['a'], arrays['b'], meta.get('source_version'))
+
+    @classmethod
+    def load_or_build(cls, df: pd.DataFrame, store: Optional[PrecomputedStore] = None, **build_kwargs) -> 'LSHIndex':
+        """현재 원천 공고 버전의 저장된 인덱스, 없으면 생성 후 저장 (저장 실패는 경고만)"""
+        index = cls.load(store, source_version(df, HASH_COLUMNS))
+        if index is None:
+            index = cls.build(df, **build_kwargs)
+            try:
+                index.save(store)
+            except OSError as e:
+                logger.warning(f"LSH index save skipped: {e}")
+        return index
@@ -0,0 +1,186 @@
+"""
+매칭 결과 모듈
+점수/확률/행 위치는 NumPy 배열로 보관하고 보유·부족 스킬, 상세 분석 등 설명 필드는
+실제로 표시하거나 내보내는 행에 대해서만 지연 계산
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.ranking import ranked_page, top_k
+
+# 결과 표에 노출하는 공고 컬럼 (결과 컬럼명 → 원본 컬럼명)
+DISPLAY_COLUMNS = {
+    'title': 'title',
+    'company': 'company_name',
+    'category': 'job_category',
+    'region': 'address_region',
+    'reward': 'join_reward',
+}
+
+
+class MatchRecord:
+    """결과 집합의 한 행에 대한 가벼운 뷰 (설명 필드는 접근 시 계산)"""
+
+    __slots__ = ('_results', 'position')
+
+    def __init__(self, results: 'MatchResultSet', position: int):
+        self._results = results
+        self.position = position
+
+    def __getitem__(self, name: str):
+        return getattr(self, name)
+
+    @property
+    def idx(self):
+        return self._results.row_labels[self.position]
+
+    @property
+    def id(self):
+        return self._results.ids[self.position]
+
+    @property
+    def skill_score(self) -> float:
+        return float(self._results.skill_scores[self.position])
+
+    @property
+    def success_prob(self) -> float:
+        return float(self._results.probabilities[self.position])
+
+    @property
+    def confidence(self) -> float:
+        return float(self._results.confidences[self.position])
+
+    def _column(self, name: str, default=None):
+        column = DISPLAY_COLUMNS[name]
+        frame = self._results.frame
+        if column not in frame.columns:
+            return default
+        return frame[column].iat[self._results.row_positions[self.position]]
+
+    @property
+    def title(self):
+        return self._column('title')
+
+    @property
+    def company(self):
+        return self._column('company')
+
+    @property
+    def category(self):
+        return self._column('category')
+
+    @property
+    def region(self):
+        return self._column('region', 'N/A')
+
+    @property
+    def reward(self):
+        return self._column('reward', 0)
+
+    @property
+    def matched(self) -> List[str]:
+        return self._results.explain(self.position)['matched']
+
+    @property
+    def missing(self) -> List[str]:
+        return self._results.explain(self.position)['missing']
+
+    @property
+    def analysis(self) -> Dict:
+        return self._results.explain(self.position)['analysis']
+
+
+class MatchResultSet:
+    """컬럼형 매칭 결과 (기준 점수를 넘은 공고만 보관)"""
+
+    def __init__(self, frame: pd.DataFrame, row_positions: np.ndarray, skill_scores: np.ndarray,
+                 probabilities: np.ndarray, confidences: np.ndarray,
+                 user_skills: List[str], matching_engine):
+        self.frame = frame
+        self.row_positions = row_positions
+        self.row_labels = frame.index.to_numpy()[row_positions]
+        # 동점 순서 기준 (공고 id, 없으면 행 라벨)
+        self.ids = frame['id'].to_numpy()[row_positions] if 'id' in frame.columns else self.row_labels
+        self.skill_scores = skill_scores
+        self.probabilities = probabilities
+        self.confidences = confidences
+        self.user_skills = list(user_skills)
+        self._engine = matching_engine
+        self._explanations: Dict[int, Dict] = {}
+
+    @classmethod
+    def score(cls, frame: pd.DataFrame, user_skills: List[str], growth_score: float,
+              matching_engine, min_score: float = 15,
+              candidates: Optional[np.ndarray] = None) -> 'MatchResultSet':
+        """공고 점수 계산 후 min_score 초과 공고만 남김 (설명 필드는 만들지 않음)
+
+        candidates 가 주어지면 해당 행 위치(예: LSH 후보)만 채점한다.
+        """
+        requirements = frame['job_skill_keywords'] if 'job_skill_keywords' in frame.columns else pd.Series('', index=frame.index)
+        categories = frame['job_category'] if 'job_category' in frame.columns else pd.Series(None, index=frame.index)
+        if candidates is None:
+            candidates = np.arange(len(frame))
+        scores = matching_engine.skill_match_scores(user_skills, requirements.to_numpy()[candidates],
+                                                    categories.to_numpy()[candidates])
+
+        keep = scores > min_score
+        positions = candidates[keep]
+        probabilities, confidences = matching_engine.predict_success_arrays(scores[keep], growth_score)
+        return cls(frame, positions, scores[keep], probabilities, confidences, user_skills, matching_engine)
+
+    def __len__(self) -> int:
+        return int(self.row_positions.size)
+
+    def record(self, position: int) -> MatchRecord:
+        return MatchRecord(self, position)
+
+    def top(self, k: int) -> np.ndarray:
+        """합격 확률 상위 k 개 결과 위치 (동점은 id 순)"""
+        return top_k(self.probabilities, self.ids, k)
+
+    def page(self, page: int = 1, page_size: int = 50, cursor=None) -> Dict:
+        """합격 확률 순위 페이지 (ranking.ranked_page 참고)"""
+        return ranked_page(self.probabilities, self.ids, page, page_size, cursor)
+
+    def explain(self, position: int) -> Dict:
+        """한 행의 보유/부족 스킬과 상세 분석 (최초 접근 시 1회 계산)"""
+        explanation = self._explanations.get(position)
+        if explanation is None:
+            record = self.record(position)
+            requirements = self.frame['job_skill_keywords'].iat[self.row_positions[position]] \
+                if 'job_skill_keywords' in self.frame.columns else ''
+            _, matched, missing, analysis = self._engine.calculate_advanced_skill_match(
+                self.user_skills, requirements if isinstance(requirements, str) else '', record.category
+            )
+            explanation = {'matched': matched, 'missing': missing, 'analysis': analysis}
+            self._explanations[position] = explanation
+        return explanation
+
+    def similar_credits(self, positions: np.ndarray) -> Optional[np.ndarray]:
+        """positions 행들의 유사 스킬 크레딧 (희소 곱 한 번, 스킬 그래프가 없으면 None)"""
+        if 'job_skill_keywords' not in self.frame.columns:
+            return None
+        requirements = self.frame['job_skill_keywords'].to_numpy()[self.row_positions[positions]]
+        return self._engine.similar_skill_credits(self.user_skills, requirements)
+
+    def to_frame(self, positions: Optional[np.ndarray] = None, explain: bool = False) -> pd.DataFrame:
+        """표시/내보내기용 프레임 (positions 순서, explain=True 면 해당 행만 설명 필드 포함)"""
+        if positions is None:
+            positions = np.arange(len(self))
+        rows = self.row_positions[positions]
+        data = {'idx': self.row_labels[positions]}
+        for name, column in DISPLAY_COLUMNS.items():
+            if column in self.frame.columns:
+                data[name] = self.frame[column].to_numpy()[rows]
+        data['skill_score'] = self.skill_scores[positions]
+        data['success_prob'] = self.probabilities[positions]
+        data['confidence'] = self.confidences[positions]
+        result = pd.DataFrame(data)
+        if explain:
+            explanations = [self.explain(int(p)) for p in positions]
+            result['matched'] = [e['matched'] for e in explanations]
+            result['missing'] = [e['missing'] for e in explanations]
+        return result
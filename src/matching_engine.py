@@ -0,0 +1,264 @@
+"""
+매칭 엔진 모듈
+사용자 스킬/성장 프로필과 공고 요구 스킬의 매칭 점수, 성장 잠재력, 합격 확률 계산
+(Streamlit 없이 배치 작업에서도 사용)
+
+스킬 비교는 skill_canon 의 정규 스킬 ID(정수)로 한다 ("Vuejs" 와 "Vue.js" 는 같은 스킬)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from src.skill_canon import skill_canon
+from src.skill_taxonomy import skill_taxonomy
+
+
+class AdvancedMatchingEngine:
+    """고도화된 AI 매칭 엔진
+
+    skill_graph(src.skill_graph.SkillGraph) 가 주어지면 유사 스킬을 공고 동시 출현으로 학습한 그래프에서 찾고,
+    없으면 SIMILAR_SKILLS 고정 목록을 사용한다.
+    """
+    
+    # 학습된 스킬 그래프가 없을 때의 유사 스킬 목록
+    SIMILAR_SKILLS = {
+        'react': ['vue.js', 'angular', 'svelte'],
+        'vue.js': ['react', 'angular'],
+        'python': ['java', 'go', 'kotlin'],
+        'aws': ['gcp', 'azure'],
+        'mysql': ['postgresql', 'mongodb'],
+        'figma': ['sketch', 'adobe xd'],
+        'photoshop': ['illustrator', 'gimp']
+    }
+    
+    # 최신 기술 트렌드 스킬
+    MODERN_SKILLS = ['ai', 'ml', 'kubernetes', 'react', 'typescript', 'go', 'rust']
+    
+    def __init__(self, skill_graph=None):
+        self.skill_graph = skill_graph
+        self.vectorizer = TfidfVectorizer(stop_words='english', lowercase=True)
+        self.skill_weights = {
+            'python': 1.2, 'java': 1.1, 'javascript': 1.1, 'react': 1.15,
+            'aws': 1.2, 'docker': 1.1, 'kubernetes': 1.1, 'ai': 1.3, 'ml': 1.3,
+            'figma': 1.1, 'adobe': 1.0, 'google analytics': 1.1
+        }
+        
+        # 스킬 표를 정규 스킬 ID 로 한 번만 변환
+        self._weight_of = {skill_canon.intern(skill): weight for skill, weight in self.skill_weights.items()}
+        self._modern_ids = frozenset(skill_canon.register(self.MODERN_SKILLS).tolist())
+        self._modern_id_array = skill_canon.register(self.MODERN_SKILLS)
+        self._similar_ids = {skill_canon.intern(skill): frozenset(skill_canon.register(similar).tolist())
+                             for skill, similar in self.SIMILAR_SKILLS.items()}
+    
+    def calculate_advanced_skill_match(self, user_skills: List[str], job_requirements: str, 
+                                     job_category: str = None) -> Tuple[float, List[str], List[str], Dict]:
+        """고도화된 스킬 매칭 계산"""
+        if not user_skills or not job_requirements:
+            return 0, [], [], {}
+        
+        user_ids = skill_canon.ids(user_skills)
+        job_ids = skill_canon.parse(job_requirements).tolist()
+        
+        if not job_ids:
+            return 0, [], [], {}
+        
+        # 기본 매칭 계산 (공고에 나온 순서 유지)
+        user_set = set(user_ids.tolist())
+        job_order = list(dict.fromkeys(job_ids))
+        intersection = [skill_id for skill_id in job_order if skill_id in user_set]
+        missing = [skill_id for skill_id in job_order if skill_id not in user_set]
+        
+        # 가중치 적용 매칭 점수
+        weighted_score = 0
+        total_weight = 0
+        
+        for skill_id in job_ids:
+            weight = self._weight_of.get(skill_id, 1.0)
+            total_weight += weight
+            if skill_id in user_set:
+                weighted_score += weight
+        
+        match_score = (weighted_score / total_weight * 100) if total_weight > 0 else 0
+        
+        # 유사 스킬 매칭 (예: React ↔ Vue.js)
+        similar_matches = self._find_similar_skills(skill_canon.names_of(user_ids), skill_canon.names_of(missing))
+        
+        # 카테고리별 보너스
+        category_bonus = self._category_bonus(user_set, job_category)
+        
+        final_score = min(match_score + category_bonus, 100)
+        
+        analysis = {
+            'basic_score': len(intersection) / len(job_order) * 100,
+            'weighted_score': match_score,
+            'category_bonus': category_bonus,
+            'similar_matches': similar_matches,
+            'total_required': len(job_order),
+            'matched_count': len(intersection)
+        }
+        
+        return final_score, skill_canon.names_of(intersection), skill_canon.names_of(missing), analysis
+    
+    def skill_match_scores(self, user_skills: List[str], job_requirements, job_categories) -> np.ndarray:
+        """공고 배열의 최종 스킬 매칭 점수만 계산 (calculate_advanced_skill_match 와 같은 점수, 설명 필드 생략)"""
+        scores = np.zeros(len(job_requirements), dtype=np.float64)
+        user_set = set(skill_canon.ids(user_skills).tolist())
+        if not user_set:
+            return scores
+        
+        category_bonus = {}
+        weight_of = self._weight_of
+        for i, (requirements, category) in enumerate(zip(job_requirements, job_categories)):
+            job_ids = skill_canon.parse(requirements).tolist()
+            if not job_ids:
+                continue
+            
+            weighted_score = 0
+            total_weight = 0
+            for skill_id in job_ids:
+                weight = weight_of.get(skill_id, 1.0)
+                total_weight += weight
+                if skill_id in user_set:
+                    weighted_score += weight
+            
+            if category not in category_bonus:
+                category_bonus[category] = self._category_bonus(user_set, category)
+            scores[i] = min(weighted_score / total_weight * 100 + category_bonus[category], 100)
+        
+        return scores
+    
+    def _find_similar_skills(self, user_skills: List[str], missing_skills: List[str]) -> List[Tuple[str, str]]:
+        """유사 스킬 찾기 (스킬 그래프가 있으면 학습된 이웃, 없으면 고정 목록)"""
+        if self.skill_graph is not None:
+            return self.skill_graph.similar_pairs(user_skills, missing_skills)
+        
+        missing_ids = [skill_canon.lookup(skill) for skill in missing_skills]
+        matches = []
+        for user_skill in user_skills:
+            similar = self._similar_ids.get(skill_canon.lookup(user_skill), frozenset())
+            for missing_skill, missing_id in zip(missing_skills, missing_ids):
+                if missing_id in similar:
+                    matches.append((user_skill, missing_skill))
+        
+        return matches
+    
+    def similar_skill_credits(self, user_skills: List[str], job_requirements) -> Optional[np.ndarray]:
+        """공고 배열의 유사 스킬 크레딧 (부족 스킬별 보유 스킬과의 유사도 합, 스킬당 최대 1) - 스킬 그래프가 없으면 None
+        
+        공고 × 스킬 행렬과 스킬 커버리지 벡터의 희소 곱 한 번으로 계산한다.
+        """
+        if self.skill_graph is None:
+            return None
+        return self.skill_graph.similar_skill_credit(user_skills, self.skill_graph.posting_matrix(job_requirements))
+    
+    def _calculate_category_bonus(self, user_skills: List[str], job_category: str) -> float:
+        """카테고리별 보너스 점수 계산"""
+        return self._category_bonus(set(skill_canon.ids(user_skills).tolist()), job_category)
+    
+    def _category_bonus(self, user_ids: set, job_category: str) -> float:
+        """카테고리별 보너스 (사용자 스킬 ID 집합 기준, 카테고리 소속은 skill_taxonomy 배열 조회)"""
+        if not job_category:
+            return 0
+        
+        matching_relevant = skill_taxonomy.category_count(user_ids, job_category)
+        
+        return min(matching_relevant * 2, 10)  # 최대 10점 보너스
+    
+    def growth_score_arrays(self, recent_courses, project_count, skill_counts, github_contributions,
+                            modern_counts) -> Dict[str, np.ndarray]:
+        """성장 잠재력 점수 커널 (입력은 브로드캐스트 가능한 배열, 항목별 점수 배열과 total_score 반환)
+
+        학습 활동 0-25, 프로젝트 0-30, 기술 다양성 0-20, 오픈소스 0-15, 최신 트렌드 0-10 (합계 최대 100)
+        """
+        recent_courses, project_count, skill_counts, github_contributions, modern_counts = np.broadcast_arrays(
+            *(np.asarray(values, dtype=np.float64) for values in
+              (recent_courses, project_count, skill_counts, github_contributions, modern_counts))
+        )
+        components = {
+            'learning_score': np.where(recent_courses > 0, np.minimum(recent_courses * 5, 25), 0.0),
+            'project_score': np.where(project_count > 0, np.minimum(project_count * 5, 30), 0.0),
+            'diversity_score': np.where(skill_counts > 0, np.minimum(skill_counts * 2, 20), 0.0),
+            'oss_score': np.where(github_contributions > 0, np.minimum(github_contributions / 10, 15), 0.0),
+            'trend_score': np.where(modern_counts > 0, np.minimum(modern_counts * 2, 10), 0.0),
+        }
+        components['total_score'] = np.minimum(sum(components.values()), 100)
+        return components
+
+    def growth_scores(self, profiles: List[Dict]) -> np.ndarray:
+        """프로필 목록의 성장 잠재력 점수 배열 (스킬 ID 변환만 프로필별, 점수 계산은 한 번에)"""
+        skill_ids = [skill_canon.ids(profile.get('skills', [])) for profile in profiles]
+        skill_counts = np.fromiter((ids.size for ids in skill_ids), dtype=np.int64, count=len(profiles))
+        all_ids = np.concatenate(skill_ids) if skill_ids else np.zeros(0, dtype=np.int32)
+        modern_counts = np.bincount(np.repeat(np.arange(len(profiles)), skill_counts),
+                                    weights=np.isin(all_ids, self._modern_id_array), minlength=len(profiles))
+        return self.growth_score_arrays(
+            [profile.get('recent_courses', 0) for profile in profiles],
+            [profile.get('project_count', 0) for profile in profiles],
+            skill_counts,
+            [profile.get('github_contributions', 0) for profile in profiles],
+            modern_counts,
+        )['total_score'].reshape(len(profiles))
+
+    def analyze_advanced_growth_potential(self, user_profile: Dict) -> Tuple[float, List[str], Dict]:
+        """고도화된 성장 잠재력 분석 (점수는 growth_score_arrays, 설명 문구와 상세 분해만 여기서 생성)"""
+        recent_courses = user_profile.get('recent_courses', 0)
+        project_count = user_profile.get('project_count', 0)
+        github_contributions = user_profile.get('github_contributions', 0)
+        # 기술 다양성 - 표기만 다른 스킬은 하나로 셈
+        user_ids = skill_canon.ids(user_profile.get('skills', []))
+        skills_count = len(user_ids)
+        modern_count = len(self._modern_ids.intersection(user_ids.tolist()))
+
+        components = self.growth_score_arrays(recent_courses, project_count, skills_count,
+                                              github_contributions, modern_count)
+        factor_texts = {
+            'learning_score': f"적극적 학습 활동 ({recent_courses}개 강의)",
+            'project_score': f"실무 프로젝트 경험 ({project_count}개)",
+            'diversity_score': f"기술 스택 다양성 ({skills_count}개)",
+            'oss_score': f"오픈소스 기여 ({github_contributions}회)",
+            'trend_score': f"최신 기술 트렌드 관심 ({modern_count}개)",
+        }
+        factors = []
+        detailed_analysis = {}
+        for key, text in factor_texts.items():
+            if components[key] > 0:
+                factors.append(text)
+                detailed_analysis[key] = float(components[key])
+        
+        final_score = float(components['total_score'])
+        detailed_analysis['total_score'] = final_score
+        
+        return final_score, factors, detailed_analysis
+    
+    def predict_success_arrays(self, skill_scores, growth_scores, experience_match=False,
+                               company_size_match=False) -> Tuple[np.ndarray, np.ndarray]:
+        """합격 확률 커널 (입력은 브로드캐스트 가능한 배열, 확률·신뢰도 배열을 한 번에 반환)
+
+        확률 = min(스킬 × 0.6 + 성장 × 0.3 + 경력 일치 5 + 기업 규모 일치 3, 95), 신뢰도 = (스킬 + 성장) / 2 를 60-90 으로 제한
+        """
+        skill_scores = np.asarray(skill_scores, dtype=np.float64)
+        growth_scores = np.asarray(growth_scores, dtype=np.float64)
+        bonus = np.where(experience_match, 5.0, 0.0) + np.where(company_size_match, 3.0, 0.0)
+        probabilities = np.minimum(skill_scores * 0.6 + growth_scores * 0.3 + bonus, 95)
+        confidences = np.clip((skill_scores + growth_scores) / 2, 60, 90)
+        return np.round(probabilities, 1), np.round(np.broadcast_to(confidences, probabilities.shape), 1)
+
+    def predict_advanced_success_probability(self, skill_score: float, growth_score: float, 
+                                           experience_match: bool = False, 
+                                           company_size_match: bool = False) -> Dict:
+        """고도화된 성공 확률 예측 (predict_success_arrays 의 단일 값 버전, 요인 분해 포함)"""
+        probability, confidence = self.predict_success_arrays(skill_score, growth_score,
+                                                              experience_match, company_size_match)
+        
+        return {
+            'probability': float(probability),
+            'confidence': float(confidence),
+            'factors': {
+                'skill_contribution': skill_score * 0.6,
+                'growth_contribution': growth_score * 0.3,
+                'experience_bonus': 5 if experience_match else 0,
+                'company_bonus': 3 if company_size_match else 0
+            }
+        }
@@ -0,0 +1,297 @@
+"""
+지표 엔진 모듈
+(데이터셋 버전, 필터 조건) 단위로 대시보드 지표를 한 번의 벡터 연산으로 계산하고 메모이즈
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils import dataset_version, filter_fingerprint, frame_fingerprint
+
+# 활성(모집 중) 공고로 보는 상태 코드
+ACTIVE_STATUSES = ('HIRING', 'RECRUITING')
+
+# 검색어는 정규식으로 적용되므로 이 문자가 있으면 포함 관계로 부분집합을 판단할 수 없음
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def normalize_filters(filter_conditions: Optional[Dict[str, Any]], columns) -> Dict[str, Any]:
+    """사이드바 필터 조건을 실제로 행을 거르는 조건만 남긴 정규형으로 변환"""
+    if not filter_conditions:
+        return {}
+    columns = set(columns)
+    predicates = {}
+
+    if filter_conditions.get('user_category', '전체') != '전체':
+        predicates['user_category'] = filter_conditions['user_category']
+    if filter_conditions.get('selected_region', '전체') != '전체':
+        predicates['selected_region'] = filter_conditions['selected_region']
+
+    flag_columns = {'reward_filter': 'join_reward', 'partner_filter': 'is_partner', 'remote_filter': 'remote_possible'}
+    for flag, column in flag_columns.items():
+        if filter_conditions.get(flag) and column in columns:
+            predicates[flag] = True
+
+    if filter_conditions.get('join_reward_range') is not None and 'join_reward' in columns:
+        low, high = filter_conditions['join_reward_range']
+        predicates['join_reward_range'] = (low, high)
+
+    set_columns = {'selected_levels': 'job_level', 'selected_sizes': 'company_size'}
+    for name, column in set_columns.items():
+        if filter_conditions.get(name) and column in columns:
+            predicates[name] = tuple(sorted(map(str, filter_conditions[name])))
+
+    if filter_conditions.get('keyword_input'):
+        predicates['keyword_input'] = filter_conditions['keyword_input'].lower()
+
+    return predicates
+
+
+def _is_narrowing(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+    """new 조건을 만족하는 행이 항상 old 조건도 만족하는지 확인"""
+    for name, old_value in old.items():
+        if name not in new:
+            return False
+        new_value = new[name]
+        if name == 'join_reward_range':
+            if not (old_value[0] <= new_value[0] and new_value[1] <= old_value[1]):
+                return False
+        elif name in ('selected_levels', 'selected_sizes'):
+            if not set(new_value) <= set(old_value):
+                return False
+        elif name == 'keyword_input':
+            # 더 긴 검색어가 기존 검색어를 포함하면 결과는 부분집합 (둘 다 일반 문자열일 때만)
+            if _REGEX_METACHARACTERS.intersection(old_value + new_value) or old_value not in new_value:
+                return False
+        elif old_value != new_value:
+            return False
+    return True
+
+
+class MetricsEngine:
+    """데이터셋 단위 컬럼 저장소 + 필터별 선택/지표 메모이즈"""
+
+    def __init__(self, df: pd.DataFrame, version: Optional[str] = None, max_entries: int = 64):
+        self.df = df
+        self.version = version or df.attrs.get('dataset_version')
+        self.max_entries = max_entries
+        self.columns = set(df.columns)
+        self._lock = threading.Lock()
+        self._selections: "OrderedDict[str, tuple]" = OrderedDict()
+        self._metrics: "OrderedDict[str, Dict]" = OrderedDict()
+
+        n = len(df)
+        self._all_positions = np.arange(n, dtype=np.int64)
+
+        # 컬럼을 한 번만 숫자/코드 배열로 변환
+        if 'join_reward' in df.columns:
+            self._reward = pd.to_numeric(df['join_reward'], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            self._reward = None
+        self._partner = self._flag_column('is_partner')
+        self._remote = self._flag_column('remote_possible')
+        if 'status_code' in df.columns:
+            self._active = df['status_code'].astype(object).isin(ACTIVE_STATUSES).to_numpy()
+        else:
+            self._active = np.ones(n, dtype=bool)
+
+        self._company_codes, self._companies = self._factorize('company_name')
+        self._category_codes, self._categories = self._factorize('job_category')
+        self._region_codes, self._regions = self._factorize('address_region')
+
+    def _flag_column(self, column: str) -> Optional[np.ndarray]:
+        if column not in self.df.columns:
+            return None
+        return pd.to_numeric(self.df[column], errors='coerce').to_numpy() == 1
+
+    def _factorize(self, column: str):
+        if column not in self.df.columns:
+            return np.full(len(self.df), -1, dtype=np.int64), np.empty(0, dtype=object)
+        codes, uniques = pd.factorize(self.df[column].astype(object), sort=True)
+        return codes.astype(np.int64), np.asarray(uniques, dtype=object)
+
+    def _code_of(self, uniques: np.ndarray, value) -> int:
+        matches = np.flatnonzero(uniques == value)
+        return int(matches[0]) if matches.size else -2
+
+    # ------------------------------------------------------------------
+    # 선택 (필터 → 행 위치)
+    # ------------------------------------------------------------------
+
+    def _predicate_mask(self, name: str, value, positions: np.ndarray) -> np.ndarray:
+        df = self.df
+        if name == 'user_category':
+            return self._category_codes[positions] == self._code_of(self._categories, value)
+        if name == 'selected_region':
+            return self._region_codes[positions] == self._code_of(self._regions, value)
+        if name == 'reward_filter':
+            return self._reward[positions] > 0
+        if name == 'partner_filter':
+            return self._partner[positions]
+        if name == 'remote_filter':
+            return self._remote[positions]
+        if name == 'join_reward_range':
+            rewards = self._reward[positions]
+            return (rewards >= value[0]) & (rewards <= value[1])
+        if name == 'selected_levels':
+            return df['job_level'].iloc[positions].isin(value).to_numpy()
+        if name == 'selected_sizes':
+            return df['company_size'].iloc[positions].isin(value).to_numpy()
+        if name == 'keyword_input':
+            subset = df.iloc[positions]
+            mask = (
+                subset['title'].str.lower().str.contains(value, na=False) |
+                subset['company_name'].str.lower().str.contains(value, na=False)
+            )
+            if 'job_skill_keywords' in subset.columns:
+                mask |= subset['job_skill_keywords'].str.lower().str.contains(value, na=False)
+            return mask.to_numpy()
+        raise ValueError(f"Unknown filter predicate: {name}")
+
+    def select(self, predicates: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """필터 조건을 만족하는 행 위치 배열 (원본 순서 유지)"""
+        predicates = predicates or {}
+        key = filter_fingerprint(predicates)
+        with self._lock:
+            if key in self._selections:
+                self._selections.move_to_end(key)
+                return self._selections[key][1]
+
+            # 조건이 좁아진 경우 기존 선택 결과 안에서만 다시 평가
+            base = self._all_positions
+            for cached_predicates, cached_positions in reversed(list(self._selections.values())):
+                if len(cached_positions) < len(base) and _is_narrowing(cached_predicates, predicates):
+                    base = cached_positions
+
+        positions = base
+        for name, value in predicates.items():
+            if positions.size == 0:
+                break
+            positions = positions[self._predicate_mask(name, value, positions)]
+
+        with self._lock:
+            self._selections[key] = (dict(predicates), positions)
+            while len(self._selections) > self.max_entries:
+                self._selections.popitem(last=False)
+        return positions
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+
+    def metrics(self, predicates: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """필터 조건에 해당하는 공통 지표 (메모이즈)"""
+        predicates = predicates or {}
+        key = filter_fingerprint(predicates)
+        with self._lock:
+            if key in self._metrics:
+                self._metrics.move_to_end(key)
+                return self._metrics[key]
+
+        result = self._compute(self.select(predicates))
+
+        with self._lock:
+            self._metrics[key] = result
+            while len(self._metrics) > self.max_entries:
+                self._metrics.popitem(last=False)
+        return result
+
+    def _counts(self, codes: np.ndarray, uniques: np.ndarray) -> Dict[str, int]:
+        valid = codes[codes >= 0]
+        if valid.size == 0:
+            return {}
+        counts = np.bincount(valid, minlength=len(uniques))
+        order = np.argsort(-counts, kind='stable')
+        return {uniques[i]: int(counts[i]) for i in order if counts[i] > 0}
+
+    def _compute(self, positions: np.ndarray) -> Dict[str, Any]:
+        total = int(positions.size)
+
+        active = int(self._active[positions].sum())
+        partner = int(self._partner[positions].sum()) if self._partner is not None else 0
+        remote = int(self._remote[positions].sum()) if self._remote is not None else 0
+
+        company_codes = self._company_codes[positions]
+        company_codes = company_codes[company_codes >= 0]
+        unique_companies = int(np.count_nonzero(np.bincount(company_codes))) if company_codes.size else 0
+
+        avg_reward = max_reward = avg_positive = max_positive = 0.0
+        reward_jobs = 0
+        if self._reward is not None and total:
+            rewards = self._reward[positions]
+            rewards = rewards[~np.isnan(rewards)]
+            if rewards.size:
+                avg_reward = float(rewards.mean())
+                max_reward = float(rewards.max())
+                positive = rewards[rewards > 0]
+                reward_jobs = int(positive.size)
+                if reward_jobs:
+                    avg_positive = float(positive.mean())
+                    max_positive = float(positive.max())
+
+        category_counts = self._counts(self._category_codes[positions], self._categories)
+        region_codes = self._region_codes[positions]
+        region_counts = self._counts(region_codes, self._regions)
+        valid_regions = region_codes[region_codes >= 0]
+        top_region = self._regions[np.bincount(valid_regions).argmax()] if valid_regions.size else "N/A"
+
+        rate = (lambda count: count / total * 100) if total else (lambda count: 0.0)
+        return {
+            'total_jobs': total,
+            'active_jobs': active,
+            'active_rate': rate(active),
+            'partner_count': partner,
+            'partner_rate': rate(partner),
+            'remote_count': remote,
+            'remote_rate': rate(remote),
+            'unique_companies': unique_companies,
+            'avg_reward': avg_reward,
+            'max_reward': max_reward,
+            'reward_job_count': reward_jobs,
+            'reward_job_rate': rate(reward_jobs),
+            'avg_positive_reward': avg_positive,
+            'max_positive_reward': max_positive,
+            'category_counts': category_counts,
+            'region_counts': region_counts,
+            'top_region': top_region,
+        }
+
+
+class MetricsEngineCache:
+    """프레임 지문(데이터셋 버전 + 행 구성)별 지표 엔진 LRU (Streamlit 밖의 유틸리티 경로용)
+
+    같은 프레임으로 반복 호출하면 컬럼 변환과 선택/지표 메모이즈를 재사용한다.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._engines: "OrderedDict[str, MetricsEngine]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame) -> MetricsEngine:
+        version = dataset_version(df)  # 버전이 없는 임의 프레임은 내용 해시로 버전 부여
+        key = frame_fingerprint(df)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+
+        engine = MetricsEngine(df, version=version)
+        with self._lock:
+            self._engines[key] = engine
+            while len(self._engines) > self.max_entries:
+                self._engines.popitem(last=False)
+        return engine
+
+    def clear(self):
+        with self._lock:
+            self._engines.clear()
+
+
+# 전역 지표 엔진 캐시 인스턴스
+metrics_engines = MetricsEngineCache()
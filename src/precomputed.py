@@ -0,0 +1,89 @@
+"""
+사전 계산 저장소 모듈
+오프라인 단계에서 만든 테이블/배열/메타데이터를 스냅샷 단위로 저장하고 로드
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path(os.environ.get('RALLIT_PRECOMPUTED_DIR', Path('data') / 'precomputed'))
+
+
+class PrecomputedStore:
+    """이름 단위로 테이블(.csv.gz), 배열(.npz), 메타데이터(.json)를 보관하는 저장소"""
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root else DEFAULT_ROOT
+
+    def _path(self, name: str, suffix: str) -> Path:
+        return self.root / f"{name}{suffix}"
+
+    def _write(self, path: Path, writer):
+        """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 함"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+
+    def exists(self, name: str) -> bool:
+        return any(self._path(name, suffix).exists() for suffix in ('.csv.gz', '.npz', '.json'))
+
+    # 테이블
+    def save_table(self, name: str, df: pd.DataFrame):
+        self._write(self._path(name, '.csv.gz'),
+                    lambda path: df.to_csv(path, index=False, compression='gzip'))
+
+    def load_table(self, name: str) -> Optional[pd.DataFrame]:
+        path = self._path(name, '.csv.gz')
+        if not path.exists():
+            return None
+        try:
+            return pd.read_csv(path, compression='gzip', keep_default_na=False)
+        except Exception as e:
+            logger.error(f"Precomputed table load error ({name}): {e}")
+            return None
+
+    # 배열
+    def save_arrays(self, name: str, **arrays: np.ndarray):
+        def writer(path: Path):
+            with open(path, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+        self._write(self._path(name, '.npz'), writer)
+
+    def load_arrays(self, name: str) -> Optional[Dict[str, np.ndarray]]:
+        path = self._path(name, '.npz')
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return {key: data[key] for key in data.files}
+        except Exception as e:
+            logger.error(f"Precomputed array load error ({name}): {e}")
+            return None
+
+    # 메타데이터
+    def save_meta(self, name: str, meta: Dict[str, Any]):
+        self._write(self._path(name, '.json'),
+                    lambda path: path.write_text(json.dumps(meta, ensure_ascii=False, indent=2, default=str), encoding='utf-8'))
+
+    def load_meta(self, name: str) -> Dict[str, Any]:
+        path = self._path(name, '.json')
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except Exception as e:
+            logger.error(f"Precomputed meta load error ({name}): {e}")
+            return {}
+
+
+# 전역 저장소 인스턴스
+precomputed_store = PrecomputedStore()
@@ -0,0 +1,76 @@
+"""
+순위 모듈
+점수 내림차순 + id 오름차순(동점 처리)의 결정적 순서로 상위 k 개 / 페이지를
+argpartition 으로 뽑고 페이지 크기만큼만 정렬
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+def _sorted_candidates(scores: np.ndarray, ids: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """후보 위치를 (점수 내림차순, id 오름차순)으로 정렬"""
+    order = np.lexsort((ids[candidates], -scores[candidates]))
+    return candidates[order]
+
+
+def rank_window(scores: np.ndarray, ids: np.ndarray, start: int, stop: int,
+                within: Optional[np.ndarray] = None) -> np.ndarray:
+    """순위 [start, stop) 구간의 위치 (argpartition 으로 경계 점수를 찾고 그 사이 후보만 정렬)"""
+    positions = np.arange(len(scores)) if within is None else within
+    stop = min(stop, positions.size)
+    if start >= stop:
+        return np.zeros(0, dtype=np.int64)
+
+    values = scores[positions]
+    partitioned = np.argpartition(-values, [start, stop - 1])
+    high = values[partitioned[start]]
+    low = values[partitioned[stop - 1]]
+    # high 보다 큰 항목은 모두 구간 앞, 경계 동점은 id 순서로 잘라야 하므로 후보에 포함
+    above = int(np.count_nonzero(values > high))
+    candidates = positions[(values <= high) & (values >= low)]
+    return _sorted_candidates(scores, ids, candidates)[start - above:stop - above]
+
+
+def top_k(scores: np.ndarray, ids: np.ndarray, k: int, within: Optional[np.ndarray] = None) -> np.ndarray:
+    """상위 k 개 위치 (전체 정렬 없음)"""
+    return rank_window(scores, ids, 0, k, within)
+
+
+def ranked_page(scores, ids, page: int = 1, page_size: int = 20,
+                cursor: Optional[Tuple[float, object]] = None) -> Dict:
+    """순위 페이지 (positions 는 입력 배열 기준 위치, cursor 는 다음 페이지 요청용 - 마지막 페이지면 None)
+
+    cursor 가 주어지면 (마지막 점수, 마지막 id) 다음 항목부터, 아니면 page 번호(1부터) 기준.
+    같은 입력이면 재실행 간에도 항상 같은 페이지를 반환한다.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    ids = np.asarray(ids)
+    total = int(scores.size)
+    page_size = max(int(page_size), 1)
+
+    if cursor is not None:
+        last_score, last_id = cursor
+        after = np.flatnonzero((scores < last_score) | ((scores == last_score) & (ids > last_id)))
+        positions = top_k(scores, ids, page_size, within=after)
+        page = (total - after.size) // page_size + 1
+        remaining = after.size - positions.size
+    else:
+        page = max(int(page), 1)
+        offset = (page - 1) * page_size
+        positions = rank_window(scores, ids, offset, offset + page_size)
+        remaining = total - offset - positions.size
+
+    next_cursor = None
+    if remaining > 0 and positions.size:
+        last = positions[-1]
+        next_cursor = (float(scores[last]), ids[last].item() if hasattr(ids[last], 'item') else ids[last])
+    return {
+        'positions': positions,
+        'page': page,
+        'page_size': page_size,
+        'total': total,
+        'total_pages': max((total + page_size - 1) // page_size, 1),
+        'cursor': next_cursor,
+    }
@@ -0,0 +1,142 @@
+"""
+랭킹 캐시 모듈
+(데이터셋 버전·선택 행, 정규화된 스킬 집합, 성장 프로필 필드) 단위로 성장 잠재력 분석과
+전체 공고 매칭 점수 배열을 세션 간에 공유하여 같은 프로필은 데이터 버전당 한 번만 계산
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.match_results import MatchResultSet
+from src.skill_canon import skill_canon
+from src.skill_taxonomy import skill_taxonomy
+from src.utils import dataset_version, frame_fingerprint
+
+# 성장 잠재력 분석에 쓰이는 프로필 필드 (스킬 제외)
+GROWTH_PROFILE_FIELDS = ('recent_courses', 'project_count', 'github_contributions')
+
+_MISSING = object()
+
+
+def canonical_skills(skills) -> Tuple[str, ...]:
+    """스킬 목록 정규화 (정규 스킬 이름, 중복 제거, 정렬 - 표기만 다른 입력은 같은 키, 모르는 스킬은 제외)"""
+    return tuple(skill_canon.names_of(skill_canon.ids(skills)))
+
+
+def growth_profile_key(user_profile: Dict) -> Tuple:
+    """성장 분석 키 (정규화된 스킬 + 성장 프로필 필드)"""
+    return (canonical_skills(user_profile.get('skills')),) + tuple(
+        user_profile.get(field, 0) for field in GROWTH_PROFILE_FIELDS
+    )
+
+
+def _entry_bytes(value: Any) -> int:
+    """캐시 항목 크기 추정 (NumPy 배열은 nbytes, 그 외는 얕은 크기)"""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_entry_bytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_entry_bytes(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+class RankingCache:
+    """프로세스 전역 랭킹 캐시 (LRU + 메모리 예산 축출, 적중/미스 집계)
+
+    캐시된 값은 세션 간에 공유되므로 반환받은 쪽에서 수정하지 않는다.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """캐시된 값 반환, 없으면 compute() 결과를 저장 후 반환 (예산보다 큰 값은 저장하지 않음)"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = compute()
+        size = _entry_bytes(value)
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return value
+
+    def growth_analysis(self, user_profile: Dict, matching_engine) -> Tuple[float, List[str], Dict]:
+        """analyze_advanced_growth_potential 캐시 버전 (데이터셋과 무관하므로 프로필만 키로 사용)"""
+        key = ('growth',) + growth_profile_key(user_profile)
+
+        def compute():
+            profile = {field: user_profile.get(field, 0) for field in GROWTH_PROFILE_FIELDS}
+            profile['skills'] = list(key[1])
+            return matching_engine.analyze_advanced_growth_potential(profile)
+
+        score, factors, analysis = self.get_or_compute(key, compute)
+        return score, list(factors), dict(analysis)
+
+    def match_results(self, frame: pd.DataFrame, user_profile: Dict, growth_score: float,
+                      matching_engine, min_score: float = 15, index=None) -> MatchResultSet:
+        """MatchResultSet.score 캐시 버전 (점수 배열만 공유하고 결과 집합은 현재 프레임에 다시 연결)
+
+        index(LSHIndex)가 주어지면 후보 공고만 정확히 채점한다.
+        """
+        dataset_version(frame)  # 버전이 없는 임의 프레임은 내용 해시로 버전 부여
+        skills = canonical_skills(user_profile.get('skills'))
+        key = ('match', frame_fingerprint(frame), skills, float(growth_score), float(min_score),
+               index.version if index is not None else None, skill_taxonomy.version)
+
+        def compute():
+            candidates = index.candidate_positions(frame, list(skills)) if index is not None else None
+            results = MatchResultSet.score(frame, list(skills), growth_score, matching_engine, min_score, candidates)
+            return (results.row_positions, results.skill_scores, results.probabilities, results.confidences)
+
+        row_positions, skill_scores, probabilities, confidences = self.get_or_compute(key, compute)
+        return MatchResultSet(frame, row_positions, skill_scores, probabilities, confidences,
+                              list(skills), matching_engine)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+# 전역 랭킹 캐시 인스턴스
+ranking_cache = RankingCache()
@@ -0,0 +1,219 @@
+"""
+샤드 매칭 모듈
+공고를 job_category 별로 나누고 카테고리 안에서는 id 해시로 다시 나눈 파티션을 샤드에 균형 배치,
+샤드 행렬은 공유 메모리에 올려 워커 프로세스가 복사 없이 사용
+질의는 모든 샤드로 분산(scatter)되고 샤드별 로컬 상위 k 를 코디네이터가 병합(gather)
+
+실행: python -m src.sharded_matching profiles.jsonl -o recommendations.parquet --shards 4
+"""
+
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.batch_matching import (BatchMatcher, load_profiles, profile_skill_matrix, score_postings,
+                                select_top_k, write_recommendations)
+from src.matching_engine import AdvancedMatchingEngine
+from src.ranking import top_k
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스에 붙인 샤드 배열 (샤드 번호 → 배열 dict) 과 공유 메모리 핸들
+_worker_shards: Dict[int, Dict[str, np.ndarray]] = {}
+_worker_handles: List[shared_memory.SharedMemory] = []
+_worker_engine: Optional[AdvancedMatchingEngine] = None
+
+
+def assign_shards(categories: np.ndarray, ids: np.ndarray, n_shards: int) -> np.ndarray:
+    """공고별 샤드 번호
+
+    카테고리마다 크기에 비례한 수의 id 해시 파티션을 만들고, 큰 파티션부터 가장 가벼운 샤드에 배치한다.
+    같은 카테고리·같은 해시 파티션의 공고는 항상 같은 샤드에 모인다.
+    """
+    codes, _ = pd.factorize(pd.Series(categories))
+    id_hashes = pd.util.hash_pandas_object(pd.Series(ids), index=False).to_numpy()
+    total = max(len(codes), 1)
+
+    partition = np.zeros(len(codes), dtype=np.int64)
+    partition_sizes = {}
+    for code in np.unique(codes):
+        members = np.flatnonzero(codes == code)
+        splits = max(int(round(n_shards * members.size / total)), 1)
+        buckets = (id_hashes[members] % np.uint64(splits)).astype(np.int64)
+        partition[members] = (code + 1) * n_shards + buckets
+        for bucket, size in zip(*np.unique(buckets, return_counts=True)):
+            partition_sizes[(code + 1) * n_shards + bucket] = int(size)
+
+    loads = np.zeros(n_shards, dtype=np.int64)
+    shard_of_partition = {}
+    for key, size in sorted(partition_sizes.items(), key=lambda item: (-item[1], item[0])):
+        shard = int(np.argmin(loads))
+        shard_of_partition[key] = shard
+        loads[shard] += size
+    return np.array([shard_of_partition[p] for p in partition], dtype=np.int64)
+
+
+def _attach_shards(specs: Dict[int, Dict[str, Tuple[str, str, Tuple[int, ...]]]]):
+    """워커 초기화: 공유 메모리 블록을 배열로 연결 (복사 없음)"""
+    global _worker_engine
+    for shard, arrays in specs.items():
+        _worker_shards[shard] = {}
+        for name, (block_name, dtype, shape) in arrays.items():
+            # 워커는 코디네이터의 resource tracker 를 공유하므로 블록 해제(unlink)는 코디네이터만 수행
+            handle = shared_memory.SharedMemory(name=block_name)
+            _worker_handles.append(handle)
+            _worker_shards[shard][name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=handle.buf)
+    _worker_engine = AdvancedMatchingEngine()
+
+
+def _shard_top_k(shard: int, profile_matrix: sparse.csr_matrix, bonus: np.ndarray, growth: np.ndarray,
+                 k: int, min_score: float) -> Tuple[int, float, List[Tuple]]:
+    """한 샤드의 프로필별 로컬 상위 k (위치는 전체 공고 기준), 샤드 처리 시간(초) 포함"""
+    started = time.perf_counter()
+    arrays = _worker_shards[shard]
+    posting_matrix_t = sparse.csr_matrix(
+        (arrays['data'], arrays['indices'], arrays['indptr']), shape=tuple(arrays['shape'])
+    )
+    scores = score_postings(profile_matrix, posting_matrix_t, arrays['total_weights'], bonus, arrays['category_codes'])
+    selections = select_top_k(scores, growth, arrays['ids'], _worker_engine, k, min_score)
+    selections = [(arrays['positions'][positions], *rest) for positions, *rest in selections]
+    return shard, time.perf_counter() - started, selections
+
+
+class ShardedMatcher(BatchMatcher):
+    """샤드 분산 매칭 (BatchMatcher 와 같은 결과, 프로필 청크를 샤드 워커들이 병렬 처리)
+
+    사용 후 close() 로 워커와 공유 메모리를 정리한다 (with 문 지원).
+    """
+
+    def __init__(self, postings: pd.DataFrame, n_shards: Optional[int] = None,
+                 matching_engine: Optional[AdvancedMatchingEngine] = None, benchmark=None):
+        super().__init__(postings, matching_engine, benchmark)
+        self.n_shards = n_shards or os.cpu_count() or 1
+        # 공유 메모리에 올리기 위해 id 를 숫자 순위로 (id 오름차순 동점 처리 순서 유지)
+        _, self.id_ranks = np.unique(self.ids, return_inverse=True)
+        self.shard_of = assign_shards(self.category_codes, self.ids, self.n_shards)
+
+        self._blocks: List[shared_memory.SharedMemory] = []
+        specs = {shard: self._share_shard(np.flatnonzero(self.shard_of == shard)) for shard in range(self.n_shards)}
+        self.shard_sizes = np.bincount(self.shard_of, minlength=self.n_shards)
+        self._latencies: Dict[int, List[float]] = {shard: [] for shard in range(self.n_shards)}
+        self._pool = ProcessPoolExecutor(max_workers=self.n_shards, initializer=_attach_shards, initargs=(specs,))
+
+    def _share(self, array: np.ndarray) -> Tuple[str, str, Tuple[int, ...]]:
+        array = np.ascontiguousarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        self._blocks.append(block)
+        return block.name, array.dtype.str, array.shape
+
+    def _share_shard(self, positions: np.ndarray) -> Dict[str, Tuple[str, str, Tuple[int, ...]]]:
+        """샤드 공고의 전치 가중치 CSR 과 부가 배열을 공유 메모리로"""
+        matrix_t = self.matrix[positions].T.tocsr()
+        return {
+            'data': self._share(matrix_t.data),
+            'indices': self._share(matrix_t.indices),
+            'indptr': self._share(matrix_t.indptr),
+            'shape': self._share(np.array(matrix_t.shape, dtype=np.int64)),
+            'total_weights': self._share(self.total_weights[positions]),
+            'category_codes': self._share(self.category_codes[positions]),
+            'ids': self._share(self.id_ranks[positions]),
+            'positions': self._share(positions.astype(np.int64)),
+        }
+
+    def recommend(self, profiles: List[Dict], k: int = 20, min_score: float = 15) -> pd.DataFrame:
+        """모든 샤드에 질의를 분산하고 샤드별 로컬 상위 k 를 병합"""
+        profile_matrix = profile_skill_matrix(profiles, self.vocabulary)
+        bonus = self.category_bonus(profiles)
+        growth = self.growth_scores(profiles)
+
+        futures = [self._pool.submit(_shard_top_k, shard, profile_matrix, bonus, growth, k, min_score)
+                   for shard in range(self.n_shards) if self.shard_sizes[shard]]
+        shard_results = []
+        for future in futures:
+            shard, elapsed, selections = future.result()
+            self._latencies[shard].append(elapsed)
+            shard_results.append(selections)
+
+        merged = []
+        for i in range(len(profiles)):
+            positions, scores, probabilities, confidences = (
+                np.concatenate(part) for part in zip(*(selections[i] for selections in shard_results))
+            ) if shard_results else (np.zeros(0, dtype=np.int64),) * 4
+            order = top_k(probabilities, self.id_ranks[positions], k)
+            merged.append((positions[order], scores[order], probabilities[order], confidences[order]))
+        return self.recommendation_frame(profiles, growth, merged)
+
+    def shard_metrics(self) -> Dict[int, Dict]:
+        """샤드별 공고 수와 처리 지연 (ms)"""
+        metrics = {}
+        for shard, latencies in self._latencies.items():
+            values = np.array(latencies) * 1000
+            metrics[shard] = {
+                'postings': int(self.shard_sizes[shard]),
+                'calls': int(values.size),
+                'mean_ms': float(values.mean()) if values.size else 0.0,
+                'p95_ms': float(np.percentile(values, 95)) if values.size else 0.0,
+                'max_ms': float(values.max()) if values.size else 0.0,
+            }
+        return metrics
+
+    def close(self):
+        self._pool.shutdown()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """오프라인 실행 진입점: 샤드 분산 일괄 매칭"""
+    from src.data_loader import DataLoader
+
+    parser = argparse.ArgumentParser(description="샤드 분산 프로필 일괄 매칭")
+    parser.add_argument('profiles', help="프로필 CSV 또는 JSONL")
+    parser.add_argument('-o', '--output', default='recommendations.parquet', help="출력 경로 (.parquet 또는 .jsonl)")
+    parser.add_argument('-k', '--top-k', type=int, default=20)
+    parser.add_argument('--min-score', type=float, default=15)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--shards', type=int, default=None, help="샤드(워커 프로세스) 수, 기본값 CPU 코어 수")
+    parser.add_argument('--cohorts', action='store_true',
+                        help="프로필의 코호트(직무 카테고리 × 경력 구간) 백분위를 함께 기록")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    postings = DataLoader().load_postings()
+    if postings.empty:
+        logger.error("No postings to match")
+        return
+
+    benchmark = None
+    if args.cohorts:
+        from src.cohort_benchmark import CohortBenchmark
+        benchmark = CohortBenchmark(postings)
+    profiles = load_profiles(args.profiles)
+    with ShardedMatcher(postings, args.shards, benchmark=benchmark) as matcher:
+        written = write_recommendations(
+            matcher.iter_recommendations(profiles, args.top_k, args.min_score, args.chunk_size), args.output
+        )
+        for shard, metrics in matcher.shard_metrics().items():
+            logger.info(f"shard {shard}: {metrics}")
+    print(f"{written} recommendations for {len(profiles)} profiles → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
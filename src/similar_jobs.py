@@ -0,0 +1,218 @@
+"""
+비슷한 공고 모듈
+공고별 특징 벡터(요구 스킬 + 직무 + 지역, L2 정규화)의 코사인 유사도 상위 k 이웃을
+블록 단위 희소 행렬 곱으로 미리 계산하여 (공고 수 × k) int32 이웃 / float32 점수 배열로 보관
+
+새 스냅샷에서는 추가/변경된 공고와, 이웃 목록에 삭제·변경 공고가 있던 공고만 다시 계산하고
+나머지는 기존 이웃과 변경 공고 후보를 병합
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.precomputed import PrecomputedStore, precomputed_store
+from src.ranking import top_k
+from src.skill_canon import skill_canon
+from src.utils import posting_hashes, source_version
+
+logger = logging.getLogger(__name__)
+
+# 특징 벡터에 쓰이는 컬럼 (내용 해시 대상)
+HASH_COLUMNS = ['job_skill_keywords', 'job_category', 'address_region']
+# 스킬 1개 대비 직무/지역 일치의 가중치
+CATEGORY_WEIGHT = 0.5
+REGION_WEIGHT = 0.3
+
+
+def feature_matrix(df: pd.DataFrame) -> sparse.csr_matrix:
+    """공고 × 특징 L2 정규화 CSR (행 벡터는 그 공고 내용에만 의존하여 스냅샷 간 내적이 보존됨)"""
+    vocabulary: Dict[str, int] = {}
+    rows, cols, values = [], [], []
+
+    def add(i: int, feature: str, weight: float):
+        rows.append(i)
+        cols.append(vocabulary.setdefault(feature, len(vocabulary)))
+        values.append(weight)
+
+    skills = df['job_skill_keywords'] if 'job_skill_keywords' in df.columns else pd.Series(None, index=df.index)
+    categories = df['job_category'] if 'job_category' in df.columns else pd.Series(None, index=df.index)
+    regions = df['address_region'] if 'address_region' in df.columns else pd.Series(None, index=df.index)
+    for i, (text, category, region) in enumerate(zip(skills, categories, regions)):
+        for skill in skill_canon.names_of(np.unique(skill_canon.parse(text))):
+            add(i, f"skill:{skill}", 1.0)
+        if isinstance(category, str) and category:
+            add(i, f"category:{category}", CATEGORY_WEIGHT)
+        if isinstance(region, str) and region:
+            add(i, f"region:{region}", REGION_WEIGHT)
+
+    matrix = sparse.csr_matrix((values, (rows, cols)), shape=(len(df), max(len(vocabulary), 1)))
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix)
+
+
+def _top_neighbors(similarities: np.ndarray, self_position: int, ids: np.ndarray, k: int,
+                   candidates: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """한 공고의 유사도 양수 이웃 상위 k (유사도 내림차순, 동점은 id 순), 부족분은 -1 / 0"""
+    if candidates is None:
+        candidates = np.flatnonzero(similarities > 0)
+    candidates = candidates[(candidates != self_position) & (similarities[candidates] > 0)]
+    positions = top_k(similarities, ids, k, within=candidates)
+    neighbors = np.full(k, -1, dtype=np.int32)
+    scores = np.zeros(k, dtype=np.float32)
+    neighbors[:positions.size] = positions
+    scores[:positions.size] = similarities[positions]
+    return neighbors, scores
+
+
+def knn_table(features: sparse.csr_matrix, ids: np.ndarray, rows: np.ndarray, k: int,
+              block_size: int = 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """rows 공고들의 k-NN (block_size 행씩 X[block] · Xᵀ 를 계산하여 메모리 제한)"""
+    neighbors = np.full((rows.size, k), -1, dtype=np.int32)
+    scores = np.zeros((rows.size, k), dtype=np.float32)
+    features_t = features.T.tocsr()
+    for start in range(0, rows.size, block_size):
+        block = rows[start:start + block_size]
+        # float32 로 맞춰 전체 계산과 증분 병합의 동점 판정을 일치시킴
+        similarities = (features[block] @ features_t).toarray().astype(np.float32).astype(np.float64)
+        for offset, row in enumerate(block):
+            neighbors[start + offset], scores[start + offset] = _top_neighbors(similarities[offset], row, ids, k)
+    return neighbors, scores
+
+
+class SimilarJobsTable:
+    """스냅샷 단위 증분 "비슷한 공고" k-NN 테이블"""
+
+    NAME = 'similar_jobs'
+
+    def __init__(self, store: Optional[PrecomputedStore] = None, k: int = 10, rebuild_ratio: float = 0.5):
+        self.store = store or precomputed_store
+        self.k = k
+        self.rebuild_ratio = rebuild_ratio
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._row_of: Dict = {}
+
+    def is_current(self, df: pd.DataFrame) -> bool:
+        """저장된 테이블이 현재 원천 공고 버전 기준인지 확인"""
+        meta = self.store.load_meta(self.NAME)
+        return meta.get('source_version') == source_version(df, HASH_COLUMNS) and meta.get('k') == self.k
+
+    def update(self, df: pd.DataFrame) -> Dict:
+        """새 스냅샷 반영 (이전 테이블이 없거나 변경 비율이 rebuild_ratio 를 넘으면 전체 계산)"""
+        ids = df['id'].to_numpy()
+        hashes = posting_hashes(df, HASH_COLUMNS).to_numpy()
+        features = feature_matrix(df)
+
+        previous = self.store.load_arrays(self.NAME)
+        if previous is not None and (previous['neighbors'].shape[1] != self.k or previous['ids'].dtype != ids.dtype):
+            previous = None
+
+        changed = np.ones(len(df), dtype=bool)
+        if previous is not None:
+            previous_hash = pd.Series(previous['content_hash'], index=previous['ids'])
+            changed = previous_hash.reindex(ids).to_numpy() != hashes
+
+        if previous is None or changed.mean() > self.rebuild_ratio:
+            neighbors, scores = knn_table(features, ids, np.arange(len(df)), self.k)
+            recomputed = len(df)
+        else:
+            neighbors, scores, recomputed = self._incremental(previous, features, ids, changed)
+
+        self.store.save_arrays(self.NAME, ids=ids, content_hash=hashes, neighbors=neighbors, scores=scores)
+        summary = {
+            'source_version': source_version(df, HASH_COLUMNS),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'k': self.k,
+            'postings': len(df),
+            'added_or_changed': int(changed.sum()),
+            'recomputed': int(recomputed),
+        }
+        self.store.save_meta(self.NAME, summary)
+        self._arrays = None
+        logger.info(f"Similar jobs table updated: {summary}")
+        return summary
+
+    def _incremental(self, previous: Dict[str, np.ndarray], features: sparse.csr_matrix,
+                     ids: np.ndarray, changed: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+        """변경 공고와 이웃이 무효화된 공고만 재계산, 나머지는 기존 이웃 + 변경 공고 후보 병합"""
+        position_of = pd.Series(np.arange(len(ids)), index=ids)
+        unchanged_ids = set(ids[~changed])
+
+        # 이전 이웃 → 현재 위치 (삭제·변경된 이웃은 -1)
+        previous_neighbors = previous['neighbors']
+        neighbor_ids = np.where(previous_neighbors >= 0, previous['ids'][np.maximum(previous_neighbors, 0)], ids[0])
+        valid = (previous_neighbors >= 0) & np.isin(neighbor_ids, list(unchanged_ids))
+        mapped = np.where(valid, position_of.reindex(neighbor_ids.ravel()).fillna(-1).to_numpy().reshape(neighbor_ids.shape), -1)
+        previous_row = pd.Series(np.arange(len(previous['ids'])), index=previous['ids']).reindex(ids).to_numpy()
+
+        # 이웃 목록이 가득 찼는데 무효 이웃이 있으면 k+1 번째 이후 후보를 알 수 없으므로 재계산
+        # (목록이 덜 찼다면 유사도 양수인 공고가 모두 목록에 있었으므로 병합으로 충분)
+        rows_previous = previous_row[~changed].astype(np.int64)
+        full = previous_neighbors[rows_previous, -1] >= 0
+        lost = full & ((previous_neighbors[rows_previous] >= 0) & ~valid[rows_previous]).any(axis=1)
+        recompute = np.concatenate([np.flatnonzero(changed), np.flatnonzero(~changed)[lost]])
+        merge_rows = np.flatnonzero(~changed)[~lost]
+
+        neighbors = np.full((len(ids), self.k), -1, dtype=np.int32)
+        scores = np.zeros((len(ids), self.k), dtype=np.float32)
+        recomputed_neighbors, recomputed_scores = knn_table(features, ids, recompute, self.k)
+        neighbors[recompute], scores[recompute] = recomputed_neighbors, recomputed_scores
+
+        # 변경 공고와 나머지 공고의 유사도 (n × 변경 수, 희소)
+        changed_rows = np.flatnonzero(changed)
+        cross = (features @ features[changed_rows].T).tocsr()
+        similarities = np.zeros(len(ids))
+        for row in merge_rows:
+            old = int(previous_row[row])
+            old_positions = mapped[old][mapped[old] >= 0].astype(np.int64)
+            start, end = cross.indptr[row], cross.indptr[row + 1]
+            new_positions = changed_rows[cross.indices[start:end]]
+            similarities[old_positions] = previous['scores'][old][mapped[old] >= 0]
+            similarities[new_positions] = cross.data[start:end].astype(np.float32)
+            candidates = np.concatenate([old_positions, new_positions])
+            neighbors[row], scores[row] = _top_neighbors(similarities, row, ids, self.k, candidates)
+            similarities[candidates] = 0
+        return neighbors, scores, recompute.size
+
+    def _load(self) -> Optional[Dict[str, np.ndarray]]:
+        if self._arrays is None:
+            self._arrays = self.store.load_arrays(self.NAME)
+            self._row_of = {} if self._arrays is None else \
+                {posting_id: row for row, posting_id in enumerate(self._arrays['ids'].tolist())}
+        return self._arrays
+
+    def similar(self, posting_id, k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """비슷한 공고의 (테이블 행 위치, 유사도) - 테이블과 같은 버전의 프레임에서는 행 위치 = iloc 위치"""
+        arrays = self._load()
+        row = self._row_of.get(posting_id) if arrays is not None else None
+        if row is None:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+        neighbors, scores = arrays['neighbors'][row], arrays['scores'][row]
+        keep = neighbors >= 0
+        return neighbors[keep][:k], scores[keep][:k]
+
+    def similar_postings(self, df: pd.DataFrame, posting_id, k: Optional[int] = None) -> pd.DataFrame:
+        """비슷한 공고 행 + similarity 컬럼 (df 는 테이블과 같은 데이터셋 버전의 전체 프레임)"""
+        positions, scores = self.similar(posting_id, k)
+        return df.iloc[positions].assign(similarity=scores)
+
+
+def main():
+    """오프라인 실행 진입점: 현재 데이터로 테이블 갱신"""
+    from src.data_loader import DataLoader
+
+    logging.basicConfig(level=logging.INFO)
+    df = DataLoader().load_postings()
+    if df.empty:
+        logger.error("No postings to index")
+        return
+    print(SimilarJobsTable().update(df))
+
+
+if __name__ == '__main__':
+    main()
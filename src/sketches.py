@@ -0,0 +1,338 @@
+"""
+스트리밍 스케치 모듈
+파티션별로 유지하고 조회 시점에 병합하는 근사 통계 스케치 제공
+(KLL 분위수, HyperLogLog 고유값 수, Count-Min 빈도/헤비히터)
+"""
+
+import heapq
+import math
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 해시 시드 (pandas hash_array 는 16자리 키를 요구)
+_HASH_KEYS = [f"rallit-sketch-{i:02d}" for i in range(16)]
+
+
+def _hash_values(values: Iterable, seed: int = 0) -> np.ndarray:
+    """임의 값 배열을 결정적 uint64 해시로 변환"""
+    arr = np.asarray(list(values) if not isinstance(values, (np.ndarray, pd.Series)) else values, dtype=object)
+    if arr.size == 0:
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_array(arr.astype(str), hash_key=_HASH_KEYS[seed % len(_HASH_KEYS)])
+
+
+class KLLSketch:
+    """KLL 분위수 스케치 (병합 가능)"""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.k = k
+        self.c = 2.0 / 3.0
+        self.n = 0
+        self.compactors: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * (self.c ** depth))))
+
+    def _size(self) -> int:
+        return sum(len(c) for c in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def _compress(self):
+        """용량을 넘은 첫 레벨을 절반으로 압축하여 상위 레벨로 승격"""
+        for level in range(len(self.compactors)):
+            if len(self.compactors[level]) >= self._capacity(level):
+                if level + 1 >= len(self.compactors):
+                    self.compactors.append(np.empty(0, dtype=np.float64))
+                items = np.sort(self.compactors[level])
+                offset = self._rng.randint(0, 1)
+                promoted = items[offset::2]
+                # 홀수 개면 마지막 원소는 현재 레벨에 남김
+                if len(items) % 2 == 1:
+                    promoted = items[offset:-1:2]
+                    remainder = items[-1:]
+                else:
+                    remainder = np.empty(0, dtype=np.float64)
+                self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+                self.compactors[level] = remainder
+                return
+
+    def update(self, value: float):
+        """단일 값 추가"""
+        self.update_many([value])
+
+    def update_many(self, values) -> "KLLSketch":
+        """값 배열 일괄 추가"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self.n += int(values.size)
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        while self._size() > self._max_size():
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """다른 스케치를 현재 스케치에 병합"""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.n += other.n
+        while self._size() > self._max_size():
+            self._compress()
+        return self
+
+    def _weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([
+            np.full(len(c), 2 ** level, dtype=np.float64) for level, c in enumerate(self.compactors)
+        ])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    def quantile(self, q: float) -> float:
+        """q 분위수 추정 (0 ≤ q ≤ 1)"""
+        return float(self.quantiles([q])[0])
+
+    def quantiles(self, qs: List[float]) -> np.ndarray:
+        """여러 분위수를 한 번에 추정"""
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights)
+        targets = np.asarray(qs, dtype=np.float64) * cumulative[-1]
+        positions = np.searchsorted(cumulative, targets, side='left')
+        return items[np.clip(positions, 0, len(items) - 1)]
+
+    def rank(self, value: float) -> float:
+        """value 이하 값의 비율 추정"""
+        if self.n == 0:
+            return 0.0
+        items, weights = self._weighted_items()
+        return float(weights[items <= value].sum() / weights.sum())
+
+
+class HyperLogLog:
+    """HyperLogLog 고유값 수 추정기 (병합 가능)"""
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def _alpha(self) -> float:
+        if self.m == 16:
+            return 0.673
+        if self.m == 32:
+            return 0.697
+        if self.m == 64:
+            return 0.709
+        return 0.7213 / (1 + 1.079 / self.m)
+
+    def update_many(self, values) -> "HyperLogLog":
+        """값 배열 일괄 추가 (NaN 은 무시)"""
+        series = pd.Series(values).dropna()
+        if series.empty:
+            return self
+        hashes = _hash_values(series.values)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = (hashes << np.uint64(self.p)) | np.uint64(1 << (self.p - 1))
+
+        # 선행 0 비트 수를 이진 탐색으로 계산 (부동소수 오차 없이)
+        leading = np.zeros(rest.shape, dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            top_zero = (rest >> np.uint64(64 - shift)) == 0
+            leading += shift * top_zero
+            rest = np.where(top_zero, rest << np.uint64(shift), rest)
+
+        np.maximum.at(self.registers, index, (leading + 1).astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """레지스터 단위 최대값으로 병합"""
+        if other.p != self.p:
+            raise ValueError(f"HyperLogLog precision mismatch: {self.p} != {other.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        """고유값 수 추정"""
+        estimate = self._alpha() * self.m * self.m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        # 작은 범위 보정 (linear counting)
+        if estimate <= 2.5 * self.m and zeros > 0:
+            estimate = self.m * math.log(self.m / zeros)
+        return int(round(estimate))
+
+
+class CountMinSketch:
+    """Count-Min 빈도 스케치 + 헤비히터 후보 관리 (병합 가능)"""
+
+    def __init__(self, width: int = 2048, depth: int = 4, heavy_hitters: int = 50):
+        self.width = width
+        self.depth = depth
+        self.heavy_capacity = heavy_hitters
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+        self.candidates: Dict[str, int] = {}
+
+    def _indices(self, items: np.ndarray) -> np.ndarray:
+        return np.vstack([
+            (_hash_values(items, seed=row) % np.uint64(self.width)).astype(np.int64)
+            for row in range(self.depth)
+        ])
+
+    def update_many(self, items) -> "CountMinSketch":
+        """항목 배열 일괄 추가"""
+        series = pd.Series(items).dropna().astype(str)
+        series = series[series != '']
+        if series.empty:
+            return self
+        counts = series.value_counts()
+        keys = counts.index.to_numpy(dtype=object)
+        indices = self._indices(keys)
+        for row in range(self.depth):
+            np.add.at(self.table[row], indices[row], counts.values)
+        self.total += int(counts.sum())
+        self._refresh_candidates(keys)
+        return self
+
+    def estimate(self, item: str) -> int:
+        """단일 항목 빈도 추정"""
+        return int(self.estimate_many([item])[0])
+
+    def estimate_many(self, items) -> np.ndarray:
+        """여러 항목 빈도 일괄 추정"""
+        keys = np.asarray(list(items), dtype=object)
+        if keys.size == 0:
+            return np.empty(0, dtype=np.int64)
+        indices = self._indices(keys)
+        return np.min(self.table[np.arange(self.depth)[:, None], indices], axis=0)
+
+    def _refresh_candidates(self, new_keys: Iterable[str]):
+        keys = list(dict.fromkeys(list(self.candidates.keys()) + list(new_keys)))
+        estimates = self.estimate_many(keys)
+        top = np.argsort(-estimates, kind='stable')[:self.heavy_capacity]
+        self.candidates = {keys[i]: int(estimates[i]) for i in top}
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        """같은 크기의 스케치를 병합"""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("CountMinSketch dimensions mismatch")
+        self.table += other.table
+        self.total += other.total
+        self._refresh_candidates(other.candidates.keys())
+        return self
+
+    def heavy_hitters(self, top_n: int = 10) -> Dict[str, int]:
+        """빈도 상위 항목 반환"""
+        return dict(list(self.candidates.items())[:top_n])
+
+
+class PartitionSketches:
+    """한 파티션(예: 직무 카테고리)의 지표 스케치 묶음"""
+
+    TOP_REWARDS = 10
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        self.row_count = 0
+        self.reward_sum = 0.0
+        self.reward_sq_sum = 0.0
+        self.reward_max = float('-inf')
+        self.reward_quantiles = KLLSketch(k=k, seed=seed)
+        self.companies = HyperLogLog()
+        self.top_companies = CountMinSketch()
+        self.top_skills = CountMinSketch()
+        self.top_rewards: List[Tuple[float, str, str]] = []  # 지원금 상위 공고 (지원금, 제목, 회사명)
+
+    def ingest(self, df: pd.DataFrame) -> "PartitionSketches":
+        """데이터프레임 조각을 스케치에 반영"""
+        self.row_count += len(df)
+        if 'join_reward' in df.columns:
+            reward_series = pd.to_numeric(df['join_reward'], errors='coerce')
+            rewards = reward_series.dropna().to_numpy(dtype=np.float64)
+            if rewards.size:
+                self.reward_sum += float(rewards.sum())
+                self.reward_sq_sum += float(np.square(rewards).sum())
+                self.reward_max = max(self.reward_max, float(rewards.max()))
+                self.reward_quantiles.update_many(rewards)
+            if {'title', 'company_name'}.issubset(df.columns):
+                top = reward_series.nlargest(self.TOP_REWARDS)
+                self.top_rewards = heapq.nlargest(self.TOP_REWARDS, self.top_rewards + [
+                    (float(reward), str(title), str(company)) for reward, title, company
+                    in zip(top, df.loc[top.index, 'title'], df.loc[top.index, 'company_name'])
+                ])
+        if 'company_name' in df.columns:
+            self.companies.update_many(df['company_name'])
+            self.top_companies.update_many(df['company_name'])
+        if 'job_skill_keywords' in df.columns:
+            skills = df['job_skill_keywords'].dropna().astype(str).str.split(',').explode().str.strip()
+            self.top_skills.update_many(skills)
+        return self
+
+    def merge(self, other: "PartitionSketches") -> "PartitionSketches":
+        """다른 파티션 스케치를 병합"""
+        self.row_count += other.row_count
+        self.reward_sum += other.reward_sum
+        self.reward_sq_sum += other.reward_sq_sum
+        self.reward_max = max(self.reward_max, other.reward_max)
+        self.reward_quantiles.merge(other.reward_quantiles)
+        self.companies.merge(other.companies)
+        self.top_companies.merge(other.top_companies)
+        self.top_skills.merge(other.top_skills)
+        self.top_rewards = heapq.nlargest(self.TOP_REWARDS, self.top_rewards + other.top_rewards)
+        return self
+
+    def reward_stats(self) -> Dict:
+        """analyze_salary_trends 와 같은 형태의 지원금 통계"""
+        n = self.reward_quantiles.n
+        if n == 0:
+            return {}
+        mean = self.reward_sum / n
+        variance = (self.reward_sq_sum - n * mean * mean) / (n - 1) if n > 1 else 0.0
+        q25, median, q75, q90 = self.reward_quantiles.quantiles([0.25, 0.5, 0.75, 0.90])
+        return {
+            'mean': mean,
+            'median': float(median),
+            'std': math.sqrt(max(variance, 0.0)),
+            'max': self.reward_max,
+            'percentiles': {
+                '25th': float(q25),
+                '75th': float(q75),
+                '90th': float(q90)
+            }
+        }
+
+    def high_reward_jobs(self) -> List[Dict]:
+        """지원금 상위 공고 (analyze_salary_trends 의 high_reward_jobs 와 같은 형태)"""
+        return [{'title': title, 'company_name': company, 'join_reward': reward}
+                for reward, title, company in self.top_rewards]
+
+
+def build_partition_sketches(df: pd.DataFrame, partition_col: str = 'job_category') -> Dict[str, PartitionSketches]:
+    """파티션 컬럼 기준으로 스케치 생성 (적재 시점에 1회)"""
+    if df.empty:
+        return {}
+    if partition_col not in df.columns:
+        return {'ALL': PartitionSketches(seed=0).ingest(df)}
+    sketches = {}
+    for i, (partition, part_df) in enumerate(df.groupby(partition_col, observed=True, sort=True)):
+        sketches[str(partition)] = PartitionSketches(seed=i).ingest(part_df)
+    return sketches
+
+
+def merge_sketches(sketches: Dict[str, PartitionSketches], partitions: Optional[List[str]] = None) -> PartitionSketches:
+    """조회 시점에 선택한 파티션들의 스케치를 병합"""
+    merged = PartitionSketches(seed=0)
+    for name, sketch in sketches.items():
+        if partitions is None or name in partitions:
+            merged.merge(sketch)
+    return merged
@@ -0,0 +1,177 @@
+"""
+스킬 정규화 모듈
+표기가 다른 스킬("vue", "Vuejs", "Vue.js")을 별칭 표와 정규화 규칙으로 하나의 정규 스킬로 묶고
+정규 스킬마다 int32 ID 를 부여 (스킬 인터닝)
+
+정규화 키: NFKC → 소문자 → 공백 정리, 조회는 정확한 키 → 구분자(공백 . - _) 제거 키 순서의 해시 조회
+공고 요구 스킬 문자열은 문자열별로 한 번만 ID 배열로 변환하여 보관하고, 이후 비교는 정수로 한다
+"""
+
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 정규 스킬 표시 이름 → 별칭 (정규화 키가 같거나 구분자만 다른 표기는 별칭 없이도 묶임)
+SKILL_ALIASES: Dict[str, List[str]] = {
+    'JavaScript': ['js', 'ecmascript', 'es6'],
+    'TypeScript': ['ts'],
+    'React': ['react.js', 'reactjs'],
+    'Vue.js': ['vue', 'vue3'],
+    'Angular': ['angularjs', 'angular.js'],
+    'Next.js': ['next'],
+    'Node.js': ['node'],
+    'HTML/CSS': ['html', 'css', 'html5', 'css3'],
+    'Go': ['golang'],
+    'C++': ['cpp'],
+    'C#': ['csharp'],
+    'PostgreSQL': ['postgres'],
+    'Kubernetes': ['k8s'],
+    'AWS': ['amazon web services'],
+    'GCP': ['google cloud', 'google cloud platform'],
+    'AI': ['인공지능', 'artificial intelligence'],
+    'ML': ['머신러닝', 'machine learning'],
+    'UI/UX': ['ux/ui', 'ui', 'ux'],
+    'Adobe XD': ['xd'],
+    'Illustrator': ['adobe illustrator'],
+    'Photoshop': ['adobe photoshop'],
+    'Google Analytics': ['ga', 'ga4'],
+    '영어': ['english'],
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_SEPARATORS = re.compile(r'[\s.\-_]+')
+
+
+def normalize_skill(skill) -> str:
+    """정규화 키 (NFKC, 소문자, 앞뒤 공백 제거, 연속 공백은 하나로)"""
+    if not isinstance(skill, str):
+        return ''
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFKC', skill)).strip().lower()
+
+
+def _compact_key(key: str) -> str:
+    """구분자를 뺀 키 ("vue.js", "vue js", "vuejs" → "vuejs"), 구분자뿐이면 원래 키"""
+    return _SEPARATORS.sub('', key) or key
+
+
+class SkillCanon:
+    """스킬 표기 → int32 정규 스킬 ID (별칭 표 + 정규화 키 해시 조회, 처음 보는 스킬은 새 ID)"""
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None, max_parsed: int = 100_000):
+        self.names: List[str] = []    # ID → 정규화 키
+        self.labels: List[str] = []   # ID → 표시 이름
+        self._ids: Dict[str, int] = {}
+        self._compact_ids: Dict[str, int] = {}
+        self._parsed: Dict[str, np.ndarray] = {}
+        self._max_parsed = max_parsed
+        self._lock = threading.RLock()
+
+        for label, surface_forms in (SKILL_ALIASES if aliases is None else aliases).items():
+            skill_id = self.intern(label)
+            for alias in surface_forms:
+                key = normalize_skill(alias)
+                self._ids.setdefault(key, skill_id)
+                self._compact_ids.setdefault(_compact_key(key), skill_id)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _find(self, key: str) -> int:
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._compact_ids.get(_compact_key(key), -1)
+        return skill_id
+
+    def lookup(self, skill) -> int:
+        """정규 스킬 ID (모르는 스킬이나 빈 문자열은 -1, 새로 등록하지 않음)"""
+        key = normalize_skill(skill)
+        return self._find(key) if key else -1
+
+    def intern(self, skill) -> int:
+        """정규 스킬 ID (처음 보는 스킬은 등록, 빈 문자열은 -1)"""
+        key = normalize_skill(skill)
+        if not key:
+            return -1
+        skill_id = self._find(key)
+        if skill_id >= 0:
+            return skill_id
+        with self._lock:
+            skill_id = self._find(key)
+            if skill_id < 0:
+                skill_id = len(self.names)
+                self.names.append(key)
+                self.labels.append(skill.strip())
+                self._ids[key] = skill_id
+                self._compact_ids.setdefault(_compact_key(key), skill_id)
+        return skill_id
+
+    def canonical(self, skill) -> str:
+        """정규화 키 ("Vuejs" → "vue.js"), 모르는 스킬이나 빈 문자열은 '' (등록하지 않음)"""
+        skill_id = self.lookup(skill)
+        return self.names[skill_id] if skill_id >= 0 else ''
+
+    def label(self, skill_id: int) -> str:
+        return self.labels[skill_id]
+
+    def ids(self, skills: Iterable) -> np.ndarray:
+        """스킬 목록(사용자 입력 등) → 중복 없는 정렬된 ID 배열 (모르는 스킬은 제외, 등록하지 않음)"""
+        found = {self.lookup(skill) for skill in skills or []}
+        found.discard(-1)
+        return np.array(sorted(found), dtype=np.int32)
+
+    def register(self, skills: Iterable) -> np.ndarray:
+        """코드/설정에 정의된 스킬 표 → 중복 없는 정렬된 ID 배열 (처음 보는 스킬은 등록)"""
+        found = {self.intern(skill) for skill in skills or []}
+        found.discard(-1)
+        return np.array(sorted(found), dtype=np.int32)
+
+    def parse(self, requirements) -> np.ndarray:
+        """쉼표 구분 요구 스킬 문자열 → 등장 순서대로의 ID 배열 (중복 유지, 문자열별 1회 변환)"""
+        if not isinstance(requirements, str):
+            return np.zeros(0, dtype=np.int32)
+        parsed = self._parsed.get(requirements)
+        if parsed is not None:
+            return parsed
+        with self._lock:
+            parsed = self._parsed.get(requirements)
+            if parsed is not None:
+                return parsed
+            found = []
+            for skill in requirements.split(','):
+                skill_id = self.intern(skill)
+                if skill_id < 0:
+                    continue
+                found.append(skill_id)
+                # 내부 표에서 소문자로 먼저 등록된 스킬은 공고 표기를 표시 이름으로 사용
+                if self.labels[skill_id] == self.names[skill_id]:
+                    self.labels[skill_id] = skill.strip()
+            parsed = np.array(found, dtype=np.int32)
+            parsed.setflags(write=False)
+            if len(self._parsed) >= self._max_parsed:
+                self._parsed.clear()
+            self._parsed[requirements] = parsed
+        return parsed
+
+    def parse_all(self, requirements: Iterable) -> List[np.ndarray]:
+        """요구 스킬 컬럼 전체 변환 (데이터 적재 시 1회 호출하여 스킬 ID 를 미리 등록)"""
+        return [self.parse(text) for text in requirements]
+
+    def names_of(self, skill_ids: Iterable[int]) -> List[str]:
+        return [self.names[skill_id] for skill_id in skill_ids]
+
+    def skill_counts(self, requirements: Iterable) -> pd.Series:
+        """정규 스킬별 언급 공고 수 (인덱스는 ID, 공고 안 중복은 1회, 빈도 내림차순·동점은 ID 순)"""
+        parsed = [np.unique(ids) for ids in self.parse_all(requirements)]
+        all_ids = np.concatenate(parsed) if parsed else np.zeros(0, dtype=np.int32)
+        counts = np.bincount(all_ids, minlength=len(self.names))
+        present = np.flatnonzero(counts)
+        order = np.lexsort((present, -counts[present]))
+        return pd.Series(counts[present][order], index=present[order])
+
+
+# 전역 스킬 정규화 인스턴스
+skill_canon = SkillCanon()
@@ -0,0 +1,233 @@
+"""
+스킬 유사도 그래프 모듈
+공고 × 스킬 행렬의 동시 출현(PPMI)으로 스킬별 상위 n 개 유사 스킬을 학습하여 희소 CSR 인접 행렬로 보관
+새 스냅샷은 추가/변경/삭제 공고의 동시 출현 변화량만 반영하고 인접 행렬을 다시 만든다
+
+유사 스킬 크레딧(보유 스킬과 비슷한 부족 스킬)은 여러 공고에 대해 희소 행렬 곱 한 번으로 계산
+(매칭 상세의 설명용이며 매칭 점수에는 반영하지 않음)
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.lsh_index import skill_tokens
+from src.precomputed import PrecomputedStore, precomputed_store
+from src.skill_canon import skill_canon
+from src.utils import posting_hashes, source_version
+
+logger = logging.getLogger(__name__)
+
+HASH_COLUMNS = ['job_skill_keywords']
+
+
+def skill_incidence(token_lists: List[List[str]], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    """공고 × 스킬 0/1 CSR (vocabulary 에 없는 스킬은 추가)"""
+    indptr, indices = [0], []
+    for tokens in token_lists:
+        indices.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+        indptr.append(len(indices))
+    return sparse.csr_matrix((np.ones(len(indices), dtype=np.int32), indices, indptr),
+                             shape=(len(token_lists), max(len(vocabulary), 1)))
+
+
+def _resize(matrix: sparse.csr_matrix, rows: int, cols: int) -> sparse.csr_matrix:
+    matrix = matrix.tocsr().copy()
+    matrix.resize((rows, cols))
+    return matrix
+
+
+def ppmi_adjacency(cooccurrence: sparse.csr_matrix, counts: np.ndarray, names: np.ndarray,
+                   top_n: int = 10, min_count: int = 2, alpha: float = 0.75) -> sparse.csr_matrix:
+    """동시 출현 → 스킬별 PPMI 상위 top_n 이웃 인접 행렬 (행 최댓값 1 로 정규화)
+
+    PPMI(i, j) = max(log(C_ij · Σc^α / (c_i · c_j^α)), 0) - 문맥 분포를 α 로 평활하여
+    드물게 한두 번 함께 나온 스킬이 상위를 차지하는 PMI 편향을 줄인다.
+    동시 출현이 min_count 미만인 쌍은 제외하고, 동점은 스킬 이름 순 (스냅샷 간 결정적).
+    """
+    size = cooccurrence.shape[0]
+    coo = cooccurrence.tocoo()
+    keep = (coo.row != coo.col) & (coo.data >= min_count)
+    rows, cols, together = coo.row[keep], coo.col[keep], coo.data[keep].astype(np.float64)
+    smoothed = counts.astype(np.float64) ** alpha
+    with np.errstate(divide='ignore'):
+        pmi = np.log(together * smoothed.sum() / (counts[rows].astype(np.float64) * smoothed[cols]))
+    positive = pmi > 0
+    rows, cols, pmi = rows[positive], cols[positive], pmi[positive]
+
+    # 행마다 (PMI 내림차순, 스킬 이름 오름차순) 상위 top_n
+    name_rank = np.argsort(np.argsort(names, kind='stable'), kind='stable')
+    order = np.lexsort((name_rank[cols], -np.round(pmi, 9), rows))
+    rows, cols, pmi = rows[order], cols[order], pmi[order]
+    starts = np.searchsorted(rows, rows, side='left')
+    top = np.arange(rows.size) - starts < top_n
+    rows, cols, pmi = rows[top], cols[top], pmi[top]
+
+    row_max = np.zeros(size)
+    np.maximum.at(row_max, rows, pmi)
+    weights = (pmi / row_max[rows]).astype(np.float32)
+    return sparse.csr_matrix((weights, (rows, cols)), shape=(size, size))
+
+
+class SkillGraph:
+    """스킬 유사도 그래프 (스킬 사전 + CSR 인접 행렬)"""
+
+    def __init__(self, vocabulary: List[str], adjacency: sparse.csr_matrix, version: Optional[str] = None):
+        self.vocabulary = list(vocabulary)
+        self.index = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.adjacency = adjacency.tocsr()
+        self.version = version
+
+    def neighbors(self, skill: str, n: Optional[int] = None) -> List[Tuple[str, float]]:
+        """비슷한 스킬과 가중치 (가중치 내림차순)"""
+        i = self.index.get(skill_canon.canonical(skill))
+        if i is None:
+            return []
+        start, end = self.adjacency.indptr[i], self.adjacency.indptr[i + 1]
+        cols, weights = self.adjacency.indices[start:end], self.adjacency.data[start:end]
+        names = np.array([self.vocabulary[c] for c in cols], dtype=str)
+        order = np.lexsort((names, -np.round(weights, 6)))[:n]
+        return [(self.vocabulary[cols[j]], float(weights[j])) for j in order]
+
+    def similar_pairs(self, user_skills: List[str], missing_skills: List[str]) -> List[Tuple[str, str]]:
+        """(보유 스킬, 비슷한 부족 스킬) 쌍 - _find_similar_skills 와 같은 형식"""
+        missing = set(skill_canon.names_of(skill_canon.ids(missing_skills)))
+        pairs = []
+        for user_skill in user_skills:
+            pairs.extend((user_skill, skill) for skill, _ in self.neighbors(user_skill) if skill in missing)
+        return pairs
+
+    def user_vector(self, user_skills: List[str]) -> np.ndarray:
+        """보유 스킬 0/1 벡터 (그래프에 없는 스킬은 무시)"""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        positions = [self.index[s] for s in skill_canon.names_of(skill_canon.ids(user_skills)) if s in self.index]
+        vector[positions] = 1
+        return vector
+
+    def posting_matrix(self, requirements) -> sparse.csr_matrix:
+        """공고 × 스킬 0/1 CSR (그래프에 없는 스킬은 무시)"""
+        vocabulary = dict(self.index)
+        matrix = skill_incidence([skill_tokens(text) for text in requirements], vocabulary)
+        return _resize(matrix, matrix.shape[0], len(self.vocabulary))
+
+    def similar_skill_credit(self, user_skills: List[str], posting_matrix: sparse.csr_matrix) -> np.ndarray:
+        """공고별 유사 스킬 크레딧 (부족 스킬마다 보유 스킬과의 유사도 합, 스킬당 최대 1)
+
+        보유 벡터 · 인접 행렬 로 스킬별 커버리지를 만든 뒤 공고 행렬과 한 번 곱한다.
+        """
+        user = self.user_vector(user_skills)
+        coverage = np.minimum(self.adjacency.T @ user, 1) * (1 - user)
+        return np.asarray(posting_matrix @ coverage).ravel()
+
+
+class SkillGraphBuilder:
+    """스냅샷 단위 증분 스킬 그래프 (동시 출현 집계를 변화량으로 갱신)"""
+
+    NAME = 'skill_graph'
+
+    def __init__(self, store: Optional[PrecomputedStore] = None, top_n: int = 10, min_count: int = 2):
+        self.store = store or precomputed_store
+        self.top_n = top_n
+        self.min_count = min_count
+
+    def is_current(self, df: pd.DataFrame) -> bool:
+        """저장된 그래프가 현재 원천 공고 버전 기준인지 확인"""
+        return self.store.load_meta(self.NAME).get('source_version') == source_version(df, HASH_COLUMNS)
+
+    def update(self, df: pd.DataFrame) -> Dict:
+        """새 스냅샷 반영: 추가/변경 공고의 동시 출현은 더하고 삭제/변경 전 공고의 것은 뺌"""
+        ids = df['id'].to_numpy()
+        hashes = posting_hashes(df, HASH_COLUMNS).to_numpy()
+        requirements = df['job_skill_keywords'] if 'job_skill_keywords' in df.columns else pd.Series(None, index=df.index)
+
+        previous = self.store.load_arrays(self.NAME)
+        if previous is not None and previous['ids'].dtype != ids.dtype:
+            previous = None
+        if previous is None:
+            vocabulary: Dict[str, int] = {}
+            previous_ids = ids[:0]
+            previous_hash = hashes[:0]
+            incidence = skill_incidence([], vocabulary)
+            cooccurrence = sparse.csr_matrix((1, 1), dtype=np.int64)
+        else:
+            vocabulary = {skill: i for i, skill in enumerate(previous['vocabulary'].tolist())}
+            previous_ids, previous_hash = previous['ids'], previous['content_hash']
+            size = len(vocabulary)
+            incidence = sparse.csr_matrix((np.ones(previous['incidence_indices'].size, dtype=np.int32),
+                                           previous['incidence_indices'], previous['incidence_indptr']),
+                                          shape=(previous_ids.size, max(size, 1)))
+            cooccurrence = sparse.csr_matrix((previous['cooccurrence_data'], previous['cooccurrence_indices'],
+                                              previous['cooccurrence_indptr']), shape=(max(size, 1), max(size, 1)))
+
+        previous_of = pd.Series(previous_hash, index=previous_ids)
+        unchanged = previous_of.reindex(ids).to_numpy() == hashes
+        current_unchanged = set(ids[unchanged])
+        removed_rows = np.flatnonzero(~pd.Series(previous_ids).isin(current_unchanged).to_numpy())
+        added_rows = np.flatnonzero(~unchanged)
+
+        added = skill_incidence([skill_tokens(requirements.iat[i]) for i in added_rows], vocabulary)
+        size = max(len(vocabulary), 1)
+        incidence = _resize(incidence, incidence.shape[0], size)
+        added = _resize(added, added.shape[0], size)
+        removed = incidence[removed_rows]
+
+        cooccurrence = _resize(cooccurrence, size, size).astype(np.int64)
+        cooccurrence = (cooccurrence + (added.T @ added) - (removed.T @ removed)).tocsr()
+        cooccurrence.eliminate_zeros()
+
+        # 현재 스냅샷 순서의 공고 × 스킬 행렬 (변경 없는 공고는 이전 행 재사용)
+        kept_rows = np.flatnonzero(pd.Series(previous_ids).isin(current_unchanged).to_numpy())
+        order_ids = np.concatenate([previous_ids[kept_rows], ids[added_rows]])
+        stacked = sparse.vstack([incidence[kept_rows], added]).tocsr()
+        incidence = stacked[pd.Series(np.arange(order_ids.size), index=order_ids).reindex(ids).to_numpy()]
+
+        skills = np.array(sorted(vocabulary, key=vocabulary.get), dtype=str)
+        adjacency = ppmi_adjacency(cooccurrence, _resize(cooccurrence, size, size).diagonal(), skills,
+                                   self.top_n, self.min_count)
+        self.store.save_arrays(
+            self.NAME, ids=ids, content_hash=hashes, vocabulary=skills,
+            incidence_indptr=incidence.indptr, incidence_indices=incidence.indices,
+            cooccurrence_data=cooccurrence.data, cooccurrence_indices=cooccurrence.indices,
+            cooccurrence_indptr=cooccurrence.indptr,
+            adjacency_data=adjacency.data, adjacency_indices=adjacency.indices, adjacency_indptr=adjacency.indptr,
+        )
+        summary = {
+            'source_version': source_version(df, HASH_COLUMNS),
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'skills': len(skills),
+            'edges': int(adjacency.nnz),
+            'added_or_changed': int(added_rows.size),
+            'removed': int(removed_rows.size - np.isin(previous_ids[removed_rows], ids).sum()),
+        }
+        self.store.save_meta(self.NAME, summary)
+        logger.info(f"Skill graph updated: {summary}")
+        return summary
+
+    def load(self) -> Optional[SkillGraph]:
+        arrays = self.store.load_arrays(self.NAME)
+        if arrays is None:
+            return None
+        size = max(arrays['vocabulary'].size, 1)
+        adjacency = sparse.csr_matrix((arrays['adjacency_data'], arrays['adjacency_indices'], arrays['adjacency_indptr']),
+                                      shape=(size, size))
+        return SkillGraph(arrays['vocabulary'].tolist(), adjacency, self.store.load_meta(self.NAME).get('source_version'))
+
+
+def main():
+    """오프라인 실행 진입점: 현재 데이터로 그래프 갱신"""
+    from src.data_loader import DataLoader
+
+    logging.basicConfig(level=logging.INFO)
+    df = DataLoader().load_postings()
+    if df.empty:
+        logger.error("No postings to learn from")
+        return
+    print(SkillGraphBuilder().update(df))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+스킬 분류 체계 모듈
+스킬 → 그룹 지식(기술 분야, 직무 카테고리 보너스 스킬, 샘플 데이터 스킬 풀, 커리어 단계별 요구 스킬)을 한 곳에서 관리
+정규 스킬 ID 로 인덱싱한 그룹 배열을 미리 계산하여 스킬당 배열 조회 한 번으로 그룹을 찾음
+
+분류 체계는 프로세스당 한 번 로드되고, update() 로 교체하면 버전이 올라가며 조회 배열을 다시 만든다
+(버전을 캐시 키에 넣어 이전 분류로 계산한 결과를 재사용하지 않도록 함)
+"""
+
+import json
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.skill_canon import SkillCanon, skill_canon
+
+logger = logging.getLogger(__name__)
+
+# 기술 분야별 스킬 (한 스킬이 여러 분야에 있으면 먼저 나온 분야)
+TECH_AREAS: Dict[str, List[str]] = {
+    'Frontend': ['javascript', 'react', 'vue.js', 'angular', 'html/css', 'typescript', 'next.js', 'react native',
+                 'tailwindcss', 'scss', 'redux'],
+    'Backend': ['python', 'java', 'node.js', 'spring', 'spring boot', 'django', 'flask', 'kotlin', 'jpa', 'nestjs',
+                'go', 'rest api'],
+    'DevOps': ['docker', 'kubernetes', 'aws', 'gcp', 'azure', 'jenkins', 'linux', 'git', 'github'],
+    'Database': ['mysql', 'postgresql', 'mongodb', 'redis', 'sql', 'dbms/rdbms'],
+    'Design': ['figma', 'sketch', 'photoshop', 'illustrator', 'adobe xd', 'ui/ux'],
+    'Marketing': ['google analytics', 'facebook ads', 'seo', 'content marketing']
+}
+
+# 직무 카테고리별 보너스 대상 스킬
+CATEGORY_SKILLS: Dict[str, List[str]] = {
+    'DEVELOPER': ['python', 'java', 'javascript', 'react', 'docker', 'aws'],
+    'DESIGN': ['figma', 'sketch', 'photoshop', 'illustrator', 'ui/ux'],
+    'MARKETING': ['google analytics', 'facebook ads', 'seo', 'content marketing'],
+    'MANAGEMENT': ['agile', 'scrum', 'jira', 'leadership']
+}
+
+# 샘플 데이터 생성용 직무 카테고리별 스킬 풀
+SAMPLE_SKILL_POOLS: Dict[str, List[str]] = {
+    'DEVELOPER': ['Python', 'Java', 'JavaScript', 'React', 'Vue.js', 'Node.js', 'Spring', 'Docker', 'Kubernetes', 'AWS', 'GCP', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Git', 'Jenkins', 'TypeScript', 'Go', 'Kotlin'],
+    'DESIGN': ['Figma', 'Sketch', 'Adobe XD', 'Photoshop', 'Illustrator', 'Principle', 'Zeplin', 'InVision', 'Framer', 'After Effects', 'UI/UX', 'Prototyping', 'Wireframing', 'User Research'],
+    'MARKETING': ['Google Analytics', 'Facebook Ads', 'Google Ads', 'SEO', 'SEM', 'Content Marketing', 'Email Marketing', 'Social Media', 'Adobe Creative Suite', 'Hootsuite', 'Mailchimp', 'HubSpot', 'Salesforce'],
+    'MANAGEMENT': ['Agile', 'Scrum', 'Kanban', 'Jira', 'Confluence', 'Slack', 'Notion', 'Excel', 'PowerPoint', 'Project Management', 'Leadership', 'Team Building', 'Strategic Planning']
+}
+DEFAULT_SKILL_POOL = ['Communication', 'Teamwork', 'Problem Solving']
+
+# 직무 카테고리별 커리어 단계 요구 스킬 (시장 데이터가 없는 단계의 기본 경로)
+CAREER_PATHS: Dict[str, Dict[str, List[str]]] = {
+    'DEVELOPER': {
+        'entry_level': ['HTML/CSS', 'JavaScript', 'Git', 'Basic Programming'],
+        'junior_level': ['React/Vue', 'Node.js', 'Database', 'API Development'],
+        'senior_level': ['System Architecture', 'DevOps', 'Cloud Services', 'Team Leadership'],
+        'lead_level': ['Technical Strategy', 'Mentoring', 'Project Management', 'Business Acumen']
+    },
+    'DESIGN': {
+        'entry_level': ['Figma/Sketch', 'Design Principles', 'Typography', 'Color Theory'],
+        'junior_level': ['UI/UX Design', 'Prototyping', 'User Research', 'Design Systems'],
+        'senior_level': ['Design Strategy', 'Team Collaboration', 'Business Understanding', 'Advanced Tools'],
+        'lead_level': ['Design Leadership', 'Strategy Planning', 'Team Management', 'Innovation']
+    },
+    'MARKETING': {
+        'entry_level': ['Digital Marketing Basics', 'Google Analytics', 'Content Writing', 'Social Media'],
+        'junior_level': ['SEO/SEM', 'Campaign Management', 'Data Analysis', 'Marketing Automation'],
+        'senior_level': ['Marketing Strategy', 'ROI Analysis', 'Team Leadership', 'Cross-channel Integration'],
+        'lead_level': ['Strategic Planning', 'Budget Management', 'Team Development', 'Innovation']
+    },
+    'MANAGEMENT': {
+        'entry_level': ['Project Coordination', 'Basic Analytics', 'Communication', 'Time Management'],
+        'junior_level': ['Project Management', 'Team Coordination', 'Process Improvement', 'Stakeholder Management'],
+        'senior_level': ['Strategic Planning', 'Team Leadership', 'Budget Management', 'Performance Management'],
+        'lead_level': ['Executive Leadership', 'Organizational Strategy', 'Change Management', 'Innovation']
+    }
+}
+
+OTHER_AREA = '기타'
+
+
+class SkillTaxonomy:
+    """버전 관리되는 스킬 분류 체계 (정규 스킬 ID → 기술 분야 / 직무 카테고리 소속 배열)
+
+    조회 배열은 분류 체계를 만들 때의 스킬 사전 크기로 만들고, 이후 새로 등록된 스킬 ID 는 그룹 없음으로 본다.
+    """
+
+    def __init__(self, tech_areas: Optional[Dict[str, List[str]]] = None,
+                 category_skills: Optional[Dict[str, List[str]]] = None,
+                 sample_pools: Optional[Dict[str, List[str]]] = None,
+                 career_paths: Optional[Dict[str, Dict[str, List[str]]]] = None,
+                 canon: Optional[SkillCanon] = None):
+        self.canon = canon or skill_canon
+        self.version = 0
+        self._lock = threading.Lock()
+        self._state: Dict = {}
+        self.update(TECH_AREAS if tech_areas is None else tech_areas,
+                    CATEGORY_SKILLS if category_skills is None else category_skills,
+                    SAMPLE_SKILL_POOLS if sample_pools is None else sample_pools,
+                    CAREER_PATHS if career_paths is None else career_paths)
+
+    def _compile(self, tech_areas: Dict[str, List[str]], category_skills: Dict[str, List[str]]) -> Dict:
+        """그룹 정의 → 스킬 ID 인덱스 조회 배열"""
+        area_ids = [self.canon.register(skills) for skills in tech_areas.values()]
+        category_ids = [self.canon.register(skills) for skills in category_skills.values()]
+        size = len(self.canon)
+
+        area_of = np.full(size, -1, dtype=np.int16)
+        for area, ids in reversed(list(enumerate(area_ids))):
+            area_of[ids] = area
+        category_member = np.zeros((size, len(category_ids)), dtype=bool)
+        for category, ids in enumerate(category_ids):
+            category_member[ids, category] = True
+
+        return {
+            'area_names': list(tech_areas) + [OTHER_AREA],
+            'area_of': area_of,
+            'category_index': {category: i for i, category in enumerate(category_skills)},
+            'category_member': category_member,
+        }
+
+    def update(self, tech_areas: Optional[Dict[str, List[str]]] = None,
+               category_skills: Optional[Dict[str, List[str]]] = None,
+               sample_pools: Optional[Dict[str, List[str]]] = None,
+               career_paths: Optional[Dict[str, Dict[str, List[str]]]] = None) -> int:
+        """주어진 그룹 정의만 교체하고 조회 배열을 다시 만든 뒤 새 버전 반환 (조회 중인 스레드는 이전 상태를 계속 사용)"""
+        with self._lock:
+            previous = self._state
+            definitions = {
+                'tech_areas': tech_areas if tech_areas is not None else previous['tech_areas'],
+                'category_skills': category_skills if category_skills is not None else previous['category_skills'],
+                'sample_pools': sample_pools if sample_pools is not None else previous['sample_pools'],
+                'career_paths': career_paths if career_paths is not None else previous['career_paths'],
+            }
+            state = dict(definitions, **self._compile(definitions['tech_areas'], definitions['category_skills']))
+            self._state = state
+            self.version += 1
+            logger.info(f"Skill taxonomy v{self.version}: {len(state['tech_areas'])} areas, "
+                        f"{len(state['category_skills'])} categories")
+            return self.version
+
+    def update_from_json(self, path) -> int:
+        """JSON 파일({tech_areas, category_skills, sample_pools, career_paths} 중 일부)로 갱신"""
+        with open(path, encoding='utf-8') as f:
+            definitions = json.load(f)
+        return self.update(**{key: definitions.get(key) for key in
+                              ('tech_areas', 'category_skills', 'sample_pools', 'career_paths')})
+
+    # 조회
+    @property
+    def career_paths(self) -> Dict[str, Dict[str, List[str]]]:
+        return self._state['career_paths']
+
+    @property
+    def area_names(self) -> List[str]:
+        """기술 분야 이름 (마지막은 기타)"""
+        return self._state['area_names']
+
+    def sample_pool(self, category: str) -> List[str]:
+        return self._state['sample_pools'].get(category, DEFAULT_SKILL_POOL)
+
+    def area_codes(self, skill_ids) -> np.ndarray:
+        """스킬 ID 배열 → 기술 분야 번호 (그룹 없으면 기타 = len(area_names) - 1)"""
+        area_of = self._state['area_of']
+        skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        codes = np.full(skill_ids.shape, len(self._state['area_names']) - 1, dtype=np.int64)
+        known = (skill_ids >= 0) & (skill_ids < area_of.size)
+        found = area_of[skill_ids[known]]
+        codes[np.flatnonzero(known)[found >= 0]] = found[found >= 0]
+        return codes
+
+    def areas(self, skill_ids) -> List[str]:
+        """스킬 ID 배열 → 기술 분야 이름"""
+        names = self.area_names
+        return [names[code] for code in self.area_codes(skill_ids)]
+
+    def category_counts(self, skill_ids) -> Dict[str, int]:
+        """스킬 ID 집합이 직무 카테고리별 보너스 스킬과 겹치는 개수 (모든 카테고리 한 번에)"""
+        state = self._state
+        member = state['category_member']
+        skill_ids = np.unique(np.asarray(list(skill_ids), dtype=np.int64))
+        skill_ids = skill_ids[(skill_ids >= 0) & (skill_ids < member.shape[0])]
+        counts = member[skill_ids].sum(axis=0)
+        return {category: int(counts[i]) for category, i in state['category_index'].items()}
+
+    def category_mask(self, skill_ids, category: str) -> np.ndarray:
+        """스킬 ID 배열 중 category 보너스 스킬인 위치 (bool 배열)"""
+        state = self._state
+        member = state['category_member']
+        skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        mask = np.zeros(skill_ids.shape, dtype=bool)
+        column = state['category_index'].get(category)
+        if column is None:
+            return mask
+        known = (skill_ids >= 0) & (skill_ids < member.shape[0])
+        mask[known] = member[skill_ids[known], column]
+        return mask
+
+    def category_count(self, skill_ids, category: str) -> int:
+        """스킬 ID 집합 중 category 보너스 스킬 개수"""
+        state = self._state
+        column = state['category_index'].get(category)
+        if column is None:
+            return 0
+        member = state['category_member']
+        skill_ids = np.unique(np.asarray(list(skill_ids), dtype=np.int64))
+        skill_ids = skill_ids[(skill_ids >= 0) & (skill_ids < member.shape[0])]
+        return int(member[skill_ids, column].sum())
+
+
+# 전역 스킬 분류 체계 인스턴스
+skill_taxonomy = SkillTaxonomy()
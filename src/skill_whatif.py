@@ -0,0 +1,111 @@
+"""
+스킬 what-if 모듈
+사용자 스킬에 후보 스킬 하나를 더했을 때 새로 매칭되는 공고 수와 매칭 점수 증가량을
+공고 × 스킬 가중치 행렬의 0 아닌 원소를 한 번 훑어 모든 후보 스킬에 대해 동시에 계산
+
+점수 규칙은 skill_match_scores 와 같음: min(보유 가중치 / 총 가중치 × 100 + 카테고리 보너스, 100)
+후보 스킬이 카테고리 보너스 스킬이면 그 카테고리의 (스킬을 요구하지 않는) 공고 점수도 오르므로 함께 집계
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.batch_matching import posting_skill_matrix
+from src.matching_engine import AdvancedMatchingEngine
+from src.skill_canon import skill_canon
+from src.skill_taxonomy import skill_taxonomy
+
+
+class SkillWhatIf:
+    """공고 집합에 대한 "다음에 배울 스킬" 한계 효과 계산기 (공고 행렬은 한 번만 생성)"""
+
+    def __init__(self, postings: pd.DataFrame, matching_engine: Optional[AdvancedMatchingEngine] = None):
+        self.engine = matching_engine or AdvancedMatchingEngine()
+        requirements = postings['job_skill_keywords'].to_numpy() if 'job_skill_keywords' in postings.columns \
+            else np.full(len(postings), None)
+        vocabulary, matrix, self.total_weights = posting_skill_matrix(requirements, self.engine.skill_weights)
+        self.skill_ids = np.fromiter(vocabulary, dtype=np.int64, count=len(vocabulary))  # 열 → 정규 스킬 ID
+        self.column_of = vocabulary
+        self.matrix = matrix.tocsr()
+        self.matrix.sum_duplicates()
+
+        coo = self.matrix.tocoo()
+        self._rows, self._cols, self._weights = coo.row, coo.col, coo.data
+        self.support = np.bincount(self._cols, minlength=len(vocabulary))
+
+        categories = postings['job_category'] if 'job_category' in postings.columns \
+            else pd.Series(None, index=postings.index)
+        self.category_codes, self.categories = pd.factorize(categories)
+        self.has_skills = self.total_weights > 0
+        self._category_postings = np.bincount(self.category_codes[self.has_skills] + 1,
+                                              minlength=len(self.categories) + 1)
+
+    def evaluate(self, user_skills: List[str], min_score: float = 15, k: Optional[int] = None) -> Dict:
+        """후보 스킬별 효과 (새로 매칭되는 공고 수 내림차순, 점수 증가 합 내림차순, 스킬 ID 순)
+
+        반환: {'matched': 현재 매칭 공고 수, 'ranking': DataFrame(skill, skill_id, unlocked, score_gain,
+        required_by)} - unlocked 는 min_score 를 새로 넘는 공고 수, score_gain 은 전체 공고 점수 증가 합
+        """
+        n_skills = self.skill_ids.size
+        user_ids = skill_canon.ids(user_skills)
+        user_set = set(user_ids.tolist())
+        user_columns = np.array([self.column_of[i] for i in user_ids.tolist() if i in self.column_of], dtype=np.int64)
+        user_vector = np.zeros(max(n_skills, 1))
+        user_vector[user_columns] = 1
+
+        # 현재 점수 (상한 적용 전 raw 와 적용 후 base)
+        bonus = np.array([self.engine._category_bonus(user_set, category) for category in self.categories] + [0.0])
+        codes = self.category_codes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            raw = np.where(self.has_skills, (self.matrix @ user_vector) / self.total_weights * 100 + bonus[codes], 0)
+        base = np.where(self.has_skills, np.minimum(raw, 100), 0)
+        matched = base > min_score
+
+        # 후보 스킬 × 카테고리 보너스 증가량 (보유 스킬은 후보가 아님)
+        counts = skill_taxonomy.category_counts(user_ids)
+        bonus_gain = np.zeros((n_skills, len(self.categories) + 1))
+        for j, category in enumerate(self.categories):
+            current = counts.get(category, 0)
+            step = min((current + 1) * 2, 10) - min(current * 2, 10)
+            bonus_gain[skill_taxonomy.category_mask(self.skill_ids, category), j] = step
+        bonus_gain[user_columns] = 0
+
+        # 카테고리 보너스만 오를 때 카테고리별 점수 증가 합 / 새 매칭 수 (해당 카테고리 전체 공고 기준)
+        category_step = bonus_gain.max(axis=0) if n_skills else np.zeros(len(self.categories) + 1)
+        bonus_only = np.where(self.has_skills, np.minimum(raw + category_step[codes], 100), 0)
+        category_gain = np.bincount(codes + 1, weights=bonus_only - base, minlength=len(self.categories) + 1)
+        category_unlocked = np.bincount(codes + 1, weights=(bonus_only > min_score) & ~matched,
+                                        minlength=len(self.categories) + 1)
+        # 보너스 열 순서(카테고리 0.., 없음) 를 bincount 순서(없음, 카테고리 0..)에 맞춤
+        category_gain = np.roll(category_gain, -1)
+        category_unlocked = np.roll(category_unlocked, -1)
+        in_bonus = bonus_gain > 0
+
+        # 후보 스킬을 요구하는 공고 (0 아닌 원소 한 번 순회): 정확한 새 점수로 보너스만 반영한 값을 교체
+        rows, cols, weights = self._rows, self._cols, self._weights
+        candidate = user_vector[cols] == 0
+        rows, cols, weights = rows[candidate], cols[candidate], weights[candidate]
+        gain = bonus_gain[cols, codes[rows]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            added = np.minimum(raw[rows] + weights / self.total_weights[rows] * 100 + gain, 100)
+        bonus_only_hit = np.where(gain > 0, bonus_only[rows], base[rows])
+        score_gain = np.bincount(cols, weights=added - bonus_only_hit, minlength=n_skills) + in_bonus @ category_gain
+        unlocked = np.bincount(cols, weights=((added > min_score) & ~matched[rows]).astype(np.float64)
+                               - ((bonus_only_hit > min_score) & ~matched[rows]), minlength=n_skills) \
+            + in_bonus @ category_unlocked
+
+        unlocked = np.rint(unlocked).astype(np.int64)
+        keep = (user_vector[:n_skills] == 0) & ((unlocked > 0) | (score_gain > 1e-9))
+        positions = np.flatnonzero(keep)
+        order = np.lexsort((self.skill_ids[positions], -np.round(score_gain[positions], 9), -unlocked[positions]))
+        positions = positions[order][:k]
+        ranking = pd.DataFrame({
+            'skill': [skill_canon.label(i) for i in self.skill_ids[positions]],
+            'skill_id': self.skill_ids[positions],
+            'unlocked': unlocked[positions],
+            'score_gain': score_gain[positions],
+            'required_by': self.support[positions],
+        })
+        return {'matched': int(matched.sum()), 'ranking': ranking}
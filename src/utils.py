@@ -3,6 +3,8 @@
 공통으로 사용되는 헬퍼 함수들
 """
 
+import hashlib
+import json
 import pandas as pd
 import streamlit as st
 from typing import Optional, Tuple, Dict, Any
@@ -19,6 +21,66 @@ def format_currency(amount: float) -> str:
     else:
         return f"{amount:,.0f}원"
 
+def dataset_version(df: pd.DataFrame) -> str:
+    """데이터셋 버전 식별자 (내용 해시, df.attrs 에 1회 계산 후 보관)
+
+    df.attrs 는 필터링/슬라이싱 결과에도 전파되므로 파생 프레임은 원본 버전을 그대로 가진다.
+    """
+    version = df.attrs.get('dataset_version')
+    if version is None:
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False).to_numpy()
+        digest = hashlib.md5(row_hashes.tobytes())
+        digest.update(','.join(map(str, df.columns)).encode('utf-8'))
+        version = digest.hexdigest()[:16]
+        df.attrs['dataset_version'] = version
+    return version
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """프레임 지문 (데이터셋 버전 + 행 구성) - 같은 원본에서 파생된 서로 다른 선택을 구분
+
+    재색인된 프레임(ignore_index)도 구분되도록 id 컬럼이 있으면 행 순서대로 함께 해시한다.
+    """
+    digest = hashlib.md5(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    if 'id' in df.columns:
+        digest.update(pd.util.hash_pandas_object(df['id'], index=False).to_numpy().tobytes())
+    digest = digest.hexdigest()[:12]
+    return f"{df.attrs.get('dataset_version', 'adhoc')}:{len(df)}:{digest}"
+
+def posting_hashes(df: pd.DataFrame, columns, id_col: str = 'id') -> pd.Series:
+    """공고별 내용 해시 (id 인덱스) - 스냅샷 간 변경된 공고 판별용"""
+    columns = [col for col in columns if col in df.columns]
+    hashes = pd.util.hash_pandas_object(df[columns].astype(str), index=False)
+    return pd.Series(hashes.to_numpy(), index=df[id_col].to_numpy(), name='content_hash')
+
+def source_version(df: pd.DataFrame, columns, id_col: str = 'id') -> str:
+    """원천 공고 기준 버전 (행 순서대로 id + 지정 컬럼 내용 해시) - 사전 계산 테이블의 저장 버전용
+
+    엔리치먼트/타입 최적화로 추가·변환된 컬럼과 무관하므로 오프라인 CLI 와 앱이 같은 스냅샷을 같은 버전으로 본다.
+    """
+    hashes = posting_hashes(df, columns, id_col)
+    digest = hashlib.md5(pd.util.hash_pandas_object(pd.Series(hashes.index.astype(str)), index=False).to_numpy().tobytes())
+    digest.update(hashes.to_numpy().tobytes())
+    digest.update(','.join(col for col in columns if col in df.columns).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def filter_fingerprint(conditions: Optional[Dict[str, Any]]) -> str:
+    """필터/프로필 조건을 정규화한 지문 (캐시 키용)"""
+    if not conditions:
+        return 'none'
+
+    def _normalize(value):
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = [_normalize(v) for v in value]
+            return sorted(items, key=str) if isinstance(value, (set, frozenset)) else items
+        if isinstance(value, dict):
+            return {str(k): _normalize(v) for k, v in value.items()}
+        if hasattr(value, 'item'):
+            return value.item()
+        return value
+
+    payload = json.dumps(_normalize(conditions), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()[:16]
+
 def calculate_metrics(df: pd.DataFrame) -> Dict[str, Any]:
     """데이터프레임에서 주요 메트릭 계산"""
     if df.empty:
@@ -32,27 +94,21 @@ def calculate_metrics(df: pd.DataFrame) -> Dict[str, Any]:
             'avg_reward': 0
         }
     
-    total_jobs = len(df)
-    hiring_count = len(df[df['status_code'] == 'HIRING']) if 'status_code' in df.columns else 0
-    partner_count = len(df[df['is_partner'] == 1]) if 'is_partner' in df.columns else 0
-    unique_companies = df['company_name'].nunique() if 'company_name' in df.columns else 0
-    
-    hiring_percentage = (hiring_count / total_jobs * 100) if total_jobs > 0 else 0
-    partner_percentage = (partner_count / total_jobs * 100) if total_jobs > 0 else 0
-    
-    avg_reward = 0
-    if 'join_reward' in df.columns:
-        reward_df = df[df['join_reward'] > 0]
-        avg_reward = reward_df['join_reward'].mean() if not reward_df.empty else 0
+    from src.metrics import metrics_engines
+    metrics = metrics_engines.get(df).metrics()
     
     return {
-        'total_jobs': total_jobs,
-        'hiring_count': hiring_count,
-        'hiring_percentage': hiring_percentage,
-        'partner_count': partner_count,
-        'partner_percentage': partner_percentage,
-        'unique_companies': unique_companies,
-        'avg_reward': avg_reward
+        'total_jobs': metrics['total_jobs'],
+        'hiring_count': metrics['active_jobs'],
+        'hiring_percentage': metrics['active_rate'],
+        'partner_count': metrics['partner_count'],
+        'partner_percentage': metrics['partner_rate'],
+        'unique_companies': metrics['unique_companies'],
+        'avg_reward': metrics['avg_positive_reward'],
+        'max_reward': metrics['max_positive_reward'],
+        'reward_job_count': metrics['reward_job_count'],
+        'reward_job_percentage': metrics['reward_job_rate'],
+        'category_counts': metrics['category_counts']
     }
 
 def filter_dataframe(
@@ -114,28 +170,18 @@ def get_top_skills(df: pd.DataFrame, top_n: int = 20) -> pd.Series:
     skill_counts = pd.Series(all_skills).value_counts()
     return skill_counts.head(top_n)
 
-def analyze_keyword_trends(df: pd.DataFrame, category: str = None) -> Dict[str, int]:
-    """키워드 트렌드 분석"""
-    if category:
-        df = df[df['job_category'] == category]
-    
-    # 제목에서 자주 나오는 키워드 분석
-    all_titles = ' '.join(df['title'].dropna().astype(str))
-    
-    # 간단한 키워드 추출 (실제로는 더 정교한 NLP 처리 필요)
-    common_keywords = [
-        '시니어', '주니어', '신입', '경력', '개발자', '디자이너', 
-        '마케팅', '매니저', '팀장', '리드', 'Frontend', 'Backend',
-        'Full-Stack', 'UI/UX', '데이터', '분석', 'AI', '머신러닝'
-    ]
+def analyze_keyword_trends(df: pd.DataFrame, category: str = None, analyzer=None) -> Dict[str, int]:
+    """키워드 트렌드 분석 (Aho-Corasick 오토마톤으로 제목당 1회 스캔)"""
+    from src.keyword_automaton import keyword_analyzer
+    analyzer = analyzer or keyword_analyzer
     
-    keyword_counts = {}
-    for keyword in common_keywords:
-        count = all_titles.lower().count(keyword.lower())
-        if count > 0:
-            keyword_counts[keyword] = count
+    # 행 단위 히트 배열을 한 번 만들고 카테고리는 마스크로만 선택
+    hits = analyzer.hits_frame(df)
+    if category:
+        hits = hits[(df['job_category'] == category).to_numpy()]
     
-    return keyword_counts
+    totals = hits.sum()
+    return {keyword: int(count) for keyword, count in totals.items() if count > 0}
 
 def validate_filters(df: pd.DataFrame, **filters) -> Dict[str, bool]:
     """필터 유효성 검사"""
@@ -176,22 +222,16 @@ def create_summary_report(df: pd.DataFrame) -> str:
     ### 카테고리별 분포
     """
     
-    if 'job_category' in df.columns:
-        category_counts = df['job_category'].value_counts()
-        for category, count in category_counts.items():
-            percentage = (count / len(df)) * 100
-            report += f"- **{category}**: {count:,}개 ({percentage:.1f}%)\n"
-    
-    if 'join_reward' in df.columns:
-        reward_df = df[df['join_reward'] > 0]
-        if not reward_df.empty:
-            avg_reward = reward_df['join_reward'].mean()
-            max_reward = reward_df['join_reward'].max()
-            report += f"""
+    for category, count in metrics['category_counts'].items():
+        percentage = (count / metrics['total_jobs']) * 100
+        report += f"- **{category}**: {count:,}개 ({percentage:.1f}%)\n"
+    
+    if metrics['reward_job_count']:
+        report += f"""
     ### 지원금 정보
-    - **평균 지원금**: {format_currency(avg_reward)}
-    - **최대 지원금**: {format_currency(max_reward)}
-    - **지원금 제공 공고**: {len(reward_df):,}개 ({len(reward_df)/len(df)*100:.1f}%)
+    - **평균 지원금**: {format_currency(metrics['avg_reward'])}
+    - **최대 지원금**: {format_currency(metrics['max_reward'])}
+    - **지원금 제공 공고**: {metrics['reward_job_count']:,}개 ({metrics['reward_job_percentage']:.1f}%)
     """
     
     return report
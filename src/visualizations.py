@@ -9,10 +9,15 @@ from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 
+from src.aggregations import box_traces, histogram_trace
+from src.figure_cache import FigureCache, cached_figure, figure_cache as default_figure_cache
+
 class JobsVisualizer:
     """채용 정보 시각화 클래스"""
     
-    def __init__(self):
+    def __init__(self, figure_cache: FigureCache = default_figure_cache):
+        # 같은 데이터/인자로 다시 요청된 차트는 캐시에서 반환 (None 이면 캐시 미사용)
+        self.figure_cache = figure_cache
         self.color_palette = px.colors.qualitative.Set3
         self.theme_colors = {
             'primary': '#FF6B6B',
@@ -23,6 +28,7 @@ class JobsVisualizer:
             'danger': '#DDA0DD'
         }
     
+    @cached_figure('category_pie_chart')
     def create_category_pie_chart(self, df):
         """직무 카테고리별 파이 차트 생성"""
         category_counts = df['job_category'].value_counts()
@@ -50,6 +56,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('region_bar_chart')
     def create_region_bar_chart(self, df, top_n=10):
         """지역별 수평 막대 차트 생성"""
         region_counts = df['address_region'].value_counts().head(top_n)
@@ -81,6 +88,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('companies_chart')
     def create_companies_chart(self, df, top_n=10):
         """상위 채용 기업 차트 생성"""
         top_companies = df['company_name'].value_counts().head(top_n)
@@ -110,6 +118,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('company_size_chart')
     def create_company_size_chart(self, df):
         """회사 규모별 분포 차트"""
         def categorize_company_size(job_count):
@@ -146,6 +155,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('skills_chart')
     def create_skills_chart(self, df, top_n=20):
         """기술 스택 차트 생성"""
         all_skills = []
@@ -184,6 +194,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('reward_histogram')
     def create_reward_histogram(self, df):
         """지원금 분포 히스토그램"""
         reward_df = df[df['join_reward'] > 0]
@@ -191,27 +202,24 @@ class JobsVisualizer:
         if reward_df.empty:
             return None
         
-        fig = px.histogram(
-            reward_df,
-            x='join_reward',
-            nbins=20,
-            title="지원금 분포",
-            labels={'x': '지원금(원)', 'y': '채용 공고 수'},
-            color_discrete_sequence=[self.theme_colors['primary']]
-        )
-        
-        fig.update_traces(
-            hovertemplate='지원금: %{x:,.0f}원<br>공고 수: %{y}<extra></extra>'
-        )
+        # 원본 행 대신 서버에서 계산한 구간 집계만 전송 (Freedman–Diaconis 구간)
+        fig = go.Figure(histogram_trace(
+            reward_df['join_reward'].to_numpy(),
+            marker_color=self.theme_colors['primary'],
+            hovertemplate='지원금: %{customdata[0]:,.0f}~%{customdata[1]:,.0f}원<br>공고 수: %{y}<extra></extra>'
+        ))
         
         fig.update_layout(
+            title="지원금 분포",
             xaxis_title="지원금(원)",
             yaxis_title="채용 공고 수",
+            bargap=0,
             height=400
         )
         
         return fig
     
+    @cached_figure('status_donut_chart')
     def create_status_donut_chart(self, df):
         """채용 상태별 도넛 차트"""
         status_counts = df['status_name'].value_counts()
@@ -238,6 +246,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('level_distribution')
     def create_level_distribution(self, df):
         """직급별 분포 차트"""
         level_counts = df['job_level'].value_counts()
@@ -262,6 +271,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('multi_category_comparison')
     def create_multi_category_comparison(self, df):
         """카테고리별 다중 비교 차트"""
         # 카테고리별 지역 분포
@@ -282,6 +292,7 @@ class JobsVisualizer:
         
         return fig
     
+    @cached_figure('reward_boxplot')
     def create_reward_boxplot(self, df):
         """카테고리별 지원금 박스플롯"""
         reward_df = df[df['join_reward'] > 0]
@@ -289,26 +300,60 @@ class JobsVisualizer:
         if reward_df.empty:
             return None
         
-        fig = px.box(
-            reward_df,
-            x='job_category',
-            y='join_reward',
-            title="직무 카테고리별 지원금 분포",
-            labels={'x': '직무 카테고리', 'y': '지원금(원)'},
-            color='job_category',
-            color_discrete_sequence=self.color_palette
-        )
+        # 카테고리별 다섯 수치 요약 + 이상치만 전송
+        groups = {category: group.to_numpy() for category, group
+                  in reward_df.groupby('job_category', observed=True)['join_reward']}
+        fig = go.Figure(box_traces(groups, self.color_palette))
         
         fig.update_traces(
-            hovertemplate='<b>%{x}</b><br>지원금: %{y:,.0f}원<extra></extra>'
+            hovertemplate='<b>%{x}</b><br>지원금: %{y:,.0f}원<extra></extra>',
+            selector=dict(type='scatter')
         )
         
         fig.update_layout(
+            title="직무 카테고리별 지원금 분포",
+            xaxis_title="직무 카테고리",
+            yaxis_title="지원금(원)",
             height=400,
             showlegend=False
         )
         
         return fig
 
+    @cached_figure('skill_bundle_chart')
+    def create_skill_bundle_chart(self, bundles, category='*', top_n=15):
+        """함께 요구되는 스킬 조합 차트 (SkillBundleMiner 사전 계산 테이블 사용, 마이닝하지 않음)"""
+        bundles = bundles[bundles['job_category'].astype(str) == category].sort_values('rank').head(top_n)
+
+        if bundles.empty:
+            return None
+
+        title = "함께 요구되는 스킬 조합" if category == '*' else f"{category} - 함께 요구되는 스킬 조합"
+        fig = px.bar(
+            bundles,
+            x='support',
+            y='skills',
+            orientation='h',
+            title=f"{title} TOP {len(bundles)}",
+            labels={'support': '공고 수', 'skills': '스킬 조합', 'lift': 'Lift'},
+            color='lift',
+            color_continuous_scale='purples',
+            text='support',
+            custom_data=['support_ratio', 'lift']
+        )
+
+        fig.update_traces(
+            textposition='outside',
+            hovertemplate='<b>%{y}</b><br>공고 수: %{x}<br>지지도: %{customdata[0]:.1%}'
+                          '<br>Lift: %{customdata[1]:.2f}<extra></extra>'
+        )
+
+        fig.update_layout(
+            yaxis={'categoryorder': 'array', 'categoryarray': bundles['skills'].tolist()[::-1]},
+            height=max(300, 32 * len(bundles) + 120)
+        )
+
+        return fig
+
 # 전역 시각화 인스턴스
 visualizer = JobsVisualizer()
@@ -0,0 +1,54 @@
+"""
+테스트 공용 픽스처
+작은 인메모리 공고/프로필 프레임 (CSV 나 사전 계산 저장소 없이 실행)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+SKILL_POOL = ['Python', 'Java', 'JavaScript', 'React', 'Vue.js', 'Node.js', 'AWS', 'Docker', 'Kubernetes',
+              'SQL', 'Spring', 'Figma', 'Photoshop', 'Google Analytics', 'Git', 'TypeScript']
+CATEGORIES = ['DEVELOPER', 'DESIGN', 'MARKETING', 'MANAGEMENT']
+REGIONS = ['SEOUL', 'GANGNAM', 'PANGYO', 'BUSAN']
+LEVELS = ['JUNIOR', 'SENIOR', 'IRRELEVANT', 'INTERN']
+
+
+def make_postings(n: int = 60, seed: int = 0, id_offset: int = 1) -> pd.DataFrame:
+    """공고 프레임 (스킬 2~5개, 카테고리/지역/직급은 무작위, id 는 연속 정수)"""
+    rng = np.random.default_rng(seed)
+    skills = [', '.join(rng.choice(SKILL_POOL, size=rng.integers(2, 6), replace=False)) for _ in range(n)]
+    return pd.DataFrame({
+        'id': np.arange(id_offset, id_offset + n),
+        'title': [f"공고 {i}" for i in range(n)],
+        'company_name': [f"회사 {i % 12}" for i in range(n)],
+        'job_category': rng.choice(CATEGORIES, size=n),
+        'address_region': rng.choice(REGIONS, size=n),
+        'job_level': rng.choice(LEVELS, size=n),
+        'job_levels': rng.choice(LEVELS, size=n),
+        'job_skill_keywords': skills,
+        'join_reward': rng.choice([0, 100, 300000, 500000], size=n),
+    })
+
+
+@pytest.fixture
+def postings() -> pd.DataFrame:
+    return make_postings()
+
+
+@pytest.fixture
+def profiles():
+    return [
+        {'user_id': 'u1', 'skills': ['python', 'aws', 'docker'], 'recent_courses': 2, 'project_count': 3,
+         'github_contributions': 40},
+        {'user_id': 'u2', 'skills': ['figma', 'photoshop'], 'recent_courses': 0, 'project_count': 1,
+         'github_contributions': 0},
+        {'user_id': 'u3', 'skills': ['javascript', 'react', 'typescript', 'git'], 'recent_courses': 5,
+         'project_count': 6, 'github_contributions': 200},
+        {'user_id': 'u4', 'skills': [], 'recent_courses': 1, 'project_count': 0, 'github_contributions': 0},
+    ]
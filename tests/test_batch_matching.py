@@ -0,0 +1,51 @@
+"""일괄 매칭 테스트 - 희소 행렬 곱 점수가 프로필별 단건 계산과 같은지 확인"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.batch_matching import BatchMatcher, load_profiles
+from src.matching_engine import AdvancedMatchingEngine
+
+
+@pytest.fixture
+def engine():
+    return AdvancedMatchingEngine()
+
+
+@pytest.fixture
+def matcher(postings, engine):
+    postings = postings.copy()
+    postings.loc[0, 'job_skill_keywords'] = None  # 요구 스킬 없는 공고
+    return BatchMatcher(postings, engine)
+
+
+def test_skill_scores_match_single_profile_scores(matcher, engine, profiles):
+    scores = matcher.skill_scores(profiles)
+    assert scores.shape == (len(profiles), len(matcher.postings))
+    for profile, row in zip(profiles, scores):
+        expected = engine.skill_match_scores(profile['skills'], matcher.postings['job_skill_keywords'],
+                                             matcher.postings['job_category'])
+        np.testing.assert_allclose(row, expected, atol=1e-9)
+
+
+def test_growth_scores_match_single_profile_analysis(matcher, engine, profiles):
+    expected = [engine.analyze_advanced_growth_potential(profile)[0] for profile in profiles]
+    np.testing.assert_allclose(matcher.growth_scores(profiles), expected)
+
+
+def test_chunked_recommendations_equal_single_pass(matcher, profiles):
+    expected = matcher.recommend(profiles, k=5, min_score=0)
+    chunked = pd.concat(list(matcher.iter_recommendations(profiles, k=5, min_score=0, chunk_size=1)),
+                        ignore_index=True)
+    pd.testing.assert_frame_equal(chunked, expected)
+    assert (expected.groupby('user_id')['rank'].max() <= 5).all()
+
+
+def test_load_profiles_jsonl(tmp_path):
+    path = tmp_path / 'profiles.jsonl'
+    path.write_text('{"user_id": "a", "skills": "Python, vuejs"}\n{"user_id": "b", "skills": ["Figma"]}\n',
+                    encoding='utf-8')
+    profiles = load_profiles(path)
+    assert [profile['user_id'] for profile in profiles] == ['a', 'b']
+    assert sorted(profiles[0]['skills']) == ['python', 'vue.js']
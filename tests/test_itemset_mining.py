@@ -0,0 +1,58 @@
+"""스킬 조합 마이닝 테스트 - FP-growth 결과가 전수 조합 세기와 같은지, 증분 마이닝이 전체 마이닝과 같은지 확인"""
+
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.itemset_mining import SkillBundleMiner, fp_growth
+from src.precomputed import PrecomputedStore
+
+from conftest import make_postings
+
+
+def brute_force(transactions, min_count, max_len):
+    """모든 트랜잭션의 길이 max_len 이하 부분집합을 직접 세기"""
+    counts = Counter()
+    for items in transactions:
+        items = sorted(items.tolist())
+        for size in range(1, min(max_len, len(items)) + 1):
+            counts.update(combinations(items, size))
+    return {itemset: count for itemset, count in counts.items() if count >= min_count}
+
+
+def random_transactions(seed, n=120, n_items=12):
+    rng = np.random.default_rng(seed)
+    # 항목별 등장 확률을 다르게 해 지지도 동점과 긴 조합이 모두 생기도록
+    probabilities = rng.uniform(0.05, 0.6, size=n_items)
+    return [np.flatnonzero(rng.random(n_items) < probabilities) for _ in range(n)]
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+@pytest.mark.parametrize('min_count,max_len', [(1, 3), (5, 4), (20, 5)])
+def test_fp_growth_matches_brute_force(seed, min_count, max_len):
+    transactions = random_transactions(seed)
+    assert fp_growth(transactions, min_count, max_len) == brute_force(transactions, min_count, max_len)
+
+
+def test_fp_growth_ignores_empty_transactions():
+    transactions = [np.array([], dtype=np.int64), np.array([1, 2]), np.array([2])]
+    assert fp_growth(transactions, 1) == {(1,): 1, (2,): 2, (1, 2): 1}
+
+
+def test_incremental_update_equals_full_mining(tmp_path):
+    first = make_postings(n=150, seed=4)
+    second = first.copy()
+    changed = second.index[second['job_category'] == second['job_category'].iat[0]][:3]
+    second.loc[changed, 'job_skill_keywords'] = 'Python, AWS, Docker'
+
+    incremental = SkillBundleMiner(PrecomputedStore(tmp_path / 'incremental'))
+    incremental.update(first)
+    summary = incremental.update(second)
+    assert len(summary['mined_categories']) == 2  # 바뀐 카테고리와 전체만
+
+    full = SkillBundleMiner(PrecomputedStore(tmp_path / 'full'))
+    full.update(second)
+    pd.testing.assert_frame_equal(incremental.load_table(), full.load_table(), check_dtype=False)
@@ -0,0 +1,53 @@
+"""순위 모듈 테스트 - argpartition 페이지/커서가 전체 정렬과 같은 순서인지 확인"""
+
+import numpy as np
+import pytest
+
+from src.ranking import ranked_page, top_k
+
+
+def full_order(scores, ids):
+    return np.lexsort((ids, -scores))
+
+
+@pytest.fixture
+def ties():
+    """동점이 많은 점수 (경계 동점 처리 확인용)"""
+    rng = np.random.default_rng(7)
+    scores = rng.integers(0, 8, size=103).astype(np.float64)
+    ids = rng.permutation(1000)[:103]
+    return scores, ids
+
+
+@pytest.mark.parametrize('k', [0, 1, 5, 17, 103, 200])
+def test_top_k_matches_lexsort(ties, k):
+    scores, ids = ties
+    np.testing.assert_array_equal(top_k(scores, ids, k), full_order(scores, ids)[:k])
+
+
+@pytest.mark.parametrize('page_size', [1, 7, 20, 103])
+def test_page_walk_matches_lexsort(ties, page_size):
+    scores, ids = ties
+    pages = []
+    for page in range(1, -(-len(scores) // page_size) + 1):
+        pages.append(ranked_page(scores, ids, page, page_size)['positions'])
+    np.testing.assert_array_equal(np.concatenate(pages), full_order(scores, ids))
+
+
+@pytest.mark.parametrize('page_size', [1, 7, 20, 103])
+def test_cursor_walk_matches_lexsort(ties, page_size):
+    scores, ids = ties
+    result = ranked_page(scores, ids, page_size=page_size)
+    pages = [result['positions']]
+    while result['cursor'] is not None:
+        result = ranked_page(scores, ids, page_size=page_size, cursor=result['cursor'])
+        pages.append(result['positions'])
+    np.testing.assert_array_equal(np.concatenate(pages), full_order(scores, ids))
+    assert result['page'] == result['total_pages']
+
+
+def test_page_past_end_is_empty(ties):
+    scores, ids = ties
+    result = ranked_page(scores, ids, page=50, page_size=20)
+    assert result['positions'].size == 0
+    assert result['cursor'] is None
@@ -0,0 +1,35 @@
+"""샤드 매칭 테스트 - 샤드별 상위 k 병합 결과가 단일 프로세스 일괄 매칭과 같은지 확인"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.batch_matching import BatchMatcher
+from src.sharded_matching import ShardedMatcher, assign_shards
+
+from conftest import make_postings
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    return make_postings(n=240, seed=3)
+
+
+@pytest.mark.parametrize('n_shards', [1, 3])
+def test_sharded_recommend_equals_batch(corpus, profiles, n_shards):
+    expected = BatchMatcher(corpus).recommend(profiles, k=7, min_score=0)
+    with ShardedMatcher(corpus, n_shards) as matcher:
+        result = matcher.recommend(profiles, k=7, min_score=0)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_assign_shards_keeps_partitions_together(corpus):
+    categories = corpus['job_category'].to_numpy()
+    ids = corpus['id'].to_numpy()
+    shard_of = assign_shards(categories, ids, 3)
+    assert set(shard_of) <= {0, 1, 2}
+    # 같은 입력이면 항상 같은 배치
+    np.testing.assert_array_equal(shard_of, assign_shards(categories, ids, 3))
+    # 샤드 크기가 크게 치우치지 않음
+    sizes = np.bincount(shard_of, minlength=3)
+    assert sizes.max() <= 2 * sizes.min()
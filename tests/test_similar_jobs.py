@@ -0,0 +1,64 @@
+"""비슷한 공고 테이블 테스트 - 증분 갱신 결과가 전체 재계산과 같은지 확인"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.precomputed import PrecomputedStore
+from src.similar_jobs import SimilarJobsTable
+
+from conftest import make_postings
+
+
+def next_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """스킬 변경 3건, 삭제 2건, 추가 2건"""
+    df = df.copy()
+    df.loc[[3, 10, 25], 'job_skill_keywords'] = ['Figma, Photoshop', 'Python, AWS, Docker', 'SQL']
+    df = df.drop(index=[5, 40])
+    added = make_postings(n=2, seed=9, id_offset=1000)
+    return pd.concat([df, added], ignore_index=True)
+
+
+@pytest.fixture
+def snapshots():
+    first = make_postings(n=80, seed=1)
+    return first, next_snapshot(first)
+
+
+def test_incremental_update_equals_full_rebuild(tmp_path, snapshots):
+    first, second = snapshots
+    incremental = SimilarJobsTable(PrecomputedStore(tmp_path / 'incremental'), k=5, rebuild_ratio=0.9)
+    incremental.update(first)
+    summary = incremental.update(second)
+    assert summary['recomputed'] < len(second)  # 증분 경로를 탔는지
+
+    full = SimilarJobsTable(PrecomputedStore(tmp_path / 'full'), k=5)
+    full.update(second)
+
+    incremental_arrays = incremental.store.load_arrays(SimilarJobsTable.NAME)
+    full_arrays = full.store.load_arrays(SimilarJobsTable.NAME)
+    np.testing.assert_array_equal(incremental_arrays['ids'], full_arrays['ids'])
+    np.testing.assert_array_equal(incremental_arrays['neighbors'], full_arrays['neighbors'])
+    np.testing.assert_allclose(incremental_arrays['scores'], full_arrays['scores'], atol=1e-6)
+
+
+def test_is_current_follows_source_postings(tmp_path, snapshots):
+    first, second = snapshots
+    table = SimilarJobsTable(PrecomputedStore(tmp_path), k=5)
+    assert not table.is_current(first)
+    table.update(first)
+    assert table.is_current(first)
+    # 테이블이 읽지 않는 컬럼(엔리치먼트)만 다르면 같은 버전
+    assert table.is_current(first.assign(experience_years=np.arange(len(first))))
+    assert not table.is_current(second)
+
+
+def test_similar_postings_excludes_self(tmp_path, snapshots):
+    first, _ = snapshots
+    table = SimilarJobsTable(PrecomputedStore(tmp_path), k=5)
+    table.update(first)
+    posting_id = first['id'].iat[0]
+    similar = table.similar_postings(first, posting_id)
+    assert 0 < len(similar) <= 5
+    assert posting_id not in set(similar['id'])
+    assert similar['similarity'].is_monotonic_decreasing
@@ -0,0 +1,83 @@
+"""스킬 그래프 테스트 - 희소 곱 유사 스킬 크레딧이 공고별 직접 계산과 같은지, 증분 갱신이 전체 학습과 같은지 확인"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lsh_index import skill_tokens
+from src.matching_engine import AdvancedMatchingEngine
+from src.match_results import MatchResultSet
+from src.precomputed import PrecomputedStore
+from src.skill_canon import skill_canon
+from src.skill_graph import SkillGraphBuilder
+
+from conftest import make_postings
+
+
+@pytest.fixture
+def graph(tmp_path, postings):
+    builder = SkillGraphBuilder(PrecomputedStore(tmp_path), min_count=1)
+    builder.update(postings)
+    return builder.load()
+
+
+def loop_credit(graph, user_skills, requirements):
+    """공고마다 부족 스킬별로 보유 스킬과의 유사도를 더함 (스킬당 최대 1)"""
+    owned = set(skill_canon.names_of(skill_canon.ids(user_skills)))
+    credits = []
+    for text in requirements:
+        total = 0.0
+        for skill in skill_tokens(text):
+            if skill in owned or skill not in graph.index:
+                continue
+            weights = [graph.adjacency[graph.index[have], graph.index[skill]] for have in owned if have in graph.index]
+            total += min(sum(weights), 1)
+        credits.append(total)
+    return np.array(credits)
+
+
+@pytest.mark.parametrize('user_skills', [[], ['python'], ['python', 'aws', 'docker'], ['figma', 'photoshop'], ['cobol']])
+def test_similar_skill_credit_matches_loop(graph, postings, user_skills):
+    requirements = postings['job_skill_keywords'].tolist() + [None, 'COBOL, Python']
+    credits = graph.similar_skill_credit(user_skills, graph.posting_matrix(requirements))
+    np.testing.assert_allclose(credits, loop_credit(graph, user_skills, requirements), atol=1e-5)
+
+
+def test_engine_credits_follow_graph(graph, postings, profiles):
+    requirements = postings['job_skill_keywords']
+    assert AdvancedMatchingEngine().similar_skill_credits(['python'], requirements) is None
+
+    engine = AdvancedMatchingEngine(graph)
+    results = MatchResultSet.score(postings, profiles[0]['skills'], 50, engine, min_score=0)
+    positions = np.arange(len(results))
+    credits = results.similar_credits(positions)
+    expected = loop_credit(graph, profiles[0]['skills'], requirements.to_numpy()[results.row_positions])
+    np.testing.assert_allclose(credits, expected, atol=1e-5)
+    assert (credits > 0).any()
+    # 크레딧은 설명용이라 매칭 점수는 그래프 유무와 무관
+    np.testing.assert_allclose(results.skill_scores,
+                               MatchResultSet.score(postings, profiles[0]['skills'], 50,
+                                                    AdvancedMatchingEngine(), min_score=0).skill_scores)
+
+
+def test_incremental_update_equals_full_build(tmp_path):
+    first = make_postings(n=120, seed=5)
+    second = first.drop(index=[2, 30]).copy()
+    second.loc[[7, 8], 'job_skill_keywords'] = ['Kotlin, Spring', 'React, TypeScript']
+    second = pd.concat([second, make_postings(n=3, seed=6, id_offset=500)], ignore_index=True)
+
+    incremental = SkillGraphBuilder(PrecomputedStore(tmp_path / 'incremental'), min_count=1)
+    incremental.update(first)
+    summary = incremental.update(second)
+    assert summary['added_or_changed'] == 5
+
+    full = SkillGraphBuilder(PrecomputedStore(tmp_path / 'full'), min_count=1)
+    full.update(second)
+
+    incremental_graph, full_graph = incremental.load(), full.load()
+    assert incremental_graph.adjacency.nnz == full_graph.adjacency.nnz
+    for skill in full_graph.vocabulary:
+        expected = full_graph.neighbors(skill)
+        neighbors = incremental_graph.neighbors(skill)
+        assert [name for name, _ in neighbors] == [name for name, _ in expected]
+        np.testing.assert_allclose([w for _, w in neighbors], [w for _, w in expected], atol=1e-6)
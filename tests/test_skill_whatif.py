@@ -0,0 +1,53 @@
+"""스킬 what-if 테스트 - 한 번의 행렬 순회 결과가 후보 스킬별 전체 재채점과 같은지 확인"""
+
+import numpy as np
+import pytest
+
+from src.matching_engine import AdvancedMatchingEngine
+from src.skill_canon import skill_canon
+from src.skill_whatif import SkillWhatIf
+
+
+@pytest.fixture
+def engine():
+    return AdvancedMatchingEngine()
+
+
+def brute_force(engine, postings, user_skills, skill_ids, min_score):
+    """후보 스킬마다 사용자 스킬에 더해 모든 공고를 다시 채점"""
+    requirements, categories = postings['job_skill_keywords'], postings['job_category']
+    base = engine.skill_match_scores(user_skills, requirements, categories)
+    owned = set(skill_canon.ids(user_skills).tolist())
+    effects = {}
+    for skill_id in skill_ids:
+        if skill_id in owned:
+            continue
+        scores = engine.skill_match_scores(user_skills + [skill_canon.names[skill_id]], requirements, categories)
+        unlocked = int(((scores > min_score) & ~(base > min_score)).sum())
+        gain = float((scores - base).sum())
+        if unlocked or gain > 1e-9:
+            effects[skill_id] = (unlocked, gain)
+    return int((base > min_score).sum()), effects
+
+
+@pytest.mark.parametrize('user_skills', [[], ['python', 'aws'], ['figma'], ['javascript', 'react', 'git', 'sql']])
+@pytest.mark.parametrize('min_score', [15, 50])
+def test_evaluate_matches_brute_force(engine, postings, user_skills, min_score):
+    whatif = SkillWhatIf(postings, engine)
+    result = whatif.evaluate(user_skills, min_score)
+    matched, effects = brute_force(engine, postings, user_skills, whatif.skill_ids.tolist(), min_score)
+
+    assert result['matched'] == matched
+    ranking = result['ranking'].set_index('skill_id')
+    assert set(ranking.index) == set(effects)
+    for skill_id, (unlocked, gain) in effects.items():
+        assert ranking.loc[skill_id, 'unlocked'] == unlocked
+        assert ranking.loc[skill_id, 'score_gain'] == pytest.approx(gain, abs=1e-6)
+
+
+def test_ranking_order_and_limit(engine, postings):
+    ranking = SkillWhatIf(postings, engine).evaluate(['python'], 15, k=5)['ranking']
+    assert len(ranking) <= 5
+    keys = list(zip(-ranking['unlocked'], -ranking['score_gain'].round(9), ranking['skill_id']))
+    assert keys == sorted(keys)
+    assert np.all(ranking['skill_id'].to_numpy() != skill_canon.lookup('python'))